@@ -24,6 +24,7 @@ from quackcore.errors.integration import (
     QuackAuthenticationError,
     QuackIntegrationError,
     QuackQuotaExceededError,
+    QuackUnrecoverableError,
 )
 
 __all__ = [
@@ -40,6 +41,7 @@ __all__ = [
     "QuackIntegrationError",
     "QuackApiError",
     "QuackQuotaExceededError",
+    "QuackUnrecoverableError",
     "wrap_io_errors",
     "QuackAuthenticationError",
 ]
@@ -29,6 +29,26 @@ class QuackIntegrationError(QuackError):
         super().__init__(message, context, original_error)
 
 
+class QuackUnrecoverableError(QuackIntegrationError):
+    """Raised when an integration operation fails in a way retrying cannot fix."""
+
+    def __init__(
+        self,
+        message: str,
+        context: dict[str, object] | None = None,
+        original_error: Exception | None = None,
+    ) -> None:
+        """
+        Initialize an unrecoverable integration error.
+
+        Args:
+            message: The error message
+            context: Additional context information (optional)
+            original_error: The original exception that caused this error (optional)
+        """
+        super().__init__(message, context, original_error)
+
+
 class QuackAuthenticationError(QuackIntegrationError):
     """Raised when there's an authentication error with an integration."""
 
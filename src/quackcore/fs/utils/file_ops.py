@@ -109,13 +109,13 @@ def ensure_directory(path: str | Path, exist_ok: bool = True) -> Path:
 
 
 @wrap_io_errors
-def atomic_write(path: str | Path, content: str | bytes) -> Path:
+def atomic_write(path: str | Path, content: str | bytes | bytearray) -> Path:
     """
     Write content to a file atomically using a temporary file.
 
     Args:
         path: Destination path
-        content: Content to write (string or bytes)
+        content: Content to write (string or bytes-like)
 
     Returns:
         Path object for the written file
@@ -135,7 +135,7 @@ def atomic_write(path: str | Path, content: str | bytes) -> Path:
         temp_file = Path(temp_path)
         logger.debug(f"Created temporary file for atomic write: {temp_path}")
 
-        with os.fdopen(fd, "wb" if isinstance(content, bytes) else "w") as f:
+        with os.fdopen(fd, "w" if isinstance(content, str) else "wb") as f:
             f.write(content)
 
         # On Unix-like systems, rename is atomic
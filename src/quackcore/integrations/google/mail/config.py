@@ -9,6 +9,7 @@ settings specific to the Gmail service.
 from pydantic import Field
 
 from quackcore.integrations.google.config import GoogleMailConfig
+from quackcore.integrations.google.mail.utils.cache import DEFAULT_CACHE_TTL
 
 
 class GmailServiceConfig(GoogleMailConfig):
@@ -30,3 +31,9 @@ class GmailServiceConfig(GoogleMailConfig):
     include_sender: bool = Field(
         False, description="Include email sender in downloaded file"
     )
+    cache_path: str | None = Field(
+        None, description="SQLite file caching fetched messages"
+    )
+    cache_ttl: float = Field(
+        DEFAULT_CACHE_TTL, description="Seconds a cached message stays valid"
+    )
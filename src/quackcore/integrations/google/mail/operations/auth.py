@@ -9,13 +9,58 @@ and initializing the service.
 from quackcore.errors import QuackApiError
 from quackcore.integrations.google.mail.protocols import GmailService, GoogleCredentials
 
+# Socket timeout in seconds for Gmail API connections
+DEFAULT_HTTP_TIMEOUT = 30.0
 
-def initialize_gmail_service(credentials: GoogleCredentials) -> GmailService:
+
+def create_authorized_http(
+    credentials: GoogleCredentials, timeout: float = DEFAULT_HTTP_TIMEOUT
+) -> object:
+    """
+    Create an authorized HTTP client for the Gmail API with a custom timeout.
+
+    The client is built like the one googleapiclient would create itself,
+    except for the socket timeout, and the caller keeps a handle on it so its
+    connections can be closed explicitly.
+
+    Args:
+        credentials: Google API credentials.
+        timeout: Socket timeout in seconds.
+
+    Returns:
+        object: An authorized httplib2 client.
+
+    Raises:
+        QuackApiError: If the HTTP client cannot be created.
+    """
+    try:
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.http import build_http
+
+        # build_http also stops httplib2 from following 308 responses
+        http = build_http()
+        http.timeout = timeout
+        return AuthorizedHttp(credentials, http=http)
+    except Exception as http_error:
+        raise QuackApiError(
+            f"Failed to create Gmail HTTP client: {http_error}",
+            service="Gmail",
+            api_method="AuthorizedHttp",
+            original_error=http_error,
+        ) from http_error
+
+
+def initialize_gmail_service(
+    credentials: GoogleCredentials, http: object | None = None
+) -> GmailService:
     """
     Initialize the Gmail API service with provided credentials.
 
     Args:
         credentials: Google API credentials.
+        http: Optional authorized HTTP client (see create_authorized_http)
+            for the service to send its requests through. When given, it
+            already carries the credentials.
 
     Returns:
         GmailService: Initialized Gmail service object.
@@ -26,6 +71,8 @@ def initialize_gmail_service(credentials: GoogleCredentials) -> GmailService:
     try:
         from googleapiclient.discovery import build
 
+        if http is not None:
+            return build("gmail", "v1", http=http)
         return build("gmail", "v1", credentials=credentials)
     except Exception as api_error:
         raise QuackApiError(
@@ -7,22 +7,40 @@ including handling message formats and content extraction.
 """
 
 import base64
+import functools
 import logging
+import random
 import re
 import time
-from collections.abc import Mapping, Sequence
-from datetime import datetime, timedelta
+import warnings
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date, datetime, timedelta
 from typing import Protocol, TypeVar, cast
 
 from googleapiclient.errors import HttpError
 
+from quackcore.errors import QuackApiError
 from quackcore.fs import service as fs
 from quackcore.integrations.core.results import IntegrationResult
 from quackcore.integrations.google.mail.protocols import GmailRequest, GmailService
 from quackcore.integrations.google.mail.utils.api import execute_api_request
+from quackcore.integrations.google.mail.utils.cache import GmailCache
 
 T = TypeVar("T")  # Generic type for result content
 
+# Gmail accepts at most 100 calls in a single batch request
+_MAX_BATCH_SIZE = 100
+
+# Attachments can be up to 25MB and a batch response is read whole, so only
+# fetch a few per batch to bound memory use
+_MAX_ATTACHMENT_BATCH_SIZE = 4
+
+# Base64 characters decoded per step; a multiple of 4 so chunks decode alone
+_DECODE_CHUNK_CHARS = 1024 * 1024
+
+# Runs of characters that are not allowed in generated filenames
+_FILENAME_UNSAFE = re.compile(r"[^a-z0-9]+")
+
 
 class MessagesRequest(GmailRequest, Protocol):
     """Protocol for Gmail messages request object."""
@@ -91,12 +109,27 @@ def build_query(days_back: int = 7, labels: list[str] | None = None) -> str:
     Returns:
         str: Gmail search query string.
     """
-    after_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y/%m/%d")
-    query_parts = []
+    return _build_query_cached(days_back, tuple(labels or ()), datetime.now().date())
+
+
+@functools.lru_cache(maxsize=128)
+def _build_query_cached(days_back: int, labels: tuple[str, ...], today: date) -> str:
+    """
+    Build a Gmail search query for a given day.
+
+    The query only depends on the current date, so it is cached per day and
+    callers never see a stale ``after:`` date.
 
-    if labels:
-        query_parts.extend(f"label:{label}" for label in labels)
+    Args:
+        days_back: Number of days to look back for emails.
+        labels: Gmail labels to filter by.
+        today: The date to count back from.
 
+    Returns:
+        str: Gmail search query string.
+    """
+    after_date = (today - timedelta(days=days_back)).strftime("%Y/%m/%d")
+    query_parts = [f"label:{label}" for label in labels]
     query_parts.append(f"after:{after_date}")
     return " ".join(query_parts)
 
@@ -157,9 +190,10 @@ def download_email(
     include_subject: bool = False,
     include_sender: bool = False,
     max_retries: int = 5,
-    initial_delay: float = 1.0,
-    max_delay: float = 30.0,
+    initial_delay: float | None = None,
+    max_delay: float | None = None,
     logger: logging.Logger | None = None,
+    cache: GmailCache | None = None,
 ) -> IntegrationResult[str]:
     """
     Download a Gmail message and save it as an HTML file.
@@ -172,88 +206,397 @@ def download_email(
         include_subject: Whether to include the email subject in the output.
         include_sender: Whether to include the sender in the output.
         max_retries: Maximum number of retries for API calls.
-        initial_delay: Initial delay in seconds before the first retry.
-        max_delay: Maximum delay in seconds before any retry.
+        initial_delay: Deprecated and ignored; the API client picks its own
+            backoff between retries.
+        max_delay: Deprecated and ignored, as above.
         logger: Optional logger instance.
+        cache: Optional cache of previously fetched messages.
 
     Returns:
         IntegrationResult containing the path to the saved email file.
     """
+    if initial_delay is not None or max_delay is not None:
+        warnings.warn(
+            "download_email ignores initial_delay and max_delay, "
+            "which will be removed in a future release",
+            DeprecationWarning,
+            stacklevel=2,
+        )
     logger = logger or logging.getLogger(__name__)
 
     try:
         # Get message with retry logic
         message = _get_message_with_retry(
+            gmail_service, user_id, msg_id, max_retries, logger, cache=cache
+        )
+
+        return _save_message(
             gmail_service,
             user_id,
             msg_id,
+            message,
+            storage_path,
+            include_subject,
+            include_sender,
+            logger,
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to download email {msg_id}: {e}")
+        return IntegrationResult.error_result(f"Failed to download email {msg_id}: {e}")
+
+
+def download_emails_batch(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_ids: Sequence[str],
+    storage_path: str,
+    include_subject: bool = False,
+    include_sender: bool = False,
+    max_retries: int = 5,
+    initial_delay: float = 1.0,
+    max_delay: float = 30.0,
+    logger: logging.Logger | None = None,
+    cache: GmailCache | None = None,
+) -> list[IntegrationResult[str]]:
+    """
+    Download several Gmail messages and save each as an HTML file.
+
+    The messages are fetched with batched API calls (see fetch_messages), so
+    downloading K messages takes about K / 100 round trips instead of K.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_ids: The Gmail message IDs.
+        storage_path: Directory where to save the emails.
+        include_subject: Whether to include the email subject in the output.
+        include_sender: Whether to include the sender in the output.
+        max_retries: Maximum number of retries for API calls.
+        initial_delay: Initial delay in seconds before the first retry.
+        max_delay: Maximum delay in seconds before any retry.
+        logger: Optional logger instance.
+        cache: Optional cache of previously fetched messages.
+
+    Returns:
+        list[IntegrationResult[str]]: One result per distinct message ID, in
+        order.
+    """
+    logger = logger or logging.getLogger(__name__)
+
+    try:
+        messages = fetch_messages(
+            gmail_service,
+            user_id,
+            msg_ids,
             max_retries,
             initial_delay,
             max_delay,
             logger,
+            cache=cache,
         )
-
-        if not message:
-            return IntegrationResult.error_result(
-                f"Message {msg_id} could not be retrieved"
+    except Exception as e:
+        logger.error(f"Failed to fetch emails: {e}")
+        return [
+            IntegrationResult.error_result(f"Failed to download email {msg_id}: {e}")
+            for msg_id in msg_ids
+        ]
+
+    results: list[IntegrationResult[str]] = []
+    # Save each message once, even if its ID was requested more than once
+    for msg_id in dict.fromkeys(msg_ids):
+        try:
+            results.append(
+                _save_message(
+                    gmail_service,
+                    user_id,
+                    msg_id,
+                    messages.get(msg_id),
+                    storage_path,
+                    include_subject,
+                    include_sender,
+                    logger,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to download email {msg_id}: {e}")
+            results.append(
+                IntegrationResult.error_result(
+                    f"Failed to download email {msg_id}: {e}"
+                )
             )
 
-        # Extract headers
-        payload = cast(GmailResponse, message).get("payload", {})
-        headers = cast(GmailResponse, payload).get("headers", [])
-        subject = _extract_header(headers, "subject", "No Subject")
-        sender = _extract_header(headers, "from", "unknown@sender")
+    return results
 
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        clean_sender_name = clean_filename(sender)
-        filename = f"{timestamp}-{clean_sender_name}.html"
 
-        # Use fs service to join paths
-        filepath_obj = fs.join_path(storage_path, filename)
-        filepath = str(
-            filepath_obj
-        )  # Ensure we get a string, not a Path or other object
-
-        # Process message parts
-        html_content, attachments = process_message_parts(
-            gmail_service, user_id, [payload], msg_id, storage_path, logger
+def _save_message(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_id: str,
+    message: Mapping | None,
+    storage_path: str,
+    include_subject: bool,
+    include_sender: bool,
+    logger: logging.Logger,
+) -> IntegrationResult[str]:
+    """
+    Save a retrieved Gmail message as an HTML file.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_id: The Gmail message ID.
+        message: The message data, or None if it could not be retrieved.
+        storage_path: Directory where to save the email.
+        include_subject: Whether to include the email subject in the output.
+        include_sender: Whether to include the sender in the output.
+        logger: Logger instance.
+
+    Returns:
+        IntegrationResult containing the path to the saved email file.
+    """
+    if not message:
+        return IntegrationResult.error_result(
+            f"Message {msg_id} could not be retrieved"
         )
 
-        if not html_content:
-            logger.warning(f"No HTML content found in message {msg_id}")
-            return IntegrationResult.error_result(
-                f"No HTML content found in message {msg_id}"
-            )
+    # Extract headers
+    payload = cast(GmailResponse, message).get("payload", {})
+    header_map = _headers_to_map(cast(GmailResponse, payload).get("headers", []))
+    subject = header_map.get("subject", "No Subject")
+    sender = header_map.get("from", "unknown@sender")
+
+    # Generate filename
+    timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+    clean_sender_name = clean_filename(sender)
+    filename = f"{timestamp}-{clean_sender_name}.html"
+
+    # Use fs service to join paths
+    filepath_obj = fs.join_path(storage_path, filename)
+    filepath = str(filepath_obj)  # Ensure we get a string, not a Path or other object
+
+    # Messages from one sender saved within the same second would share a
+    # filename, so tell them apart by message ID instead of overwriting
+    if fs.get_file_info(filepath).exists:
+        filename = f"{timestamp}-{clean_sender_name}-{clean_filename(msg_id)}.html"
+        filepath = str(fs.join_path(storage_path, filename))
+
+    # Process message parts
+    html_content, attachments = process_message_parts(
+        gmail_service, user_id, [payload], msg_id, storage_path, logger
+    )
+
+    if not html_content:
+        logger.warning(f"No HTML content found in message {msg_id}")
+        return IntegrationResult.error_result(
+            f"No HTML content found in message {msg_id}"
+        )
 
-        # Prepare HTML content with optional headers
+    # Prepare HTML content with optional headers, assembled in one pass
+    subject_html = f"<h1>Subject: {subject}</h1>" if include_subject else ""
+    sender_html = f"<h2>From: {sender}</h2>" if include_sender else ""
+    if subject_html or sender_html:
+        content = f"{subject_html}{sender_html}<hr/>{html_content}"
+    else:
         content = html_content
-        header_parts = []
 
-        if include_subject:
-            header_parts.append(f"<h1>Subject: {subject}</h1>")
-        if include_sender:
-            header_parts.append(f"<h2>From: {sender}</h2>")
+    # Use fs service to write content
+    write_result = fs.write_text(filepath, content, encoding="utf-8")
+    if not write_result.success:
+        logger.error(f"Failed to write email content: {write_result.error}")
+        return IntegrationResult.error_result(
+            f"Failed to write email content: {write_result.error}"
+        )
 
-        if header_parts:
-            content = f"{''.join(header_parts)}<hr/>{content}"
+    return IntegrationResult.success_result(
+        content=filepath,  # Use the string representation of the path
+        message=f"Email downloaded successfully to {filepath}",
+    )
 
-        # Use fs service to write content
-        write_result = fs.write_text(filepath, content, encoding="utf-8")
-        if not write_result.success:
-            logger.error(f"Failed to write email content: {write_result.error}")
-            return IntegrationResult.error_result(
-                f"Failed to write email content: {write_result.error}"
-            )
 
-        return IntegrationResult.success_result(
-            content=filepath,  # Use the string representation of the path
-            message=f"Email downloaded successfully to {filepath}",
+def fetch_messages(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_ids: Sequence[str],
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    logger: logging.Logger,
+    cache: GmailCache | None = None,
+) -> dict[str, Mapping | None]:
+    """
+    Get several Gmail messages with as few API round trips as possible.
+
+    Messages found in the cache are not requested again. When the service
+    supports batch requests, the remaining get calls are sent in batches of
+    up to 100. Messages a round of batches could not return are retried
+    together in the next round after a jittered backoff, so retries of
+    different messages overlap instead of queueing behind each other.
+    Without batch support the messages are fetched one by one.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_ids: The Gmail message IDs.
+        max_retries: Maximum number of attempts per message.
+        initial_delay: Initial delay before first retry.
+        max_delay: Maximum delay between retries.
+        logger: Logger instance.
+        cache: Optional cache of previously fetched messages.
+
+    Returns:
+        dict[str, Mapping | None]: Message data by ID, None for messages
+        that could not be retrieved.
+    """
+    # A batch rejects duplicate request IDs, so fetch each message once
+    unique_ids = list(dict.fromkeys(msg_ids))
+    if cache is None:
+        return _fetch_uncached(
+            gmail_service,
+            user_id,
+            unique_ids,
+            max_retries,
+            initial_delay,
+            max_delay,
+            logger,
         )
 
-    except Exception as e:
-        logger.error(f"Failed to download email {msg_id}: {e}")
-        return IntegrationResult.error_result(f"Failed to download email {msg_id}: {e}")
+    messages: dict[str, Mapping | None] = {}
+    for msg_id in unique_ids:
+        cached = cache.get(user_id, msg_id, "full")
+        if cached is not None:
+            messages[msg_id] = cached
+
+    fetched = _fetch_uncached(
+        gmail_service,
+        user_id,
+        [msg_id for msg_id in unique_ids if msg_id not in messages],
+        max_retries,
+        initial_delay,
+        max_delay,
+        logger,
+    )
+    cache.set_many(
+        user_id,
+        "full",
+        [(msg_id, message) for msg_id, message in fetched.items() if message],
+    )
+    messages.update(fetched)
+    return messages
+
+
+def _fetch_uncached(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_ids: list[str],
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    logger: logging.Logger,
+) -> dict[str, Mapping | None]:
+    """
+    Get distinct Gmail messages from the API.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_ids: The Gmail message IDs, without duplicates.
+        max_retries: Maximum number of attempts per message.
+        initial_delay: Initial delay before first retry.
+        max_delay: Maximum delay between retries.
+        logger: Logger instance.
+
+    Returns:
+        dict[str, Mapping | None]: Message data by ID, None for messages
+        that could not be retrieved.
+    """
+    new_batch = getattr(gmail_service, "new_batch_http_request", None)
+    if new_batch is None:
+        return {
+            msg_id: _get_message_with_retry(
+                gmail_service, user_id, msg_id, max_retries, logger
+            )
+            for msg_id in msg_ids
+        }
+
+    messages: dict[str, Mapping | None] = {}
+
+    def store_response(
+        request_id: str, response: Mapping, exception: Exception | None
+    ) -> None:
+        if exception is None:
+            messages[request_id] = response
+        elif _is_retryable(exception):
+            logger.debug(f"Batched get failed for message {request_id}: {exception}")
+        else:
+            # Retrying cannot fix a deleted or forbidden message
+            logger.error(f"Failed to download message {request_id}: {exception}")
+            messages[request_id] = None
+
+    pending = msg_ids
+    delay = initial_delay
+    for attempt in range(1, max_retries + 1):
+        for start in range(0, len(pending), _MAX_BATCH_SIZE):
+            batch = new_batch(callback=store_response)
+            for msg_id in pending[start : start + _MAX_BATCH_SIZE]:
+                batch.add(
+                    gmail_service.users()
+                    .messages()
+                    .get(user_id=user_id, message_id=msg_id, message_format="full"),
+                    request_id=msg_id,
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.debug(f"Batch request failed: {e}")
+
+        pending = [msg_id for msg_id in pending if msg_id not in messages]
+        if not pending or attempt == max_retries:
+            break
+
+        logger.debug(f"Retry {attempt}/{max_retries} for {len(pending)} messages")
+        time.sleep(_jittered_delay(delay))
+        delay = min(delay * 2, max_delay)
+
+    for msg_id in pending:
+        logger.error(
+            f"Failed to download message {msg_id} after {max_retries} attempts"
+        )
+        messages[msg_id] = None
+
+    return messages
+
+
+def _is_retryable(exception: Exception) -> bool:
+    """
+    Check whether a failed API call is worth retrying.
+
+    Rate limiting, server errors and transport failures are retried, the same
+    as the API client does for single requests; other HTTP errors are final.
+
+    Args:
+        exception: The error the call failed with.
+
+    Returns:
+        bool: True if the call should be retried.
+    """
+    if not isinstance(exception, HttpError):
+        return True
+    status = int(exception.resp.status)
+    return status == 429 or status >= 500
+
+
+def _jittered_delay(delay: float) -> float:
+    """
+    Randomize a backoff delay so concurrent clients don't retry in lockstep.
+
+    Args:
+        delay: The nominal backoff delay.
+
+    Returns:
+        float: A delay between half and all of the nominal delay.
+    """
+    return random.uniform(delay / 2, delay)
 
 
 def _get_message_with_retry(
@@ -261,57 +604,78 @@ def _get_message_with_retry(
     user_id: str,
     msg_id: str,
     max_retries: int,
-    initial_delay: float,
-    max_delay: float,
     logger: logging.Logger,
+    cache: GmailCache | None = None,
 ) -> Mapping | None:
     """
     Get a Gmail message with retry logic.
 
+    Retries happen inside the API client, which retries rate-limited and
+    server-error responses with randomized exponential backoff.
+
     Args:
         gmail_service: Gmail API service object.
         user_id: Gmail user ID.
         msg_id: The Gmail message ID.
-        max_retries: Maximum number of retries.
-        initial_delay: Initial delay before first retry.
-        max_delay: Maximum delay between retries.
+        max_retries: Maximum number of attempts.
         logger: Logger instance.
+        cache: Optional cache of previously fetched messages.
 
     Returns:
         Mapping | None: The message data if successful, None otherwise.
     """
-    retry_count = 0
-    delay = initial_delay
+    if cache is not None:
+        cached = cache.get(user_id, msg_id, "full")
+        if cached is not None:
+            return cached
 
-    while retry_count < max_retries:
-        try:
-            # Use explicit keyword arguments to avoid shadowing builtins
-            result = execute_api_request(
-                gmail_service.users()
-                .messages()
-                .get(user_id=user_id, message_id=msg_id, message_format="full"),
-                "Failed to get message from Gmail",
-                "users.messages.get",
-            )
-            # We need to cast here to satisfy the type checker
-            # The return type is actually a dict
-            return cast(Mapping, result)
-        except HttpError as e:
-            retry_count += 1
-            if retry_count == max_retries:
-                logger.error(
-                    f"Failed to download message {msg_id} after {max_retries} attempts"
-                )
-                return None
+    if max_retries < 1:
+        return None
 
-            logger.debug(
-                f"Retry {retry_count}/{max_retries} for message {msg_id} "
-                f"after error: {e}"
-            )
-            time.sleep(delay)
-            delay = min(delay * 2, max_delay)
+    try:
+        # Use explicit keyword arguments to avoid shadowing builtins
+        result = execute_api_request(
+            gmail_service.users()
+            .messages()
+            .get(user_id=user_id, message_id=msg_id, message_format="full"),
+            "Failed to get message from Gmail",
+            "users.messages.get",
+            num_retries=max_retries - 1,
+        )
+    except QuackApiError as e:
+        # Only give up quietly on HTTP failures; anything else is a bug
+        if not isinstance(e.original_error, HttpError):
+            raise
+        logger.error(
+            f"Failed to download message {msg_id} after {max_retries} attempts: {e}"
+        )
+        return None
+
+    # We need to cast here to satisfy the type checker
+    # The return type is actually a dict
+    message = cast(Mapping, result)
+    if cache is not None:
+        cache.set(user_id, msg_id, "full", message)
+    return message
 
-    return None
+
+def _headers_to_map(headers: Sequence[Mapping]) -> dict[str, str]:
+    """
+    Index a list of headers by lowercase name.
+
+    When a header appears more than once, the first occurrence wins.
+
+    Args:
+        headers: List of header dictionaries.
+
+    Returns:
+        dict[str, str]: Header values keyed by lowercase header name.
+    """
+    header_map: dict[str, str] = {}
+    for header in headers:
+        if "value" in header:
+            header_map.setdefault(header.get("name", "").lower(), header["value"])
+    return header_map
 
 
 def _extract_header(headers: Sequence[Mapping], name: str, default: str) -> str:
@@ -326,10 +690,7 @@ def _extract_header(headers: Sequence[Mapping], name: str, default: str) -> str:
     Returns:
         str: The header value or default.
     """
-    for header in headers:
-        if header.get("name", "").lower() == name.lower():
-            return header.get("value", default)
-    return default
+    return _headers_to_map(headers).get(name.lower(), default)
 
 
 def clean_filename(text: str) -> str:
@@ -342,7 +703,56 @@ def clean_filename(text: str) -> str:
     Returns:
         str: A safe filename string.
     """
-    return re.sub(r"[^a-zA-Z0-9]+", "-", text.lower()).strip("-")
+    return _FILENAME_UNSAFE.sub("-", text.lower()).strip("-")
+
+
+class _CollectedParts:
+    """Content collected while walking the parts of a message."""
+
+    def __init__(self) -> None:
+        self.html_content: str | None = None
+        self.attachment_parts: list[Mapping] = []
+
+
+def _collect_html_part(part: Mapping, collected: _CollectedParts) -> None:
+    """
+    Take the first HTML part with data as the message body.
+
+    Later HTML parts are treated like any other part.
+
+    Args:
+        part: An HTML message part.
+        collected: Content collected so far.
+    """
+    if collected.html_content is not None:
+        _collect_file_part(part, collected)
+        return
+
+    data = part.get("body", {}).get("data")
+    if data is not None:
+        # Ensure data is a string before encoding
+        data_str = str(data)
+        collected.html_content = base64.urlsafe_b64decode(
+            data_str.encode("UTF-8")
+        ).decode("UTF-8")
+
+
+def _collect_file_part(part: Mapping, collected: _CollectedParts) -> None:
+    """
+    Queue a named part for download as an attachment.
+
+    Args:
+        part: A message part.
+        collected: Content collected so far.
+    """
+    if part.get("filename"):
+        collected.attachment_parts.append(part)
+
+
+# Part handlers by MIME type; parts of any other type are attachments
+_MIME_HANDLERS: dict[str, Callable[[Mapping, _CollectedParts], None]] = {
+    "text/html": _collect_html_part,
+}
 
 
 def process_message_parts(
@@ -367,39 +777,145 @@ def process_message_parts(
     Returns:
         tuple: HTML content (or None) and list of attachment paths.
     """
-    html_content = None
-    attachments = []
+    collected = _CollectedParts()
     parts_stack = list(parts)
 
     while parts_stack:
         part = parts_stack.pop()
 
-        # Process nested parts
+        # Process nested (multipart) parts
         if "parts" in part:
             parts_stack.extend(part["parts"])
             continue
 
-        mime_type = part.get("mimeType", "")
+        handler = _MIME_HANDLERS.get(part.get("mimeType", ""), _collect_file_part)
+        handler(part, collected)
 
-        # Extract HTML content
-        if mime_type == "text/html" and html_content is None:
-            data = part.get("body", {}).get("data")
-            if data is not None:
-                # Ensure data is a string before encoding
-                data_str = str(data)
-                html_content = base64.urlsafe_b64decode(
-                    data_str.encode("UTF-8")
-                ).decode("UTF-8")
+    saved = _download_remote_attachments(
+        gmail_service,
+        user_id,
+        msg_id,
+        collected.attachment_parts,
+        storage_path,
+        logger,
+    )
 
-        # Process attachments
-        elif part.get("filename"):
+    attachments = []
+    for index, part in enumerate(collected.attachment_parts):
+        if index in saved:
+            attachment_path = saved[index]
+        else:
             attachment_path = handle_attachment(
                 gmail_service, user_id, part, msg_id, storage_path, logger
             )
-            if attachment_path:
-                attachments.append(attachment_path)
+        if attachment_path:
+            attachments.append(attachment_path)
+
+    return collected.html_content, attachments
+
+
+def _download_remote_attachments(
+    gmail_service: GmailService,
+    user_id: str,
+    msg_id: str,
+    parts: list[Mapping],
+    storage_path: str,
+    logger: logging.Logger,
+) -> dict[int, str | None]:
+    """
+    Fetch and save several remote attachments with batched API calls.
+
+    Attachments whose data is not inline are fetched a few at a time, so
+    their network waits overlap instead of running one after another. Each
+    attachment is saved as soon as its response arrives, so its data is not
+    kept around until the others have been fetched.
+
+    Args:
+        gmail_service: Gmail API service object.
+        user_id: Gmail user ID.
+        msg_id: The Gmail message ID.
+        parts: Attachment parts of the message.
+        storage_path: Path to save the attachments.
+        logger: Logger instance.
+
+    Returns:
+        dict[int, str | None]: Saved path (None if saving failed) by index in
+        parts, for each attachment that was fetched. handle_attachment
+        fetches the others on its own.
+    """
+    remote = [
+        index
+        for index, part in enumerate(parts)
+        if part.get("body", {}).get("data") is None
+        and "attachmentId" in part.get("body", {})
+    ]
+    new_batch = getattr(gmail_service, "new_batch_http_request", None)
+    if len(remote) < 2 or new_batch is None:
+        return {}
+
+    saved: dict[int, str | None] = {}
+
+    def save_response(
+        request_id: str, response: Mapping, exception: Exception | None
+    ) -> None:
+        if exception is None and response.get("data") is not None:
+            part = parts[int(request_id)]
+            saved[int(request_id)] = handle_attachment(
+                gmail_service,
+                user_id,
+                {**part, "body": {**part["body"], "data": response["data"]}},
+                msg_id,
+                storage_path,
+                logger,
+            )
+        else:
+            logger.debug(f"Batched get failed for attachment {request_id}: {exception}")
+
+    for start in range(0, len(remote), _MAX_ATTACHMENT_BATCH_SIZE):
+        batch = new_batch(callback=save_response)
+        for index in remote[start : start + _MAX_ATTACHMENT_BATCH_SIZE]:
+            batch.add(
+                gmail_service.users()
+                .messages()
+                .attachments()
+                .get(
+                    user_id=user_id,
+                    message_id=msg_id,
+                    attachment_id=parts[index]["body"]["attachmentId"],
+                ),
+                request_id=str(index),
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.warning(f"Batch attachment request failed for message {msg_id}: {e}")
+
+    return saved
+
+
+def _decode_attachment_data(data: str) -> bytes | bytearray:
+    """
+    Decode base64url attachment data a chunk at a time.
+
+    Decoding the whole string at once makes two full-size byte copies of it
+    (ASCII encoding and alphabet translation) before decoding; doing it in
+    chunks keeps those copies small, which matters for attachments of up to
+    25MB. The chunked result is returned as the bytearray it was built in
+    rather than copied once more into bytes.
+
+    Args:
+        data: Base64url encoded attachment data.
+
+    Returns:
+        bytes | bytearray: The decoded attachment content.
+    """
+    if len(data) <= _DECODE_CHUNK_CHARS:
+        return base64.urlsafe_b64decode(data)
 
-    return html_content, attachments
+    decoded = bytearray()
+    for start in range(0, len(data), _DECODE_CHUNK_CHARS):
+        decoded += base64.urlsafe_b64decode(data[start : start + _DECODE_CHUNK_CHARS])
+    return decoded
 
 
 def handle_attachment(
@@ -454,7 +970,7 @@ def handle_attachment(
 
         # Decode content
         try:
-            content = base64.urlsafe_b64decode(data_str)
+            content = _decode_attachment_data(data_str)
         except Exception as e:
             logger.error(f"Failed to decode attachment data: {e}")
             return None
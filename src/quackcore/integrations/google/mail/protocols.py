@@ -28,10 +28,13 @@ class GoogleCredentials(Protocol):
 class GmailRequest(Protocol[R]):
     """Protocol for Gmail request objects."""
 
-    def execute(self) -> R:
+    def execute(self, num_retries: int = 0) -> R:
         """
         Execute the request.
 
+        Args:
+            num_retries: Times to retry rate-limited or server-error responses.
+
         Returns:
             R: The API response.
         """
@@ -13,6 +13,7 @@ from quackcore.integrations.google.config import GoogleConfigProvider
 from quackcore.integrations.google.mail.config import GmailServiceConfig
 from quackcore.integrations.google.mail.operations import auth, email
 from quackcore.integrations.google.mail.protocols import GmailService, GoogleCredentials
+from quackcore.integrations.google.mail.utils.cache import DEFAULT_CACHE_TTL, GmailCache
 from quackcore.paths import resolver
 
 
@@ -31,6 +32,8 @@ class GoogleMailService(BaseIntegrationService):
         max_delay: float = 30.0,
         include_subject: bool = False,
         include_sender: bool = False,
+        http_timeout: float = auth.DEFAULT_HTTP_TIMEOUT,
+        cache_path: str | None = None,
         log_level: int = logging.INFO,
     ) -> None:
         """
@@ -47,6 +50,9 @@ class GoogleMailService(BaseIntegrationService):
             max_delay: Maximum delay in seconds before any retry.
             include_subject: Whether to include the email subject in the output HTML.
             include_sender: Whether to include the sender in the output HTML.
+            http_timeout: Socket timeout in seconds for Gmail API connections.
+            cache_path: Path to a SQLite file caching fetched messages. Caching
+                is disabled when not set.
             log_level: Logging level.
         """
         config_provider = GoogleConfigProvider("mail", log_level)
@@ -65,6 +71,7 @@ class GoogleMailService(BaseIntegrationService):
                 "max_delay": max_delay,
                 "include_subject": include_subject,
                 "include_sender": include_sender,
+                "cache_path": cache_path,
             }
 
         self.storage_path: str | None = storage_path
@@ -78,9 +85,13 @@ class GoogleMailService(BaseIntegrationService):
         self.max_delay: float = max_delay
         self.include_subject: bool = include_subject
         self.include_sender: bool = include_sender
+        self.http_timeout: float = http_timeout
+        self.cache_path: str | None = cache_path
 
         self.auth_provider: GoogleAuthProvider | None = None
         self.gmail_service: GmailService | None = None
+        self.http: object | None = None
+        self.cache: GmailCache | None = None
         self.config: dict[str, object] = {}
 
     @property
@@ -128,11 +139,15 @@ class GoogleMailService(BaseIntegrationService):
                 log_level=self.log_level,
             )
 
-            # Authenticate and build the Gmail API service
-            credentials = self.auth_provider.get_credentials()
+            # Authenticate and build the Gmail API service on an HTTP client
+            # we own, so it gets our timeout and close() can release it
+            credentials = cast(GoogleCredentials, self.auth_provider.get_credentials())
+            self.close()
+            self.http = auth.create_authorized_http(credentials, self.http_timeout)
             self.gmail_service = auth.initialize_gmail_service(
-                cast(GoogleCredentials, credentials)
+                credentials, http=self.http
             )
+            self.cache = self._open_cache()
 
             self._initialized = True
             return IntegrationResult.success_result(
@@ -145,6 +160,33 @@ class GoogleMailService(BaseIntegrationService):
                 f"Failed to initialize Google Mail service: {e}"
             )
 
+    def close(self) -> None:
+        """Close the HTTP connections and message cache held by the service."""
+        if self.http is not None:
+            close_http = getattr(self.http, "close", None)
+            if callable(close_http):
+                close_http()
+            self.http = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def _open_cache(self) -> GmailCache | None:
+        """
+        Open the message cache if one is configured.
+
+        Returns:
+            The message cache, or None if caching is disabled.
+        """
+        cache_path_value: object = self.config.get("cache_path", self.cache_path)
+        if not cache_path_value:
+            return None
+
+        cache_path = str(resolver.resolve_project_path(str(cache_path_value)))
+        cache_ttl_value: object = self.config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        cache_ttl = self._safe_cast_float(cache_ttl_value, DEFAULT_CACHE_TTL)
+        return GmailCache(cache_path, cache_ttl)
+
     def _initialize_config(self) -> dict[str, object] | None:
         """
         Initialize configuration from parameters or config file.
@@ -249,41 +291,73 @@ class GoogleMailService(BaseIntegrationService):
             return init_error
 
         try:
-            user_id_value: object = self.config.get("gmail_user_id", "me")
-            user_id: str = str(user_id_value) if user_id_value is not None else "me"
+            # The API client picks its own backoff for single-message retries
+            (
+                user_id,
+                include_subject,
+                include_sender,
+                max_retries,
+                _,
+                _,
+            ) = self._download_settings()
 
-            include_subject_value: object = self.config.get(
-                "include_subject", self.include_subject
-            )
-            include_subject: bool = bool(include_subject_value)
+            if self.gmail_service is None or self.storage_path is None:
+                return IntegrationResult.error_result(
+                    "Gmail service or storage path not initialized"
+                )
 
-            include_sender_value: object = self.config.get(
-                "include_sender", self.include_sender
+            return email.download_email(
+                self.gmail_service,
+                user_id,
+                msg_id,
+                self.storage_path,
+                include_subject,
+                include_sender,
+                max_retries,
+                logger=self.logger,
+                cache=self.cache,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to download email {msg_id}: {e}")
+            return IntegrationResult.error_result(
+                f"Failed to download email {msg_id}: {e}"
             )
-            include_sender: bool = bool(include_sender_value)
 
-            max_retries_value: object = self.config.get("max_retries", self.max_retries)
-            max_retries: int = self._safe_cast_int(max_retries_value, self.max_retries)
+    def download_emails(self, msg_ids: Sequence[str]) -> IntegrationResult[list[str]]:
+        """
+        Download several Gmail messages and save each as an HTML file.
 
-            initial_delay_value: object = self.config.get(
-                "initial_delay", self.initial_delay
-            )
-            initial_delay: float = self._safe_cast_float(
-                initial_delay_value, self.initial_delay
-            )
+        The messages are fetched with batched API calls, which takes far fewer
+        round trips than calling download_email for each message.
 
-            max_delay_value: object = self.config.get("max_delay", self.max_delay)
-            max_delay: float = self._safe_cast_float(max_delay_value, self.max_delay)
+        Args:
+            msg_ids: The Gmail message IDs.
+
+        Returns:
+            IntegrationResult containing the file paths of the downloaded emails.
+        """
+        if init_error := self._ensure_initialized():
+            return init_error
+
+        try:
+            (
+                user_id,
+                include_subject,
+                include_sender,
+                max_retries,
+                initial_delay,
+                max_delay,
+            ) = self._download_settings()
 
             if self.gmail_service is None or self.storage_path is None:
                 return IntegrationResult.error_result(
                     "Gmail service or storage path not initialized"
                 )
 
-            return email.download_email(
+            results = email.download_emails_batch(
                 self.gmail_service,
                 user_id,
-                msg_id,
+                msg_ids,
                 self.storage_path,
                 include_subject,
                 include_sender,
@@ -291,12 +365,68 @@ class GoogleMailService(BaseIntegrationService):
                 initial_delay,
                 max_delay,
                 self.logger,
+                cache=self.cache,
             )
-        except Exception as e:
-            self.logger.error(f"Failed to download email {msg_id}: {e}")
-            return IntegrationResult.error_result(
-                f"Failed to download email {msg_id}: {e}"
+            paths = [
+                result.content
+                for result in results
+                if result.success and result.content is not None
+            ]
+            if results and not paths:
+                return IntegrationResult.error_result(
+                    f"Failed to download any of {len(results)} emails"
+                )
+
+            return IntegrationResult.success_result(
+                content=paths,
+                message=f"Downloaded {len(paths)} of {len(results)} emails",
             )
+        except Exception as e:
+            self.logger.error(f"Failed to download emails: {e}")
+            return IntegrationResult.error_result(f"Failed to download emails: {e}")
+
+    def _download_settings(self) -> tuple[str, bool, bool, int, float, float]:
+        """
+        Read the email download settings from the configuration.
+
+        Returns:
+            Tuple of (user_id, include_subject, include_sender, max_retries,
+            initial_delay, max_delay).
+        """
+        user_id_value: object = self.config.get("gmail_user_id", "me")
+        user_id: str = str(user_id_value) if user_id_value is not None else "me"
+
+        include_subject_value: object = self.config.get(
+            "include_subject", self.include_subject
+        )
+        include_subject: bool = bool(include_subject_value)
+
+        include_sender_value: object = self.config.get(
+            "include_sender", self.include_sender
+        )
+        include_sender: bool = bool(include_sender_value)
+
+        max_retries_value: object = self.config.get("max_retries", self.max_retries)
+        max_retries: int = self._safe_cast_int(max_retries_value, self.max_retries)
+
+        initial_delay_value: object = self.config.get(
+            "initial_delay", self.initial_delay
+        )
+        initial_delay: float = self._safe_cast_float(
+            initial_delay_value, self.initial_delay
+        )
+
+        max_delay_value: object = self.config.get("max_delay", self.max_delay)
+        max_delay: float = self._safe_cast_float(max_delay_value, self.max_delay)
+
+        return (
+            user_id,
+            include_subject,
+            include_sender,
+            max_retries,
+            initial_delay,
+            max_delay,
+        )
 
     def _validate_and_convert_config(self) -> None:
         """
@@ -6,8 +6,9 @@ This package provides reusable utility functions for Gmail operations,
 including API wrappers and error handling.
 """
 
-from quackcore.integrations.google.mail.utils import api
+from quackcore.integrations.google.mail.utils import api, cache
 
 __all__ = [
     "api",
+    "cache",
 ]
@@ -23,10 +23,13 @@ R = TypeVar("R")  # Generic type for request results
 class APIRequest(Protocol[R]):
     """Protocol for Gmail API request objects."""
 
-    def execute(self) -> R:
+    def execute(self, num_retries: int = 0) -> R:
         """
         Execute the request.
 
+        Args:
+            num_retries: Times to retry rate-limited or server-error responses.
+
         Returns:
             R: The API response.
         """
@@ -34,7 +37,10 @@ class APIRequest(Protocol[R]):
 
 
 def execute_api_request(
-    request: GmailRequest[R], error_message: str, api_method: str
+    request: GmailRequest[R],
+    error_message: str,
+    api_method: str,
+    num_retries: int = 0,
 ) -> R:
     """
     Execute a Gmail API request with consistent error handling.
@@ -43,6 +49,8 @@ def execute_api_request(
         request: Gmail API request object.
         error_message: Error message prefix for exceptions.
         api_method: Name of the API method being called.
+        num_retries: Times the client library retries 429 and 5xx responses,
+            with randomized exponential backoff, before raising.
 
     Returns:
         R: API response.
@@ -51,6 +59,8 @@ def execute_api_request(
         QuackApiError: If the API request fails.
     """
     try:
+        if num_retries:
+            return request.execute(num_retries=num_retries)
         return request.execute()
     except HttpError as e:
         raise QuackApiError(
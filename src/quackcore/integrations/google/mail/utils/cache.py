@@ -0,0 +1,163 @@
+# src/quackcore/integrations/google/mail/utils/cache.py
+"""
+Response cache for Google Mail integration.
+
+This module provides a small SQLite-backed cache for Gmail API responses,
+so messages that were already fetched can be read back locally instead of
+making another API round trip.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+
+from quackcore.errors import QuackIntegrationError
+
+# Cached responses older than this many seconds are refetched
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
+class GmailCache:
+    """SQLite cache of Gmail message responses."""
+
+    def __init__(self, db_path: str, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        """
+        Open (or create) the cache database and drop expired entries.
+
+        Args:
+            db_path: Path to the SQLite database file, or ":memory:".
+            ttl: Time in seconds a cached response stays valid.
+
+        Raises:
+            QuackIntegrationError: If the database cannot be opened.
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL lets readers in other processes keep going while we write
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_fetched_at "
+                "ON responses (fetched_at)"
+            )
+            self._conn.commit()
+            self.prune()
+        except sqlite3.Error as e:
+            raise QuackIntegrationError(
+                f"Failed to open Gmail cache: {e}", {"db_path": db_path}
+            ) from e
+
+    @staticmethod
+    def make_key(user_id: str, msg_id: str, message_format: str) -> str:
+        """
+        Build the cache key for a message request.
+
+        Args:
+            user_id: Gmail user ID.
+            msg_id: The Gmail message ID.
+            message_format: The requested message format.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        return hashlib.blake2b(
+            f"{user_id}|{msg_id}|{message_format}".encode(), digest_size=16
+        ).hexdigest()
+
+    def get(self, user_id: str, msg_id: str, message_format: str) -> Mapping | None:
+        """
+        Look up a cached message.
+
+        Args:
+            user_id: Gmail user ID.
+            msg_id: The Gmail message ID.
+            message_format: The requested message format.
+
+        Returns:
+            Mapping | None: The cached message, or None if missing or expired.
+        """
+        key = self.make_key(user_id, msg_id, message_format)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def set(
+        self, user_id: str, msg_id: str, message_format: str, message: Mapping
+    ) -> None:
+        """
+        Store a message in the cache.
+
+        Args:
+            user_id: Gmail user ID.
+            msg_id: The Gmail message ID.
+            message_format: The requested message format.
+            message: The message data returned by the API.
+        """
+        self.set_many(user_id, message_format, [(msg_id, message)])
+
+    def set_many(
+        self,
+        user_id: str,
+        message_format: str,
+        messages: Iterable[tuple[str, Mapping]],
+    ) -> None:
+        """
+        Store several messages in a single transaction.
+
+        Args:
+            user_id: Gmail user ID.
+            message_format: The requested message format.
+            messages: Pairs of message ID and message data.
+        """
+        fetched_at = int(time.time())
+        rows = [
+            (
+                self.make_key(user_id, msg_id, message_format),
+                json.dumps(message).encode("utf-8"),
+                fetched_at,
+            )
+            for msg_id, message in messages
+        ]
+        if not rows:
+            return
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, body, fetched_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def prune(self) -> int:
+        """
+        Delete expired entries so the database doesn't grow without bound.
+
+        Returns:
+            int: Number of entries deleted.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?",
+                (time.time() - self.ttl,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -52,6 +52,10 @@ class ValidationConfig(BaseModel):
     check_links: bool = Field(
         default=False, description="Whether to check links in the document"
     )
+    always_check_structure: bool = Field(
+        default=False,
+        description="Whether to verify document structure even after size checks fail",
+    )
 
 
 class RetryConfig(BaseModel):
@@ -61,7 +65,13 @@ class RetryConfig(BaseModel):
         default=3, description="Maximum number of conversion retries"
     )
     conversion_retry_delay: float = Field(
-        default=1.0, description="Delay between conversion retries in seconds"
+        default=1.0, description="Base delay between conversion retries in seconds"
+    )
+    max_retry_delay: float = Field(
+        default=30.0, description="Upper bound for a single retry delay in seconds"
+    )
+    retry_jitter: float = Field(
+        default=0.1, description="Maximum random fraction added to each retry delay"
     )
 
 
@@ -99,6 +109,10 @@ class PandocConfig(BaseModel):
         default_factory=list,
         description="Extra arguments for Markdown to DOCX conversion",
     )
+    use_pandoc_server: bool = Field(
+        default=False,
+        description="Whether to convert through a shared long-lived pandoc server",
+    )
     output_dir: Path = Field(
         default=Path("./output"), description="Output directory for converted files"
     )
@@ -15,6 +15,7 @@ from quackcore.integrations.pandoc.operations.html_to_md import (
 )
 from quackcore.integrations.pandoc.operations.md_to_docx import (
     convert_markdown_to_docx,
+    convert_markdown_to_docx_batch,
 )
 from quackcore.integrations.pandoc.operations.md_to_docx import (
     validate_conversion as validate_docx_conversion,
@@ -23,6 +24,7 @@ from quackcore.integrations.pandoc.operations.utils import (
     check_conversion_ratio,
     check_file_size,
     get_file_info,
+    get_retry_delay,
     prepare_pandoc_args,
     track_metrics,
     validate_docx_structure,
@@ -33,12 +35,14 @@ from quackcore.integrations.pandoc.operations.utils import (
 __all__ = [
     "convert_html_to_markdown",
     "convert_markdown_to_docx",
+    "convert_markdown_to_docx_batch",
     "post_process_markdown",
     "validate_html_conversion",
     "validate_docx_conversion",
     "check_conversion_ratio",
     "check_file_size",
     "get_file_info",
+    "get_retry_delay",
     "prepare_pandoc_args",
     "track_metrics",
     "validate_docx_structure",
@@ -11,7 +11,7 @@ import re
 import time
 from pathlib import Path
 
-from quackcore.errors import QuackIntegrationError
+from quackcore.errors import QuackIntegrationError, QuackUnrecoverableError
 from quackcore.fs import service as fs
 from quackcore.integrations.core.results import IntegrationResult
 from quackcore.integrations.pandoc.config import PandocConfig
@@ -19,6 +19,8 @@ from quackcore.integrations.pandoc.models import ConversionDetails, ConversionMe
 from quackcore.integrations.pandoc.operations.utils import (
     check_conversion_ratio,
     check_file_size,
+    get_retry_delay,
+    is_unrecoverable_pandoc_error,
     prepare_pandoc_args,
     track_metrics,
     validate_html_structure,
@@ -127,6 +129,10 @@ def _attempt_conversion(html_path: Path, config: PandocConfig) -> str:
             extra_args=extra_args,
         )
     except Exception as e:
+        if is_unrecoverable_pandoc_error(e):
+            raise QuackUnrecoverableError(
+                f"Pandoc conversion failed: {str(e)}"
+            ) from e
         raise QuackIntegrationError(f"Pandoc conversion failed: {str(e)}") from e
 
     return post_process_markdown(output)
@@ -149,7 +155,7 @@ def _write_and_validate_output(
         input_path: Path to the original HTML file.
         original_size: Size of the original HTML file.
         config: Conversion configuration.
-        attempt_start: Timestamp when the attempt started.
+        attempt_start: time.perf_counter() value taken when the attempt started.
 
     Returns:
         tuple: (conversion_time, output_size, validation_errors)
@@ -170,7 +176,7 @@ def _write_and_validate_output(
             f"Failed to write output file: {write_result.error}"
         )
 
-    conversion_time: float = time.time() - attempt_start
+    conversion_time: float = time.perf_counter() - attempt_start
 
     # Get output file info
     output_info = fs.get_file_info(output_path)
@@ -234,7 +240,7 @@ def convert_html_to_markdown(
 
         max_retries: int = config.retry_mechanism.max_conversion_retries
         for attempt in range(1, max_retries + 1):
-            attempt_start: float = time.time()
+            attempt_start: float = time.perf_counter()
             try:
                 cleaned_markdown: str = _attempt_conversion(html_path, config)
                 conversion_time, output_size, validation_errors = (
@@ -260,7 +266,7 @@ def convert_html_to_markdown(
                             "Conversion validation "
                             "failed after maximum retries: " + error_str
                         )
-                    time.sleep(config.retry_mechanism.conversion_retry_delay)
+                    time.sleep(get_retry_delay(config, attempt))
                     continue
 
                 track_metrics(
@@ -291,11 +297,12 @@ def convert_html_to_markdown(
                 logger.warning(
                     f"HTML to Markdown conversion attempt {attempt} failed: {str(e)}"
                 )
-                if attempt == max_retries:
+                # Retrying cannot fix unrecoverable errors, so fail right away
+                if attempt == max_retries or isinstance(e, QuackUnrecoverableError):
                     metrics.failed_conversions += 1
                     metrics.errors[str(html_path)] = str(e)
                     return IntegrationResult.error_result(error_msg)
-                time.sleep(config.retry_mechanism.conversion_retry_delay)
+                time.sleep(get_retry_delay(config, attempt))
 
         return IntegrationResult.error_result("Conversion failed after maximum retries")
 
@@ -6,18 +6,33 @@ This module provides functions for converting Markdown documents to DOCX
 using pandoc with optimized settings and error handling.
 """
 
+import http.client
+import os
+import threading
 import time
-import importlib
+import zipfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
+from xml.etree import ElementTree
 
-from quackcore.errors import QuackIntegrationError
+from quackcore.errors import QuackIntegrationError, QuackUnrecoverableError
 from quackcore.fs import service as fs
 from quackcore.integrations.core.results import IntegrationResult
-from quackcore.integrations.pandoc.config import PandocConfig
+from quackcore.integrations.pandoc.config import PandocConfig, ValidationConfig
 from quackcore.integrations.pandoc.models import ConversionDetails, ConversionMetrics
+from quackcore.integrations.pandoc.operations.server import (
+    PandocServer,
+    discard_pandoc_server,
+    get_pandoc_server,
+    server_options,
+)
 from quackcore.integrations.pandoc.operations.utils import (
     check_conversion_ratio,
     check_file_size,
+    get_retry_delay,
+    is_unrecoverable_pandoc_error,
     prepare_pandoc_args,
     track_metrics,
     validate_docx_structure,
@@ -26,6 +41,78 @@ from quackcore.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Read size used when checking whether an input file is blank
+_BLANK_CHECK_CHUNK_SIZE = 4096
+
+# Core document properties that may reference the source file, mapped to
+# their elements in the docProps/core.xml part of a DOCX package
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_CP_NS = "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}"
+_METADATA_FIELDS = {
+    "title": f"{_DC_NS}title",
+    "subject": f"{_DC_NS}subject",
+    "comments": f"{_DC_NS}description",
+    "keywords": f"{_CP_NS}keywords",
+}
+
+# Output directories already created by this process, so batches writing into
+# the same folder only ask the file system once per directory
+_ensured_dirs: set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+# Parts every DOCX package must contain
+_REQUIRED_DOCX_PARTS = ("[Content_Types].xml", "word/document.xml")
+
+try:
+    import pypandoc
+except ImportError:
+    pypandoc = None
+
+_Document: Callable[..., Any] | None
+try:
+    from docx import Document as _Document
+except ImportError:
+    _Document = None
+
+
+def _fast_stat(path: Path) -> tuple[bool, int]:
+    """
+    Check whether a file exists and get its size with a single stat call.
+
+    Conversion only needs existence and size on its hot path, so this skips
+    building a full file info result.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        tuple: (exists, size in bytes)
+    """
+    try:
+        return True, os.stat(path).st_size
+    except OSError:
+        return False, 0
+
+
+def _is_blank_file(path: Path) -> bool:
+    """
+    Check whether a file contains only whitespace.
+
+    The file is read in small chunks and the scan stops at the first
+    non-whitespace byte, so memory use stays constant regardless of file size.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        bool: True if the file is empty or contains only whitespace.
+    """
+    with open(path, "rb") as f:
+        while chunk := f.read(_BLANK_CHECK_CHUNK_SIZE):
+            if chunk.strip():
+                return False
+    return True
+
 
 def _validate_markdown_input(markdown_path: Path) -> int:
     """
@@ -38,50 +125,126 @@ def _validate_markdown_input(markdown_path: Path) -> int:
         int: Size of the input Markdown file.
 
     Raises:
-        QuackIntegrationError: If the input file is missing or empty.
+        QuackUnrecoverableError: If the input file is missing or empty.
+        QuackIntegrationError: If the input file cannot be read.
     """
-    file_info = fs.service.get_file_info(markdown_path)
-    if not file_info.success or not file_info.exists:
-        raise QuackIntegrationError(
+    exists, original_size = _fast_stat(markdown_path)
+    if not exists:
+        raise QuackUnrecoverableError(
             f"Input file not found: {markdown_path}",
             {"path": str(markdown_path), "format": "markdown"},
         )
 
-    # Ensure size is an integer
-    try:
-        original_size = int(file_info.size) if file_info.size is not None else 0
-    except (TypeError, ValueError):
-        logger.warning(
-            f"Could not convert file size to integer: {file_info.size}, using default"
-        )
-        original_size = 0
-
     # Validate content to ensure it's not empty
     try:
-        read_result = fs.service.read_text(markdown_path, encoding="utf-8")
-        if not read_result.success:
-            raise QuackIntegrationError(
-                f"Could not read Markdown file: {read_result.error}",
-                {"path": str(markdown_path)},
-            )
-
-        markdown_content = read_result.content
-        if not markdown_content.strip():
-            raise QuackIntegrationError(
-                f"Markdown file is empty: {markdown_path}",
-                {"path": str(markdown_path)},
-            )
+        is_blank = _is_blank_file(markdown_path)
     except Exception as e:
-        if isinstance(e, QuackIntegrationError):
-            raise
         raise QuackIntegrationError(
             f"Could not read Markdown file: {str(e)}",
             {"path": str(markdown_path)},
         ) from e
 
+    if is_blank:
+        raise QuackUnrecoverableError(
+            f"Markdown file is empty: {markdown_path}",
+            {"path": str(markdown_path)},
+        )
+
     return original_size
 
 
+def _convert_with_server(
+        server: PandocServer,
+        markdown_path: Path,
+        output_path: Path,
+        options: dict[str, object],
+) -> bool:
+    """
+    Convert a Markdown file to DOCX through the shared pandoc server.
+
+    Args:
+        server: Running pandoc server.
+        markdown_path: Path to the Markdown file.
+        output_path: Path to save the DOCX file.
+        options: Pandoc server options for the conversion.
+
+    Returns:
+        bool: True if the file was converted, False if the server process
+        has died and the caller should convert with pypandoc instead.
+
+    Raises:
+        QuackUnrecoverableError: If the server rejects the document.
+        QuackIntegrationError: If reading, converting or writing fails.
+    """
+    read_result = fs.read_text(markdown_path, encoding="utf-8")
+    if not read_result.success:
+        raise QuackIntegrationError(
+            f"Could not read Markdown file: {read_result.error}",
+            {"path": str(markdown_path)},
+        )
+
+    try:
+        docx_bytes = server.convert(read_result.content, "markdown", "docx", options)
+    except Exception as e:
+        if isinstance(e, OSError | http.client.HTTPException) and not server.is_alive():
+            # The server process died, so this file goes through pypandoc
+            discard_pandoc_server(server)
+            return False
+        # A rejected document would be rejected again, so don't retry it
+        error_class = (
+            QuackUnrecoverableError
+            if isinstance(e, QuackUnrecoverableError)
+            else QuackIntegrationError
+        )
+        raise error_class(
+            f"Pandoc conversion failed: {str(e)}",
+            {"path": str(markdown_path), "format": "markdown"},
+        ) from e
+
+    write_result = fs.write_binary(output_path, docx_bytes)
+    if not write_result.success:
+        raise QuackIntegrationError(
+            f"Failed to write output file: {write_result.error}",
+            {"path": str(output_path), "format": "docx"},
+        )
+    return True
+
+
+def _ensure_output_dir(directory: Path) -> None:
+    """
+    Create an output directory unless this process already created it.
+
+    Args:
+        directory: Directory that will receive converted files.
+
+    Raises:
+        QuackIntegrationError: If the directory cannot be created.
+    """
+    key = str(directory)
+    with _ensured_dirs_lock:
+        if key in _ensured_dirs:
+            return
+
+        dir_result = fs.create_directory(directory, exist_ok=True)
+        if not dir_result.success:
+            raise QuackIntegrationError(
+                f"Failed to create output directory: {dir_result.error}",
+                {"path": key, "operation": "create_directory"},
+            )
+        _ensured_dirs.add(key)
+
+
+def clear_output_dir_cache() -> None:
+    """
+    Forget which output directories have been created.
+
+    Long-running processes should call this if output directories may be
+    removed between conversions.
+    """
+    with _ensured_dirs_lock:
+        _ensured_dirs.clear()
+
+
 def _convert_markdown_to_docx_once(
         markdown_path: Path, output_path: Path, config: PandocConfig
 ) -> None:
@@ -94,6 +257,8 @@ def _convert_markdown_to_docx_once(
         config: Conversion configuration.
 
     Raises:
+        QuackUnrecoverableError: If pandoc is unavailable or rejects the
+            conversion in a way that retrying cannot fix.
         QuackIntegrationError: If pandoc conversion fails.
     """
     extra_args: list[str] = prepare_pandoc_args(
@@ -101,17 +266,23 @@ def _convert_markdown_to_docx_once(
     )
 
     # Create output directory if it doesn't exist
-    dir_result = fs.create_directory(output_path.parent, exist_ok=True)
-    if not dir_result.success:
-        raise QuackIntegrationError(
-            f"Failed to create output directory: {dir_result.error}",
-            {"path": str(output_path.parent), "operation": "create_directory"},
+    _ensure_output_dir(output_path.parent)
+
+    # Reuse the long-lived pandoc server when every argument maps onto it
+    server = get_pandoc_server() if config.use_pandoc_server else None
+    options = server_options(extra_args) if server is not None else None
+    if server is not None and options is not None:
+        logger.debug(f"Converting {markdown_path} to DOCX via pandoc server")
+        if _convert_with_server(server, markdown_path, output_path, options):
+            return
+
+    if pypandoc is None:
+        raise QuackUnrecoverableError(
+            "pypandoc module is not installed", {"module": "pypandoc"}
         )
 
     logger.debug(f"Converting {markdown_path} to DOCX with args: {extra_args}")
     try:
-        import pypandoc
-
         pypandoc.convert_file(
             str(markdown_path),
             "docx",
@@ -120,19 +291,50 @@ def _convert_markdown_to_docx_once(
             extra_args=extra_args,
         )
     except Exception as e:
-        raise QuackIntegrationError(
+        error_class = (
+            QuackUnrecoverableError
+            if is_unrecoverable_pandoc_error(e)
+            else QuackIntegrationError
+        )
+        raise error_class(
             f"Pandoc conversion failed: {str(e)}",
             {"path": str(markdown_path), "format": "markdown"},
         ) from e
 
 
-def _get_conversion_output(output_path: Path, start_time: float) -> tuple[float, int]:
+def _timed_conversion(
+        markdown_path: Path, output_path: Path, config: PandocConfig
+) -> tuple[float, float]:
+    """
+    Run a single conversion attempt and time it where it runs.
+
+    Taking the timestamps here keeps the time a job spends queued in a
+    conversion executor out of the reported conversion time.
+
+    Args:
+        markdown_path: Path to the Markdown file.
+        output_path: Path to save the DOCX file.
+        config: Conversion configuration.
+
+    Returns:
+        tuple: time.perf_counter() values taken when pandoc started and finished.
+    """
+    start_time: float = time.perf_counter()
+    _convert_markdown_to_docx_once(markdown_path, output_path, config)
+    return start_time, time.perf_counter()
+
+
+def _get_conversion_output(
+        output_path: Path, start_time: float, end_time: float | None = None
+) -> tuple[float, int]:
     """
     Retrieve conversion timing and output file size.
 
     Args:
         output_path: Path to the output DOCX file.
-        start_time: Timestamp when conversion attempt started.
+        start_time: time.perf_counter() value taken when the attempt started.
+        end_time: time.perf_counter() value taken when the attempt finished
+            (default: now).
 
     Returns:
         tuple: (conversion_time, output_size)
@@ -140,23 +342,16 @@ def _get_conversion_output(output_path: Path, start_time: float) -> tuple[float,
     Raises:
         QuackIntegrationError: If output file info cannot be retrieved.
     """
-    conversion_time: float = time.time() - start_time
-    output_info = fs.service.get_file_info(output_path)
-    if not output_info.success:
+    if end_time is None:
+        end_time = time.perf_counter()
+    conversion_time: float = end_time - start_time
+    exists, output_size = _fast_stat(output_path)
+    if not exists:
         raise QuackIntegrationError(
             f"Failed to get info for converted file: {output_path}",
             {"path": str(output_path), "format": "docx"},
         )
 
-    # Ensure output_size is an integer
-    try:
-        output_size = int(output_info.size) if output_info.size is not None else 0
-    except (TypeError, ValueError):
-        logger.warning(
-            f"Could not convert output size to integer: {output_info.size}, using default"
-        )
-        output_size = 0
-
     return conversion_time, output_size
 
 
@@ -165,6 +360,7 @@ def convert_markdown_to_docx(
         output_path: Path,
         config: PandocConfig,
         metrics: ConversionMetrics | None = None,
+        conversion_executor: Executor | None = None,
 ) -> IntegrationResult[tuple[Path, ConversionDetails]]:
     """
     Convert a Markdown file to DOCX.
@@ -174,6 +370,9 @@ def convert_markdown_to_docx(
         output_path: Path to save the DOCX file.
         config: Conversion configuration.
         metrics: Optional metrics tracker.
+        conversion_executor: Optional executor that runs the pandoc step.
+            Validation still runs in the calling thread, so other files can
+            be converted while this one is being validated.
 
     Returns:
         IntegrationResult[tuple[Path, ConversionDetails]]: Result of the conversion.
@@ -189,18 +388,43 @@ def convert_markdown_to_docx(
         retry_count: int = 0
 
         while retry_count < max_retries:
-            start_time: float = time.time()
             try:
-                _convert_markdown_to_docx_once(markdown_path, output_path, config)
+                if conversion_executor is not None:
+                    start_time, end_time = conversion_executor.submit(
+                        _timed_conversion, markdown_path, output_path, config
+                    ).result()
+                else:
+                    start_time, end_time = _timed_conversion(
+                        markdown_path, output_path, config
+                    )
                 conversion_time, output_size = _get_conversion_output(
-                    output_path, start_time
+                    output_path, start_time, end_time
                 )
 
+                # Pandoc output size is deterministic for a given input, so a
+                # size failure would only repeat on every retry
+                size_errors = _check_output_size(
+                    output_size, original_size, config.validation
+                )
+                if size_errors:
+                    error_str = "; ".join(size_errors)
+                    logger.error(f"Conversion validation failed: {error_str}")
+                    metrics.failed_conversions += 1
+                    metrics.errors[str(markdown_path)] = error_str
+                    return IntegrationResult.error_result(
+                        f"Conversion failed: {error_str}"
+                    )
+
                 validation_errors: list[str] = validate_conversion(
-                    output_path, markdown_path, original_size, config
+                    output_path,
+                    markdown_path,
+                    original_size,
+                    config,
+                    output_size=output_size,
+                    check_size=False,
                 )
                 if validation_errors:
-                    error_str: str = "; ".join(validation_errors)
+                    error_str = "; ".join(validation_errors)
                     logger.error(f"Conversion validation failed: {error_str}")
 
                     retry_count += 1
@@ -215,16 +439,23 @@ def convert_markdown_to_docx(
                     logger.warning(
                         f"Markdown to DOCX conversion attempt {retry_count} failed: {error_str}"
                     )
-                    time.sleep(config.retry_mechanism.conversion_retry_delay)
+                    time.sleep(get_retry_delay(config, retry_count))
                     continue
 
                 track_metrics(
-                    filename, start_time, original_size, output_size, metrics, config
+                    filename,
+                    start_time,
+                    original_size,
+                    output_size,
+                    metrics,
+                    config,
+                    end_time=end_time,
                 )
                 metrics.successful_conversions += 1
 
-                # Create conversion details
-                details = ConversionDetails(
+                # Every field is already a checked int, float or literal, so
+                # skip pydantic validation when building the details
+                details = ConversionDetails.model_construct(
                     source_format="markdown",
                     target_format="docx",
                     conversion_time=conversion_time,
@@ -237,6 +468,13 @@ def convert_markdown_to_docx(
                     message=f"Successfully converted {markdown_path} to DOCX",
                 )
 
+            except QuackUnrecoverableError as e:
+                # Retrying cannot fix this, so fail without sleeping
+                logger.error(f"Markdown to DOCX conversion failed: {str(e)}")
+                metrics.failed_conversions += 1
+                metrics.errors[str(markdown_path)] = str(e)
+                return IntegrationResult.error_result(f"Integration error: {str(e)}")
+
             except Exception as e:
                 retry_count += 1
                 logger.warning(
@@ -253,7 +491,7 @@ def convert_markdown_to_docx(
                         error_msg = f"Failed to convert Markdown to DOCX: {str(e)}"
 
                     return IntegrationResult.error_result(error_msg)
-                time.sleep(config.retry_mechanism.conversion_retry_delay)
+                time.sleep(get_retry_delay(config, retry_count))
 
         return IntegrationResult.error_result("Conversion failed after maximum retries")
 
@@ -264,8 +502,148 @@ def convert_markdown_to_docx(
             f"Failed to convert Markdown to DOCX: {str(e)}")
 
 
+def _convert_task(
+        markdown_path: Path,
+        output_path: Path,
+        config: PandocConfig,
+        conversion_executor: Executor,
+) -> tuple[IntegrationResult[tuple[Path, ConversionDetails]], ConversionMetrics]:
+    """
+    Convert one file of a parallel batch into a task-local metrics tracker.
+
+    Args:
+        markdown_path: Path to the Markdown file.
+        output_path: Path to save the DOCX file.
+        config: Conversion configuration.
+        conversion_executor: Executor that runs the pandoc step.
+
+    Returns:
+        tuple: (conversion result, metrics recorded by this task only)
+    """
+    outcome = ConversionMetrics()
+    result = convert_markdown_to_docx(
+        markdown_path, output_path, config, outcome, conversion_executor
+    )
+    return result, outcome
+
+
+def _merge_metrics(target: ConversionMetrics, source: ConversionMetrics) -> None:
+    """
+    Merge the metrics collected by one conversion task into a shared tracker.
+
+    Must only be called from the thread that owns the target tracker.
+
+    Args:
+        target: Metrics tracker to update.
+        source: Metrics collected by a single task.
+    """
+    target.conversion_times.update(source.conversion_times)
+    target.file_sizes.update(source.file_sizes)
+    target.errors.update(source.errors)
+    target.total_attempts += source.total_attempts
+    target.successful_conversions += source.successful_conversions
+    target.failed_conversions += source.failed_conversions
+
+
+def convert_markdown_to_docx_batch(
+        jobs: Sequence[tuple[Path, Path]],
+        config: PandocConfig,
+        metrics: ConversionMetrics | None = None,
+        max_workers: int = 1,
+) -> list[IntegrationResult[tuple[Path, ConversionDetails]]]:
+    """
+    Convert several Markdown files to DOCX in one call.
+
+    All jobs share one metrics tracker and the module-level pypandoc import,
+    so the per-file cost is the pandoc run itself. With max_workers > 1 the
+    batch runs as a two-stage pipeline: up to max_workers pandoc runs, which
+    are subprocess bound, execute on a conversion pool while per-file tasks
+    on a second pool validate finished outputs. Pandoc therefore keeps
+    working on the next files while earlier ones are being validated.
+
+    Worker threads never touch the shared metrics tracker. Each task records
+    into a ConversionMetrics it creates and returns alongside its result, and
+    the calling thread merges those as tasks complete, so the shared tracker
+    is only ever mutated by one thread and needs no lock.
+
+    Args:
+        jobs: Sequence of (markdown_path, output_path) pairs.
+        config: Conversion configuration.
+        metrics: Optional metrics tracker shared by all jobs.
+        max_workers: Maximum number of concurrent conversions.
+
+    Returns:
+        list[IntegrationResult[tuple[Path, ConversionDetails]]]: One result per
+        job, in the same order as the jobs.
+    """
+    if metrics is None:
+        metrics = ConversionMetrics()
+
+    if max_workers <= 1 or len(jobs) <= 1:
+        return [
+            convert_markdown_to_docx(markdown_path, output_path, config, metrics)
+            for markdown_path, output_path in jobs
+        ]
+
+    results: dict[int, IntegrationResult[tuple[Path, ConversionDetails]]] = {}
+    conversion_workers = min(max_workers, len(jobs))
+
+    # Tasks spend most of their time waiting on the conversion pool, so give
+    # each conversion slot a second task that can validate in the meantime.
+    with (
+        ThreadPoolExecutor(max_workers=conversion_workers) as conversion_pool,
+        ThreadPoolExecutor(max_workers=2 * conversion_workers) as task_pool,
+    ):
+        futures = {
+            task_pool.submit(
+                _convert_task, markdown_path, output_path, config, conversion_pool
+            ): index
+            for index, (markdown_path, output_path) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            result, outcome = future.result()
+            results[futures[future]] = result
+            _merge_metrics(metrics, outcome)
+
+    return [results[index] for index in range(len(jobs))]
+
+
+def _check_output_size(
+        output_size: int, original_size: int, validation: ValidationConfig
+) -> list[str]:
+    """
+    Check the converted file size against the validation thresholds.
+
+    Args:
+        output_size: Size of the converted file.
+        original_size: Size of the original file.
+        validation: Validation settings.
+
+    Returns:
+        list[str]: Size related error messages (empty if valid).
+    """
+    errors: list[str] = []
+
+    valid_size, size_errors = check_file_size(output_size, validation.min_file_size)
+    if not valid_size:
+        errors.extend(size_errors)
+
+    valid_ratio, ratio_errors = check_conversion_ratio(
+        output_size, original_size, validation.conversion_ratio_threshold
+    )
+    if not valid_ratio:
+        errors.extend(ratio_errors)
+
+    return errors
+
+
 def validate_conversion(
-        output_path: Path, input_path: Path, original_size: int, config: PandocConfig
+        output_path: Path,
+        input_path: Path,
+        original_size: int,
+        config: PandocConfig,
+        output_size: int | None = None,
+        check_size: bool = True,
 ) -> list[str]:
     """
     Validate the converted DOCX document.
@@ -275,6 +653,10 @@ def validate_conversion(
         input_path: Path to the input Markdown file.
         original_size: Size of the original file.
         config: Conversion configuration.
+        output_size: Size of the output file if the caller already knows it.
+            The output file is only stat'd when this is not given.
+        check_size: Whether to check the file size and conversion ratio.
+            Callers that already ran _check_output_size can skip it.
 
     Returns:
         list[str]: List of validation error messages (empty if valid).
@@ -282,35 +664,33 @@ def validate_conversion(
     validation_errors: list[str] = []
     validation = config.validation
 
-    # Get info about output file
-    output_info = fs.service.get_file_info(output_path)
-    if not output_info.success or not output_info.exists:
-        validation_errors.append(f"Output file does not exist: {output_path}")
-        return validation_errors
+    if output_size is None:
+        exists, output_size = _fast_stat(output_path)
+        if not exists:
+            validation_errors.append(f"Output file does not exist: {output_path}")
+            return validation_errors
 
-    # Ensure output_size is an integer
-    try:
-        output_size = int(output_info.size) if output_info.size is not None else 0
-    except (TypeError, ValueError):
-        logger.warning(
-            f"Could not convert output size to integer: {output_info.size}, using default"
+    # Check file size and conversion ratio
+    if check_size:
+        validation_errors.extend(
+            _check_output_size(output_size, original_size, validation)
         )
-        output_size = 0
 
-    # Check file size
-    valid_size, size_errors = check_file_size(output_size, validation.min_file_size)
-    if not valid_size:
-        validation_errors.extend(size_errors)
-
-    # Check conversion ratio
-    valid_ratio, ratio_errors = check_conversion_ratio(
-        output_size, original_size, validation.conversion_ratio_threshold
+    # Check document structure. A file that already failed the size checks
+    # is rejected anyway, so skip unpacking it unless every error is wanted.
+    # A non-empty size already proves the output exists, so no extra stat is needed.
+    check_structure = (
+        validation.verify_structure
+        and output_size > 0
+        and (not validation_errors or validation.always_check_structure)
     )
-    if not valid_ratio:
-        validation_errors.extend(ratio_errors)
+    if check_structure:
+        # Rule out broken packages from the zip directory before parsing
+        package_errors = _check_docx_package(output_path)
+        if package_errors:
+            validation_errors.extend(package_errors)
+            return validation_errors
 
-    # Check document structure - always proceed with this even if there are other validation errors
-    if validation.verify_structure and output_path.exists():
         is_valid, structure_errors = validate_docx_structure(
             output_path, validation.check_links
         )
@@ -323,56 +703,86 @@ def validate_conversion(
     return validation_errors
 
 
+def _check_docx_package(docx_path: Path) -> list[str]:
+    """
+    Check that a DOCX file is a zip package with the required parts.
+
+    Only the zip central directory and the small content types part are read,
+    so this is cheap compared to loading the document with python-docx.
+
+    Args:
+        docx_path: Path to the DOCX file.
+
+    Returns:
+        list[str]: Package error messages (empty if valid).
+    """
+    try:
+        with zipfile.ZipFile(docx_path) as archive:
+            names = set(archive.namelist())
+            for part in _REQUIRED_DOCX_PARTS:
+                if part not in names:
+                    return [f"DOCX package is missing {part}"]
+            ElementTree.fromstring(archive.read("[Content_Types].xml"))
+    except (OSError, zipfile.BadZipFile, ElementTree.ParseError) as e:
+        return [f"DOCX package is invalid: {str(e)}"]
+
+    return []
+
+
+def _read_core_properties(docx_path: Path) -> list[str | None] | None:
+    """
+    Read the metadata fields from the core properties part of a DOCX file.
+
+    Only the small docProps/core.xml part is read from the zip archive, so
+    the cost does not grow with the size of the document body.
+
+    Args:
+        docx_path: Path to the DOCX file.
+
+    Returns:
+        list[str | None] | None: Values of the metadata fields, or None if the
+        document has no core properties part.
+    """
+    with zipfile.ZipFile(docx_path) as archive:
+        try:
+            core_xml = archive.read("docProps/core.xml")
+        except KeyError:
+            return None
+
+    root = ElementTree.fromstring(core_xml)
+    return [root.findtext(tag) for tag in _METADATA_FIELDS.values()]
+
+
 def _check_docx_metadata(docx_path: Path, source_path: Path, check_links: bool) -> None:
     """
     Check DOCX metadata for references to the source file.
-    This function is separated to handle import errors cleanly.
 
     Args:
         docx_path: Path to the DOCX file.
         source_path: Path to the source file.
         check_links: Whether to check for links/references.
     """
-    try:
-        # Try to import docx at runtime
-        try:
-            docx = importlib.import_module('docx')
-            Document = docx.Document
-        except ImportError:
-            logger.debug("python-docx not available for detailed metadata check")
-            return
+    # The check only ever reports when links are checked, so skip opening the file
+    if not check_links:
+        return
 
-        doc = Document(str(docx_path))
+    try:
         source_filename = source_path.name
-        source_found = False
-
-        # Check if core_properties exists
-        if hasattr(doc, "core_properties"):
-            core_props = doc.core_properties
-
-            # Check title
-            if (hasattr(core_props, "title") and
-                    core_props.title and
-                    source_filename in str(core_props.title)):
-                source_found = True
-
-            # Check comments
-            elif (hasattr(core_props, "comments") and
-                  core_props.comments and
-                  source_filename in str(core_props.comments)):
-                source_found = True
-
-            # Check subject
-            elif (hasattr(core_props, "subject") and
-                  core_props.subject and
-                  source_filename in str(core_props.subject)):
-                source_found = True
-
-        # Log if source reference is missing - note that we're not checking check_links here
-        if not source_found and check_links:
-            # This is the critical line that needs to be reached during testing
+        values = _read_core_properties(docx_path)
+
+        # Fall back to python-docx for packages without a core properties part
+        if values is None:
+            if _Document is None:
+                logger.debug("python-docx not available for detailed metadata check")
+                return
+
+            core_props = getattr(_Document(str(docx_path)), "core_properties", None)
+            values = [getattr(core_props, field, None) for field in _METADATA_FIELDS]
+
+        source_found = any(value and source_filename in str(value) for value in values)
+        if not source_found:
             logger.debug(
                 f"Source file reference missing in document metadata: {source_filename}")
 
     except Exception as e:
-        logger.debug(f"Could not check document metadata: {str(e)}")
\ No newline at end of file
+        logger.debug(f"Could not check document metadata: {str(e)}")
@@ -0,0 +1,321 @@
+# src/quackcore/integrations/pandoc/operations/server.py
+"""
+Long-lived pandoc server for conversion operations.
+
+This module manages a single ``pandoc server`` process per interpreter so that
+repeated conversions don't pay pandoc's startup cost on every call. Requests
+are sent over persistent HTTP connections, one per thread.
+"""
+
+import atexit
+import base64
+import http.client
+import json
+import shutil
+import socket
+import subprocess
+import threading
+import time
+
+from quackcore.errors import QuackIntegrationError, QuackUnrecoverableError
+from quackcore.logging import get_logger
+
+logger = get_logger(__name__)
+
+_HOST = "127.0.0.1"
+_STARTUP_TIMEOUT = 5.0
+_START_ATTEMPTS = 3
+_REQUEST_TIMEOUT = 60.0
+
+# Command-line flags that map onto pandoc server request options. Arguments
+# outside this set (reference docs, resource paths, filters, ...) need file
+# system access the server doesn't have, so those conversions use pypandoc.
+_VALUE_OPTIONS = {"--wrap": "wrap", "--markdown-headings": "markdown-headings"}
+_FLAG_OPTIONS = {
+    "--standalone": "standalone",
+    "--reference-links": "reference-links",
+}
+
+_server: "PandocServer | None" = None
+_server_failed = False
+_server_lock = threading.Lock()
+
+
+def _find_free_port() -> int:
+    """
+    Ask the OS for a free local port.
+
+    Returns:
+        int: Port number that was free at the time of the call
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def server_options(extra_args: list[str]) -> dict[str, object] | None:
+    """
+    Translate pandoc command-line arguments into pandoc server options.
+
+    Args:
+        extra_args: Pandoc command-line arguments
+
+    Returns:
+        dict[str, object] | None: Server options, or None if any argument has
+        no server equivalent
+    """
+    options: dict[str, object] = {}
+    for arg in extra_args:
+        flag, _, value = arg.partition("=")
+        if flag in _VALUE_OPTIONS and value:
+            options[_VALUE_OPTIONS[flag]] = value
+        elif flag in _FLAG_OPTIONS and not value:
+            options[_FLAG_OPTIONS[flag]] = True
+        else:
+            return None
+    return options
+
+
+class PandocServer:
+    """A ``pandoc server`` subprocess listening on a local port."""
+
+    def __init__(self, process: subprocess.Popen, port: int) -> None:
+        """
+        Initialize the server handle.
+
+        Args:
+            process: Running pandoc server process
+            port: Local port the server listens on
+        """
+        self.process = process
+        self.port = port
+        self._local = threading.local()
+
+    @classmethod
+    def start(cls, pandoc_path: str) -> "PandocServer":
+        """
+        Start a pandoc server and wait until it answers requests.
+
+        The free port can be taken by another process before pandoc binds it,
+        so a failed startup is retried on a fresh port.
+
+        Args:
+            pandoc_path: Path to the pandoc executable
+
+        Returns:
+            PandocServer: Handle for the running server
+
+        Raises:
+            QuackIntegrationError: If the server does not come up in time
+        """
+        for _ in range(_START_ATTEMPTS - 1):
+            try:
+                return cls._start_on_free_port(pandoc_path)
+            except QuackIntegrationError as e:
+                logger.debug(f"Pandoc server startup failed, retrying: {e}")
+        return cls._start_on_free_port(pandoc_path)
+
+    @classmethod
+    def _start_on_free_port(cls, pandoc_path: str) -> "PandocServer":
+        """
+        Start a pandoc server on a port that was free a moment ago.
+
+        Args:
+            pandoc_path: Path to the pandoc executable
+
+        Returns:
+            PandocServer: Handle for the running server
+
+        Raises:
+            QuackIntegrationError: If the server exits or does not come up in time
+        """
+        port = _find_free_port()
+        process = subprocess.Popen(
+            [pandoc_path, "server", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        server = cls(process, port)
+
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise QuackIntegrationError(
+                    "Pandoc server exited during startup",
+                    {"returncode": process.returncode},
+                )
+            try:
+                server._request("GET", "/version")
+                return server
+            except (OSError, http.client.HTTPException):
+                time.sleep(0.05)
+
+        server.close()
+        raise QuackIntegrationError(
+            "Pandoc server did not start in time", {"port": port}
+        )
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Get the calling thread's persistent connection to the server."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(
+                _HOST, self.port, timeout=_REQUEST_TIMEOUT
+            )
+            self._local.conn = conn
+        return conn
+
+    def _request(
+            self, method: str, url: str, body: bytes | None = None
+    ) -> tuple[int, bytes]:
+        """
+        Send a request over the thread's keep-alive connection.
+
+        Args:
+            method: HTTP method
+            url: Request path
+            body: Optional JSON request body
+
+        Returns:
+            tuple: (status code, response body)
+        """
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        conn = self._connection()
+        try:
+            conn.request(method, url, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            # Drop the broken connection so the next request reconnects
+            conn.close()
+            self._local.conn = None
+            raise
+
+    def convert(
+            self,
+            text: str,
+            source_format: str,
+            target_format: str,
+            options: dict[str, object],
+    ) -> bytes:
+        """
+        Convert a document through the server.
+
+        Args:
+            text: Source document content
+            source_format: Pandoc input format
+            target_format: Pandoc output format
+            options: Additional pandoc server options
+
+        Returns:
+            bytes: Converted document
+
+        Raises:
+            QuackUnrecoverableError: If the server rejects the conversion,
+                which it would do again for the same document
+        """
+        payload = {"text": text, "from": source_format, "to": target_format, **options}
+        status, body = self._request(
+            "POST", "/", json.dumps(payload).encode("utf-8")
+        )
+        if status != 200:
+            message = body.decode("utf-8", "replace")
+            raise QuackUnrecoverableError(
+                f"Pandoc server conversion failed: {message}",
+                {"status": status, "format": target_format},
+            )
+
+        result = json.loads(body)
+        if result.get("error"):
+            raise QuackUnrecoverableError(
+                f"Pandoc server conversion failed: {result['error']}",
+                {"status": status, "format": target_format},
+            )
+        output = result["output"]
+        if result.get("base64"):
+            return base64.b64decode(output)
+        return output.encode("utf-8")
+
+    def is_alive(self) -> bool:
+        """Check whether the server process is still running."""
+        return self.process.poll() is None
+
+    def close(self) -> None:
+        """Stop the server process."""
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=_STARTUP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+def get_pandoc_server() -> PandocServer | None:
+    """
+    Get the shared pandoc server, starting it on first use.
+
+    A failed start, or a server process that has since died, is remembered
+    so later calls don't keep paying for it; callers are expected to fall
+    back to pypandoc when this returns None.
+
+    Returns:
+        PandocServer | None: Running server, or None if it is unavailable
+    """
+    global _server, _server_failed
+
+    server = _server
+    if server is not None and not server.is_alive():
+        discard_pandoc_server(server)
+        return None
+
+    if server is not None or _server_failed:
+        return server
+
+    with _server_lock:
+        if _server is None and not _server_failed:
+            pandoc_path = shutil.which("pandoc")
+            try:
+                if pandoc_path is None:
+                    raise QuackIntegrationError("Pandoc executable not found")
+                _server = PandocServer.start(pandoc_path)
+                atexit.register(shutdown_pandoc_server)
+                logger.debug(f"Started pandoc server on port {_server.port}")
+            except Exception as e:
+                _server_failed = True
+                logger.warning(f"Pandoc server unavailable, using pypandoc: {e}")
+
+    return _server
+
+
+def discard_pandoc_server(server: PandocServer) -> None:
+    """
+    Stop using a shared server that can no longer convert documents.
+
+    Later calls to get_pandoc_server return None until the server is shut
+    down, so conversions fall back to pypandoc.
+
+    Args:
+        server: The server to discard
+    """
+    global _server, _server_failed
+
+    with _server_lock:
+        if _server is server:
+            _server = None
+            _server_failed = True
+            logger.warning("Pandoc server stopped, using pypandoc")
+    server.close()
+
+
+def shutdown_pandoc_server() -> None:
+    """Stop the shared pandoc server if it is running."""
+    global _server, _server_failed
+
+    with _server_lock:
+        if _server is not None:
+            _server.close()
+        _server = None
+        _server_failed = False
@@ -6,6 +6,8 @@ This module provides helper functions for pandoc conversion operations,
 such as validation, metrics tracking, and pandoc installation verification.
 """
 
+import random
+import re
 import time
 from pathlib import Path
 
@@ -17,6 +19,20 @@ from quackcore.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Pandoc exit codes for errors that will fail the same way on every attempt:
+# option, unknown reader/writer/extension, parse, UTF-8 decoding and missing
+# data/metadata/resource file errors.
+_UNRECOVERABLE_EXIT_CODES = frozenset({6, 21, 22, 23, 64, 92, 97, 98, 99})
+_UNRECOVERABLE_MESSAGES = (
+    "unknown option",
+    "unrecognized option",
+    "unknown reader",
+    "unknown writer",
+    "no pandoc was found",
+    "does not exist",
+)
+_EXIT_CODE_PATTERN = re.compile(r'exitcode "(\d+)"')
+
 
 def verify_pandoc() -> str:
     """
@@ -97,6 +113,51 @@ def prepare_pandoc_args(
     return args
 
 
+def get_retry_delay(config: PandocConfig, attempt: int) -> float:
+    """
+    Compute the delay before retrying a failed conversion attempt.
+
+    The delay grows exponentially from the configured base delay, gets a
+    random jitter so concurrent conversions don't retry in lockstep, and is
+    capped at the configured maximum.
+
+    Args:
+        config: Conversion configuration
+        attempt: Number of attempts that have failed so far (1-based)
+
+    Returns:
+        float: Delay in seconds
+    """
+    retry = config.retry_mechanism
+    delay = retry.conversion_retry_delay * (2 ** max(attempt - 1, 0))
+    delay *= 1 + random.uniform(0, retry.retry_jitter)
+    return min(delay, retry.max_retry_delay)
+
+
+def is_unrecoverable_pandoc_error(error: Exception) -> bool:
+    """
+    Check whether a pandoc failure would fail the same way if retried.
+
+    pypandoc reports pandoc failures as plain exceptions, so the error is
+    classified by the pandoc exit code embedded in its message and by
+    well-known message fragments. Anything not recognized is treated as
+    recoverable.
+
+    Args:
+        error: Exception raised by pypandoc
+
+    Returns:
+        bool: True if retrying the conversion cannot succeed
+    """
+    message = str(error)
+    match = _EXIT_CODE_PATTERN.search(message)
+    if match and int(match.group(1)) in _UNRECOVERABLE_EXIT_CODES:
+        return True
+
+    lowered = message.lower()
+    return any(fragment in lowered for fragment in _UNRECOVERABLE_MESSAGES)
+
+
 def validate_html_structure(
         content: str, check_links: bool = False
 ) -> tuple[bool, list[str]]:
@@ -205,21 +266,25 @@ def track_metrics(
         converted_size: int,
         metrics: ConversionMetrics,
         config: PandocConfig,
+        end_time: float | None = None,
 ) -> None:
     """
     Track conversion metrics.
 
     Args:
         filename: Name of the file
-        start_time: Start time of conversion
+        start_time: time.perf_counter() value taken when the conversion started
         original_size: Size of the original file
         converted_size: Size of the converted file
         metrics: Metrics tracker
         config: Configuration object
+        end_time: time.perf_counter() value taken when the conversion finished
+            (default: now)
     """
     # Track conversion time
     if config.metrics.track_conversion_time:
-        end_time = time.time()
+        if end_time is None:
+            end_time = time.perf_counter()
         duration = end_time - start_time
 
         metrics.conversion_times[filename] = {"start": start_time, "end": end_time}
@@ -7,19 +7,57 @@ in a QuackCore project, detecting project structure,
 and inferring context from file locations.
 """
 
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
 from typing import TypeVar
 
 from quackcore.errors import QuackFileNotFoundError, wrap_io_errors
 from quackcore.logging import LOG_LEVELS, LogLevel, get_logger
 from quackcore.paths.context import ContentContext, ProjectContext
 from quackcore.paths.utils import (
+    DEFAULT_MARKER_DIRS,
+    DEFAULT_MARKER_FILES,
+    DEFAULT_MAX_LEVELS,
     find_nearest_directory,
     find_project_root,
+    is_project_root,
 )
 
 T = TypeVar("T")  # Generic type for flexible typing
 
+# Output directory names, in order of preference
+_OUTPUT_DIR_NAMES = ("output", "out", "build")
+
+# Other standard project directories and the flags they get in a context
+_STANDARD_DIRS: dict[str, dict[str, bool]] = {
+    "tests": {"is_test": True},
+    "test": {"is_test": True},
+    "data": {"is_data": True},
+    "config": {"is_config": True},
+    "configs": {"is_config": True},
+    "docs": {},
+    "assets": {"is_asset": True},
+    "resources": {},
+    "scripts": {},
+    "examples": {},
+    "temp": {"is_temp": True},
+}
+
+# Directory names under the source directory that hold a content type
+_CONTENT_TYPES = frozenset({"tutorials", "videos", "images", "distro"})
+
+# Configuration files, in order of preference
+_CONFIG_FILES = (
+    "config/default.yaml",
+    "config/default.yml",
+    "quack_config.yaml",
+    "quack_config.yml",
+    ".quack",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+)
+
 
 class PathResolver:
     """
@@ -39,6 +77,10 @@ class PathResolver:
         self.logger = get_logger(__name__)
         self.logger.setLevel(log_level)
         self._cache: dict[str, ProjectContext] = {}
+        # Project root for every directory visited while looking for one
+        self._root_cache: dict[str, str] = {}
+        # Content type directory prefixes under each cached project's source dir
+        self._content_roots: dict[str, dict[str, str]] = {}
 
     def get_project_root(
         self,
@@ -49,6 +91,10 @@ class PathResolver:
         """
         Find the project root directory.
 
+        Lookups with the default markers from an absolute directory are cached,
+        so later lookups from the same directory, or from anywhere below one
+        already walked through, skip the marker checks.
+
         Args:
             start_dir: Directory to start searching from (default: current directory)
             marker_files: List of filenames that indicate a project root
@@ -60,10 +106,95 @@ class PathResolver:
         Raises:
             QuackFileNotFoundError: If project root cannot be found
         """
-        return find_project_root(start_dir, marker_files, marker_dirs)
+        if marker_files is not None or marker_dirs is not None:
+            return find_project_root(start_dir, marker_files, marker_dirs)
+
+        try:
+            start = os.fspath(start_dir) if start_dir else os.getcwd()
+        except OSError:
+            # Let find_project_root handle a missing working directory
+            return find_project_root(start_dir)
+
+        # Relative walks stop at the working directory, so only cache absolute ones
+        if not os.path.isabs(start):
+            return find_project_root(start_dir)
+
+        # Normalize like find_project_root does: Path keeps ".." parts, which
+        # the walk has to step through literally to find the same root
+        return Path(self._find_root_cached(str(Path(start))))
+
+    def invalidate(self) -> None:
+        """Forget all cached project roots and project contexts."""
+        self._cache.clear()
+        self._root_cache.clear()
+        self._content_roots.clear()
+
+    def _find_root_cached(self, start: str) -> str:
+        """
+        Find the project root for an absolute directory using the root cache.
+
+        Args:
+            start: Normalized absolute directory to start searching from
+
+        Returns:
+            The project root directory
+
+        Raises:
+            QuackFileNotFoundError: If project root cannot be found
+        """
+        visited: list[str] = []
+        current = start
+        root: str | None = None
+
+        for level in range(DEFAULT_MAX_LEVELS):
+            cached = self._root_cache.get(current)
+            # Only trust a cached root within the levels this walk has left
+            if (
+                cached is not None
+                and level + _levels_between(current, cached) < DEFAULT_MAX_LEVELS
+            ):
+                root = cached
+                break
+
+            visited.append(current)
+            if is_project_root(current, DEFAULT_MARKER_FILES, DEFAULT_MARKER_DIRS):
+                root = current
+                break
+
+            parent = os.path.dirname(current)
+            if parent == current:
+                break  # Reached filesystem root.
+            current = parent
+
+        if root is None:
+            raise QuackFileNotFoundError(
+                start,
+                "Could not find project root directory. Please specify it explicitly.",
+            )
+
+        for directory in visited:
+            self._root_cache[directory] = root
+        return root
 
     # src/quackcore/paths/resolver.py fixes for PathResolver methods
 
+    @staticmethod
+    def _scan_root(root_dir: Path) -> dict[str, os.DirEntry]:
+        """
+        List the entries of a project root once for the detection helpers.
+
+        Args:
+            root_dir: Project root directory
+
+        Returns:
+            Directory entries by name, empty if the root cannot be listed
+        """
+        try:
+            with os.scandir(root_dir) as entries:
+                return {entry.name: entry for entry in entries}
+        except OSError:
+            return {}
+
     def _detect_standard_directories(self, context: ProjectContext) -> None:
         """
         Detect standard directories in a project and add them to the context.
@@ -71,46 +202,49 @@ class PathResolver:
         Args:
             context: ProjectContext to update
         """
+        self._add_standard_directories(context, self._scan_root(context.root_dir))
+
+    def _add_standard_directories(
+        self, context: ProjectContext, entries: dict[str, os.DirEntry]
+    ) -> None:
+        """
+        Add the standard directories found in a scan of the project root.
+
+        Args:
+            context: ProjectContext to update
+            entries: Entries of the project root by name
+        """
         root_dir = context.root_dir
 
-        # Look for source directory
-        try:
-            src_dir = self.find_source_directory(root_dir)
-            # Mark it explicitly as a source directory when adding to context
-            context.add_directory("src", src_dir, is_source=True)
-        except QuackFileNotFoundError:
+        # Look for source directory; a package root or a top-level src
+        # directory can be read straight from the scan.
+        if "__init__.py" in entries:
+            context.add_directory("src", root_dir, is_source=True)
+        elif "src" in entries and entries["src"].is_dir():
+            context.add_directory("src", root_dir / "src", is_source=True)
+        else:
             try:
-                src_dir = find_nearest_directory("src", str(root_dir))
+                src_dir = self.find_source_directory(root_dir)
+                # Mark it explicitly as a source directory when adding to context
                 context.add_directory("src", src_dir, is_source=True)
             except QuackFileNotFoundError:
-                pass
+                try:
+                    src_dir = find_nearest_directory("src", str(root_dir))
+                    context.add_directory("src", src_dir, is_source=True)
+                except QuackFileNotFoundError:
+                    pass
 
         # Look for output directory
-        try:
-            output_dir = self.find_output_directory(str(root_dir))
-            context.add_directory("output", output_dir, is_output=True)
-        except QuackFileNotFoundError:
-            pass
+        for name in _OUTPUT_DIR_NAMES:
+            if name in entries:
+                context.add_directory("output", root_dir / name, is_output=True)
+                break
 
         # Look for other standard directories
-        standard_dirs = {
-            "tests": {"is_test": True},
-            "test": {"is_test": True},
-            "data": {"is_data": True},
-            "config": {"is_config": True},
-            "configs": {"is_config": True},
-            "docs": {},
-            "assets": {"is_asset": True},
-            "resources": {},
-            "scripts": {},
-            "examples": {},
-            "temp": {"is_temp": True},
-        }
-
-        for name, attrs in standard_dirs.items():
-            dir_path = root_dir / name
-            if dir_path.is_dir():
-                context.add_directory(name, dir_path, **attrs)
+        for name, attrs in _STANDARD_DIRS.items():
+            entry = entries.get(name)
+            if entry is not None and entry.is_dir():
+                context.add_directory(name, root_dir / name, **attrs)
 
     def find_source_directory(
         self,
@@ -128,11 +262,11 @@ class PathResolver:
         Raises:
             QuackFileNotFoundError: If a source directory cannot be found
         """
-        current_dir = Path(start_dir) if start_dir else Path.cwd()
+        current_dir = os.fspath(start_dir) if start_dir else os.getcwd()
 
         # First, check if the current directory is a Python package.
-        if (current_dir / "__init__.py").exists():
-            return current_dir
+        if os.path.exists(os.path.join(current_dir, "__init__.py")):
+            return Path(current_dir)
 
         try:
             # Try to find a 'src' directory starting from the given directory.
@@ -140,9 +274,9 @@ class PathResolver:
         except QuackFileNotFoundError as e:
             # If a 'src' directory is not found, search upward for a Python package.
             for _ in range(5):  # Check up to 5 levels upward.
-                if (current_dir / "__init__.py").exists():
-                    return current_dir
-                parent_dir = current_dir.parent
+                if os.path.exists(os.path.join(current_dir, "__init__.py")):
+                    return Path(current_dir)
+                parent_dir = os.path.dirname(current_dir)
                 if parent_dir == current_dir:  # Reached the filesystem root.
                     break
                 current_dir = parent_dir
@@ -182,17 +316,11 @@ class PathResolver:
             root_dir = self.get_project_root(start_dir)
 
             # Check common output directories
-            output_dir = root_dir / "output"
-            if output_dir.exists():
-                return output_dir
-
-            output_dir = root_dir / "out"
-            if output_dir.exists():
-                return output_dir
-
-            output_dir = root_dir / "build"
-            if output_dir.exists():
-                return output_dir
+            root = os.fspath(root_dir)
+            for name in _OUTPUT_DIR_NAMES:
+                output_path = os.path.join(root, name)
+                if os.path.exists(output_path):
+                    return Path(output_path)
 
             if create:
                 output_dir = root_dir / "output"
@@ -231,11 +359,11 @@ class PathResolver:
         Returns:
             Path: Resolved absolute path
         """
-        path_obj = Path(path)
+        path_str = os.fspath(path)
 
         # If path is absolute, return it as is
-        if path_obj.is_absolute():
-            return path_obj
+        if os.path.isabs(path_str):
+            return Path(path_str)
 
         # If project root is not specified, try to find it
         if project_root is None:
@@ -244,11 +372,9 @@ class PathResolver:
             except QuackFileNotFoundError:
                 # If project root cannot be found, use current directory
                 project_root = Path.cwd()
-        else:
-            project_root = Path(project_root)
 
         # Resolve path relative to project root
-        return project_root / path_obj
+        return Path(os.path.join(os.fspath(project_root), path_str))
 
     def _infer_content_structure(
         self,
@@ -264,35 +390,28 @@ class PathResolver:
         """
         if current_dir is None:
             current_dir = Path.cwd()
-        current_dir = Path(current_dir)
         src_dir = context.get_source_dir()
         if not src_dir:
             return
 
-        try:
-            # Check if current_dir is within the src directory
-            if not current_dir.is_relative_to(src_dir):
-                return
-
-            rel_path = current_dir.relative_to(src_dir)
-            parts = rel_path.parts
-
-            # Only process if there are path components to analyze
-            if not parts:
-                return
-
-            # The first level might be a content type directory
-            content_types = ["tutorials", "videos", "images", "distro"]
-            if len(parts) >= 1 and parts[0] in content_types:
-                context.content_type = parts[0]
-
-            # The second level might be a content name
-            if len(parts) >= 2:
-                context.content_name = parts[1]
-                context.content_dir = src_dir / parts[0] / parts[1]
-        except (ValueError, IndexError):
-            # Handle any exceptions during path processing
-            pass
+        # Compare normalized path strings instead of building relative Paths
+        current = str(Path(current_dir))
+        src_prefix = os.path.join(str(src_dir), "")
+
+        # Check if current_dir is within the src directory
+        if not current.startswith(src_prefix):
+            return
+
+        parts = current[len(src_prefix) :].split(os.sep)
+
+        # The first level might be a content type directory
+        if parts[0] in _CONTENT_TYPES:
+            context.content_type = parts[0]
+
+        # The second level might be a content name
+        if len(parts) >= 2:
+            context.content_name = parts[1]
+            context.content_dir = Path(os.path.join(src_prefix, parts[0], parts[1]))
 
     @wrap_io_errors
     def detect_project_context(
@@ -320,23 +439,45 @@ class PathResolver:
             raise QuackFileNotFoundError(str(start_dir))
 
         try:
-            root_dir = find_project_root(start_dir)
+            root_dir = self.get_project_root(start_dir)
         except QuackFileNotFoundError:
             # Fallback: if no markers are found, use the provided directory as the root.
             root_dir = start_dir
 
-        # Use the resolved root directory as the cache key.
+        # Use the resolved root directory as the cache key, so every directory
+        # in the same project shares one context object.
         cache_key = str(root_dir.resolve())
         if cache_key in self._cache:
             return self._cache[cache_key]
 
         context = ProjectContext(root_dir=root_dir)
         context.name = root_dir.name
-        self._detect_standard_directories(context)
-        self._detect_config_file(context)
+        entries = self._scan_root(root_dir)
+        self._add_standard_directories(context, entries)
+        self._add_config_file(context, entries)
         self._cache[cache_key] = context
+        self._content_roots[str(root_dir)] = self._build_content_roots(context)
         return context
 
+    @staticmethod
+    def _build_content_roots(context: ProjectContext) -> dict[str, str]:
+        """
+        Map each content type to its directory prefix in the source directory.
+
+        Args:
+            context: ProjectContext to read the source directory from
+
+        Returns:
+            Dictionary of content type to directory path ending in a separator
+        """
+        src_dir = context.get_source_dir()
+        if not src_dir:
+            return {}
+        return {
+            content_type: os.path.join(str(src_dir), content_type, "")
+            for content_type in _CONTENT_TYPES
+        }
+
     def _detect_config_file(self, context: ProjectContext) -> None:
         """
         Detect configuration file in a project.
@@ -344,21 +485,31 @@ class PathResolver:
         Args:
             context: ProjectContext to update
         """
+        self._add_config_file(context, self._scan_root(context.root_dir))
+
+    @staticmethod
+    def _add_config_file(
+        context: ProjectContext, entries: dict[str, os.DirEntry]
+    ) -> None:
+        """
+        Set the first configuration file found in a scan of the project root.
+
+        Args:
+            context: ProjectContext to update
+            entries: Entries of the project root by name
+        """
         root_dir = context.root_dir
-        config_files = [
-            "config/default.yaml",
-            "config/default.yml",
-            "quack_config.yaml",
-            "quack_config.yml",
-            ".quack",
-            "pyproject.toml",  # Move this to the end
-            "setup.py",
-            "setup.cfg",
-        ]
-        for filename in config_files:
-            file_path = root_dir / filename
-            if file_path.is_file():
-                context.config_file = file_path
+        for filename in _CONFIG_FILES:
+            top_level, _, nested = filename.partition("/")
+            entry = entries.get(top_level)
+            if entry is None:
+                continue
+            if nested:
+                if entry.is_dir() and (root_dir / filename).is_file():
+                    context.config_file = root_dir / filename
+                    break
+            elif entry.is_file():
+                context.config_file = root_dir / filename
                 break
 
     def detect_content_context(
@@ -403,6 +554,11 @@ class PathResolver:
         Returns:
             Dictionary with 'type' and 'name' keys if found
         """
+        if start_dir is None:
+            result = self._match_content_root(os.getcwd())
+            if result is not None:
+                return result
+
         context = self.detect_content_context(start_dir)
         result = {}
         if context.content_type:
@@ -411,6 +567,47 @@ class PathResolver:
             result["name"] = context.content_name
         return result
 
+    def _match_content_root(self, current_dir: str) -> dict[str, str] | None:
+        """
+        Match a directory against the cached content roots of its project.
+
+        Args:
+            current_dir: Absolute directory path
+
+        Returns:
+            Dictionary with 'type' and 'name' keys if the directory is inside a
+            content type directory, otherwise None
+        """
+        try:
+            project_context = self.detect_project_context(current_dir)
+        except QuackFileNotFoundError:
+            return None
+
+        content_roots = self._content_roots.get(str(project_context.root_dir), {})
+        current = os.path.join(current_dir, "")
+        for content_type, prefix in content_roots.items():
+            if current.startswith(prefix):
+                result = {"type": content_type}
+                name = current[len(prefix) :].split(os.sep, 1)[0]
+                if name:
+                    result["name"] = name
+                return result
+        return None
+
+
+def _levels_between(directory: str, ancestor: str) -> int:
+    """
+    Count the directory levels between a directory and one of its ancestors.
+
+    Args:
+        directory: Absolute directory path
+        ancestor: Absolute path of an ancestor of directory
+
+    Returns:
+        Number of parent steps from directory to ancestor
+    """
+    return len(PurePath(directory).parts) - len(PurePath(ancestor).parts)
+
 
 def get_project_root(
     start_dir: str | Path | None = None,
@@ -7,6 +7,8 @@ including functions for finding project roots and navigating directories.
 """
 
 import os
+import sys
+from collections.abc import Collection
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -40,6 +42,67 @@ class ProjectConfig(BaseModel):
     max_levels: int = 5
 
 
+_DEFAULT_PROJECT_CONFIG = ProjectConfig()
+
+# Default markers as frozensets, so root checks are plain set intersections
+DEFAULT_MARKER_FILES = frozenset(_DEFAULT_PROJECT_CONFIG.marker_files)
+DEFAULT_MARKER_DIRS = frozenset(_DEFAULT_PROJECT_CONFIG.marker_dirs)
+DEFAULT_MAX_LEVELS = _DEFAULT_PROJECT_CONFIG.max_levels
+
+# Default file systems on these platforms match names case-insensitively
+_CASE_INSENSITIVE_FS = sys.platform in ("darwin", "win32")
+
+
+def is_project_root(
+    directory: str | Path,
+    marker_files: Collection[str],
+    marker_dirs: Collection[str],
+) -> bool:
+    """
+    Check whether a directory looks like a project root.
+
+    Args:
+        directory: Directory to check
+        marker_files: Filenames that indicate a project root
+        marker_dirs: Directory names that indicate a project root
+
+    Returns:
+        True if any marker file exists in the directory, or if at least two
+        marker directories do
+
+    Note:
+        Marker names are matched case-insensitively on macOS and Windows, as
+        their default file systems do, and exactly everywhere else.
+    """
+    # List the directory once instead of stat-ing every marker separately.
+    try:
+        with os.scandir(directory) as entries:
+            names: dict[str, os.DirEntry] = {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    except OSError:
+        # Directories we may search but not list can still be probed by name.
+        directory = Path(directory)
+        if any((directory / marker).exists() for marker in marker_files):
+            return True
+        return sum(1 for marker in marker_dirs if (directory / marker).is_dir()) >= 2
+
+    if _CASE_INSENSITIVE_FS:
+        names = {name.casefold(): entry for name, entry in names.items()}
+        marker_files = {marker.casefold() for marker in marker_files}
+        marker_dirs = {marker.casefold() for marker in marker_dirs}
+
+    # Check for marker files in the directory.
+    if names.keys() & marker_files:
+        return True
+
+    # Check for marker directories: if two or more are found, assume project root.
+    dir_markers_found: int = sum(
+        1 for marker in names.keys() & marker_dirs if names[marker].is_dir()
+    )
+    return dir_markers_found >= 2
+
+
 @wrap_io_errors
 def find_project_root(
     start_dir: str | Path | None = None,
@@ -62,10 +125,17 @@ def find_project_root(
     Raises:
         QuackFileNotFoundError: If project root cannot be found
     """
+    # An empty override only falls back to the defaults when the other is unset
+    marker_file_set: frozenset[str]
+    marker_dir_set: frozenset[str]
     if marker_files is None or marker_dirs is None:
-        config = ProjectConfig()
-        marker_files = marker_files or config.marker_files
-        marker_dirs = marker_dirs or config.marker_dirs
+        marker_file_set = (
+            frozenset(marker_files) if marker_files else DEFAULT_MARKER_FILES
+        )
+        marker_dir_set = frozenset(marker_dirs) if marker_dirs else DEFAULT_MARKER_DIRS
+    else:
+        marker_file_set = frozenset(marker_files)
+        marker_dir_set = frozenset(marker_dirs)
 
     # Safely get the current directory, with fallback to a known directory
     try:
@@ -79,15 +149,7 @@ def find_project_root(
         )
 
     for _ in range(max_levels):
-        # Check for marker files in the current directory.
-        if any((current_dir / marker).exists() for marker in marker_files):
-            return current_dir
-
-        # Check for marker directories: if two or more are found, assume project root.
-        dir_markers_found: int = sum(
-            1 for marker in marker_dirs if (current_dir / marker).is_dir()
-        )
-        if dir_markers_found >= 2:
+        if is_project_root(current_dir, marker_file_set, marker_dir_set):
             return current_dir
 
         parent_dir: Path = current_dir.parent
@@ -513,6 +513,11 @@ class TestFileUtilities:
         assert result == file_path
         assert file_path.read_bytes() == binary_content
 
+        # Bytes-like content is written as binary too
+        result = atomic_write(file_path, bytearray(binary_content))
+        assert result == file_path
+        assert file_path.read_bytes() == binary_content
+
         # Test with error during write
         with patch("os.replace", side_effect=OSError("Test error")):
             with pytest.raises(QuackIOError):
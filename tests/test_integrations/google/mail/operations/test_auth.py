@@ -54,6 +54,25 @@ class TestGmailAuthOperations:
             assert "Failed to initialize Gmail API" in str(excinfo.value)
             assert mock_build.call_count == 1
 
+    def test_initialize_gmail_service_with_http(self) -> None:
+        """Test building the Gmail service on a caller-provided HTTP client."""
+        mock_creds = MagicMock()
+
+        http = auth.create_authorized_http(mock_creds, timeout=10)
+        assert http.credentials is mock_creds
+        assert http.http.timeout == 10
+        # Built like googleapiclient's own client, which doesn't follow 308s
+        assert 308 not in http.http.redirect_codes
+
+        mock_service = MagicMock()
+        with patch("googleapiclient.discovery.build") as mock_build:
+            mock_build.return_value = mock_service
+
+            service = auth.initialize_gmail_service(mock_creds, http=http)
+
+            assert service is mock_service
+            mock_build.assert_called_once_with("gmail", "v1", http=http)
+
     def test_google_credentials_protocol(self) -> None:
         """Test GoogleCredentials protocol conformity."""
 
@@ -6,13 +6,16 @@ This module tests the email operations functionality for the Google Mail integra
 including building queries, listing emails, and downloading emails.
 """
 
+import base64
 import logging
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from googleapiclient.errors import HttpError
 
+from quackcore.errors import QuackApiError
 from quackcore.integrations.google.mail.operations import email
 from quackcore.integrations.google.mail.protocols import (
     GmailAttachmentsResource,
@@ -21,88 +24,140 @@ from quackcore.integrations.google.mail.protocols import (
     GmailService,
     GmailUsersResource,
 )
+from quackcore.integrations.google.mail.utils.cache import GmailCache
+
+
+class MockRequest(GmailRequest):
+    """Request that returns a fixed response."""
+
+    def __init__(self, return_value):
+        self.return_value = return_value
+
+    def execute(self, num_retries: int = 0):
+        return self.return_value
+
+
+class MockAttachmentsResource(GmailAttachmentsResource):
+    """Attachments resource that records its last call."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default response and forget recorded calls."""
+        self.get_return = None
+        self.last_user_id = None
+        self.last_message_id = None
+        self.last_attachment_id = None
+
+    def get(self, user_id: str, message_id: str, attachment_id: str) -> GmailRequest:
+        # Store the parameters for test assertions
+        self.last_user_id = user_id
+        self.last_message_id = message_id
+        self.last_attachment_id = attachment_id
+        return MockRequest(self.get_return)
+
+
+class MockMessagesResource(GmailMessagesResource):
+    """Messages resource that records its last call."""
+
+    def __init__(self):
+        self.attachments_resource = MockAttachmentsResource()
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the default responses and forget recorded calls."""
+        self.attachments_resource.reset()
+        self.list_return = {}
+        self.get_return = {}
+        self.last_user_id = None
+        self.last_query = None
+        self.last_max_results = None
+        self.last_message_id = None
+        self.last_format = None
+
+    def list(self, user_id: str, q: str, max_results: int) -> GmailRequest:
+        # Store parameters for test assertions
+        self.last_user_id = user_id
+        self.last_query = q
+        self.last_max_results = max_results
+        return MockRequest(self.list_return)
+
+    def get(self, user_id: str, message_id: str, message_format: str) -> GmailRequest:
+        # Store parameters for test assertions
+        self.last_user_id = user_id
+        self.last_message_id = message_id
+        self.last_format = message_format
+        return MockRequest(self.get_return)
+
+    def attachments(self) -> GmailAttachmentsResource:
+        return self.attachments_resource
+
+
+class MockUsersResource(GmailUsersResource):
+    """Users resource holding the messages resource."""
+
+    def __init__(self):
+        self.messages_resource = MockMessagesResource()
+
+    def messages(self) -> GmailMessagesResource:
+        return self.messages_resource
+
+
+class MockBatchRequest:
+    """Batch request that executes its requests in order."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:
+                response, exception = None, e
+            self.callback(request_id, response, exception)
+
+
+class MockGmailService(GmailService):
+    """Protocol-compatible Gmail service with batch support."""
+
+    def __init__(self):
+        self.users_resource = MockUsersResource()
+        self.batches = []
+
+    def reset(self) -> None:
+        """Restore the default state of the whole mock tree."""
+        self.users_resource.messages_resource.reset()
+        self.batches.clear()
+
+    def users(self) -> GmailUsersResource:
+        return self.users_resource
+
+    def new_batch_http_request(self, callback):
+        batch = MockBatchRequest(callback)
+        self.batches.append(batch)
+        return batch
 
 
 class TestGmailEmailOperations:
     """Tests for Gmail email operations."""
 
-    @pytest.fixture
-    def mock_gmail_service(self):
-        """Create a protocol-compatible mock Gmail service."""
-
-        # Create a proper mock hierarchy that matches the protocol structure
-        class MockRequest(GmailRequest):
-            def __init__(self, return_value):
-                self.return_value = return_value
-
-            def execute(self):
-                return self.return_value
-
-        class MockAttachmentsResource(GmailAttachmentsResource):
-            def __init__(self):
-                self.get_return = None
-                # Initialize instance attributes in __init__
-                self.last_user_id = None
-                self.last_message_id = None
-                self.last_attachment_id = None
-
-            def get(
-                self, user_id: str, message_id: str, attachment_id: str
-            ) -> GmailRequest:
-                # Store the parameters for test assertions
-                self.last_user_id = user_id
-                self.last_message_id = message_id
-                self.last_attachment_id = attachment_id
-                return MockRequest(self.get_return)
-
-        class MockMessagesResource(GmailMessagesResource):
-            def __init__(self):
-                self.attachments_resource = MockAttachmentsResource()
-                self.list_return = {}
-                self.get_return = {}
-                # Initialize attributes for test assertions
-                self.last_user_id = None
-                self.last_query = None
-                self.last_max_results = None
-                self.last_message_id = None
-                self.last_format = None
-
-            def list(self, user_id: str, q: str, max_results: int) -> GmailRequest:
-                # Store parameters for test assertions
-                self.last_user_id = user_id
-                self.last_query = q
-                self.last_max_results = max_results
-                return MockRequest(self.list_return)
-
-            def get(
-                self, user_id: str, message_id: str, message_format: str
-            ) -> GmailRequest:
-                # Store parameters for test assertions
-                self.last_user_id = user_id
-                self.last_message_id = message_id
-                self.last_format = message_format
-                return MockRequest(self.get_return)
-
-            def attachments(self) -> GmailAttachmentsResource:
-                return self.attachments_resource
-
-        class MockUsersResource(GmailUsersResource):
-            def __init__(self):
-                self.messages_resource = MockMessagesResource()
-
-            def messages(self) -> GmailMessagesResource:
-                return self.messages_resource
-
-        class MockGmailService(GmailService):
-            def __init__(self):
-                self.users_resource = MockUsersResource()
-
-            def users(self) -> GmailUsersResource:
-                return self.users_resource
-
-        # Create an instance of our protocol-compatible mock
+    @pytest.fixture(scope="session")
+    def session_gmail_service(self) -> MockGmailService:
+        """Build the mock Gmail service once per test session."""
         return MockGmailService()
 
+    @pytest.fixture
+    def mock_gmail_service(self, session_gmail_service):
+        """Get the shared mock Gmail service in its default state."""
+        session_gmail_service.reset()
+        return session_gmail_service
+
     def test_build_query(self) -> None:
         """Test building Gmail search query."""
         # Test with days_back
@@ -131,6 +186,23 @@ class TestGmailEmailOperations:
         assert "label:" not in query
         assert "after:" in query
 
+        # Queries are cached per day, so a new day gives a new after: date
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.datetime"
+        ) as mock_dt:
+            mock_dt.now.return_value = datetime(2023, 1, 10, 23, 59)
+            assert email.build_query(days_back=7, labels=["INBOX"]) == (
+                "label:INBOX after:2023/01/03"
+            )
+            assert email.build_query(days_back=7, labels=["INBOX"]) == (
+                "label:INBOX after:2023/01/03"
+            )
+
+            mock_dt.now.return_value = datetime(2023, 1, 11, 0, 0)
+            assert email.build_query(days_back=7, labels=["INBOX"]) == (
+                "label:INBOX after:2023/01/04"
+            )
+
     def test_extract_header(self) -> None:
         """Test extracting headers from email."""
         headers = [
@@ -155,6 +227,21 @@ class TestGmailEmailOperations:
         empty_result = email._extract_header([], "subject", "Empty")
         assert empty_result == "Empty"
 
+    def test_headers_to_map(self) -> None:
+        """Test indexing headers by lowercase name."""
+        headers = [
+            {"name": "Subject", "value": "Test Email"},
+            {"name": "Received", "value": "first"},
+            {"name": "RECEIVED", "value": "second"},
+            {"name": "X-Empty"},
+        ]
+
+        assert email._headers_to_map(headers) == {
+            "subject": "Test Email",
+            "received": "first",
+        }
+        assert email._headers_to_map([]) == {}
+
     def test_clean_filename(self) -> None:
         """Test cleaning filenames."""
         # Test basic cleaning
@@ -231,19 +318,14 @@ class TestGmailEmailOperations:
             return_value={"id": "msg1", "snippet": "Test email"},
         ):
             message = email._get_message_with_retry(
-                mock_gmail_service, "me", "msg1", 3, 0.1, 0.5, logger
+                mock_gmail_service, "me", "msg1", 3, logger
             )
             assert message is not None
             assert message["id"] == "msg1"
             assert message["snippet"] == "Test email"
 
-        # Test with retry
-        mock_execute = MagicMock(
-            side_effect=[
-                HttpError(resp=MagicMock(status=500), content=b"Server error"),
-                {"id": "msg1", "snippet": "Test email"},
-            ]
-        )
+        # Retries are left to the API client
+        mock_execute = MagicMock(return_value={"id": "msg1", "snippet": "Test email"})
         with patch(
             "quackcore.integrations.google.mail.operations.email.execute_api_request",
             mock_execute,
@@ -252,41 +334,55 @@ class TestGmailEmailOperations:
                 "quackcore.integrations.google.mail.operations.email.time.sleep"
             ) as mock_sleep:
                 message = email._get_message_with_retry(
-                    mock_gmail_service, "me", "msg1", 3, 0.1, 0.5, logger
+                    mock_gmail_service, "me", "msg1", 3, logger
                 )
                 assert message is not None
                 assert message["id"] == "msg1"
-                assert mock_execute.call_count == 2
-                mock_sleep.assert_called_once_with(0.1)  # Initial delay
+                mock_execute.assert_called_once()
+                assert mock_execute.call_args.kwargs["num_retries"] == 2
+                mock_sleep.assert_not_called()
 
         # Test with max retries exceeded
-        # Use a more explicit approach to mock the consecutive exceptions
         error_resp = MagicMock()
         error_resp.status = 500
+        http_error = HttpError(resp=error_resp, content=b"Server error")
 
-        # Create a function that always raises HTTPError with our mock response
-        def raise_http_error(*args, **kwargs):
-            raise HttpError(resp=error_resp, content=b"Server error")
-
-        # Create a mock with this side effect
-        mock_execute = MagicMock(side_effect=raise_http_error)
+        # The client raises once its own retries are exhausted
+        mock_execute = MagicMock(
+            side_effect=QuackApiError(
+                f"Failed to get message from Gmail: {http_error}",
+                service="Gmail",
+                api_method="users.messages.get",
+                original_error=http_error,
+            )
+        )
 
         with patch(
             "quackcore.integrations.google.mail.operations.email.execute_api_request",
             mock_execute,
         ):
-            with patch(
-                "quackcore.integrations.google.mail.operations.email.time.sleep"
-            ) as mock_sleep:
-                # We're testing with 2 max retries, so expect 1 sleep call (after the 1st failure)
-                message = email._get_message_with_retry(
-                    mock_gmail_service, "me", "msg1", 2, 0.1, 0.5, logger
-                )
+            message = email._get_message_with_retry(
+                mock_gmail_service, "me", "msg1", 2, logger
+            )
+
+            assert message is None  # Should return None after exhausting retries
+            mock_execute.assert_called_once()
+            assert mock_execute.call_args.kwargs["num_retries"] == 1
 
-                # Verify expected behavior
-                assert message is None  # Should return None after exhausting retries
-                assert mock_execute.call_count == 2  # Called twice (initial + 1 retry)
-                assert mock_sleep.call_count == 1  # Only 1 sleep between the 2 attempts
+        # Errors that are not HTTP failures are bugs and are not swallowed
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.execute_api_request",
+            side_effect=QuackApiError(
+                "Failed to get message from Gmail: bad argument",
+                service="Gmail",
+                api_method="users.messages.get",
+                original_error=TypeError("bad argument"),
+            ),
+        ):
+            with pytest.raises(QuackApiError):
+                email._get_message_with_retry(
+                    mock_gmail_service, "me", "msg1", 2, logger
+                )
 
     @patch("quackcore.integrations.google.mail.operations.email.process_message_parts")
     @patch(
@@ -297,13 +393,12 @@ class TestGmailEmailOperations:
         mock_get_message: MagicMock,
         mock_process_parts: MagicMock,
         mock_gmail_service,
+        tmp_path,
     ) -> None:
         """Test downloading an email."""
         logger = logging.getLogger("test_gmail")
-        storage_path = "/path/to/storage"
-        expected_file_path = (
-            "/path/to/storage/2023-01-15-103000-sender-example-com.html"
-        )
+        storage_path = str(tmp_path)
+        expected_file = tmp_path / "2023-01-15-103000-sender-example-com.html"
 
         # Mock message retrieval
         mock_get_message.return_value = {
@@ -319,36 +414,17 @@ class TestGmailEmailOperations:
 
         # Mock message processing
         mock_process_parts.return_value = (
-            "<html><body>Test content</body></html>",
-            ["/path/to/storage/attachment.pdf"],
+            "<html><body>Test content ü</body></html>",
+            [str(tmp_path / "attachment.pdf")],
         )
 
-        # Patch the filesystem write operation to avoid real filesystem access
-        with (
-            patch(
-                "quackcore.integrations.google.mail.operations.email.datetime"
-            ) as mock_dt,
-            patch(
-                "quackcore.integrations.google.mail.operations.email.clean_filename"
-            ) as mock_clean,
-            patch("quackcore.integrations.google.mail.operations.email.fs") as mock_fs,
-        ):
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.datetime"
+        ) as mock_dt:
             # Set up date/time to ensure consistent filename generation
             mock_dt.now.return_value = datetime(2023, 1, 15, 10, 30, 0)
             mock_dt.side_effect = lambda *args, **kw: datetime(*args, **kw)
 
-            # Configure filename cleaning
-            mock_clean.return_value = "sender-example-com"
-
-            # Configure fs join_path to return a string path
-            mock_fs.join_path.return_value = expected_file_path
-
-            # Configure fs write_text operation results
-            write_result = MagicMock()
-            write_result.success = True
-            write_result.content = expected_file_path
-            mock_fs.write_text.return_value = write_result
-
             # Test successful download
             result = email.download_email(
                 mock_gmail_service,
@@ -358,31 +434,25 @@ class TestGmailEmailOperations:
                 True,
                 True,
                 3,
-                0.1,
-                0.5,
-                logger,
+                logger=logger,
             )
 
-            # Verify results
-            assert result.success is True
-            assert expected_file_path == result.content
-            assert "Email downloaded successfully" in result.message
-
-            # Verify correct calls were made
-            mock_get_message.assert_called_once_with(
-                mock_gmail_service, "me", "msg1", 3, 0.1, 0.5, logger
-            )
+        # Verify results
+        assert result.success is True
+        assert result.content == str(expected_file)
+        assert "Email downloaded successfully" in result.message
 
-            # Verify that fs.join_path was called with the right arguments
-            mock_fs.join_path.assert_called_once_with(
-                storage_path, "2023-01-15-103000-sender-example-com.html"
-            )
+        # Verify correct calls were made
+        mock_get_message.assert_called_once_with(
+            mock_gmail_service, "me", "msg1", 3, logger, cache=None
+        )
 
-            # Verify that fs.write_text was called with the expected content
-            write_content = mock_fs.write_text.call_args[0][1]
-            assert "<h1>Subject: Test Email</h1>" in write_content
-            assert "<h2>From: sender@example.com</h2>" in write_content
-            assert "<html><body>Test content</body></html>" in write_content
+        # Verify the file written to disk, including its UTF-8 encoding
+        written = expected_file.read_text(encoding="utf-8")
+        assert written == (
+            "<h1>Subject: Test Email</h1><h2>From: sender@example.com</h2><hr/>"
+            "<html><body>Test content ü</body></html>"
+        )
 
         # Test with missing message
         mock_get_message.return_value = None
@@ -394,9 +464,7 @@ class TestGmailEmailOperations:
             False,
             False,
             3,
-            0.1,
-            0.5,
-            logger,
+            logger=logger,
         )
         assert result.success is False
         assert "Message msg1 could not be retrieved" in result.error
@@ -418,9 +486,7 @@ class TestGmailEmailOperations:
             False,
             False,
             3,
-            0.1,
-            0.5,
-            logger,
+            logger=logger,
         )
         assert result.success is False
         assert "No HTML content found in message msg1" in result.error
@@ -435,9 +501,374 @@ class TestGmailEmailOperations:
             False,
             False,
             3,
-            0.1,
-            0.5,
-            logger,
+            logger=logger,
         )
         assert result.success is False
         assert "Failed to download email msg1" in result.error
+
+        # The old backoff settings are ignored and deprecated
+        mock_get_message.side_effect = None
+        mock_get_message.return_value = None
+        with pytest.warns(DeprecationWarning, match="initial_delay and max_delay"):
+            email.download_email(
+                mock_gmail_service, "me", "msg1", storage_path, False, False, 3, 0.1
+            )
+
+    def test_process_message_parts(self, mock_gmail_service) -> None:
+        """Test splitting message parts into HTML content and attachments."""
+        logger = logging.getLogger("test_gmail")
+
+        def html_part(html: str, **extra) -> dict:
+            data = base64.urlsafe_b64encode(html.encode()).decode()
+            return {"mimeType": "text/html", "body": {"data": data}, **extra}
+
+        parts = [
+            {
+                "mimeType": "multipart/mixed",
+                "parts": [
+                    {"mimeType": "text/plain", "body": {"data": "ignored"}},
+                    {"mimeType": "application/pdf", "filename": "report.pdf"},
+                ],
+            },
+            html_part("<p>Second</p>", filename="second.html"),
+            html_part("<p>First</p>"),
+            {"mimeType": "text/html", "filename": "empty.html", "body": {}},
+        ]
+
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.handle_attachment",
+            side_effect=lambda service, user, part, *args: f"/saved/{part['filename']}",
+        ) as mock_handle:
+            html_content, attachment_paths = email.process_message_parts(
+                mock_gmail_service, "me", parts, "msg1", "/saved", logger
+            )
+
+        # Parts are walked from the end, so the last HTML part with data wins
+        assert html_content == "<p>First</p>"
+        assert attachment_paths == ["/saved/second.html", "/saved/report.pdf"]
+        assert mock_handle.call_count == 2
+
+    def test_process_message_parts_prefetches_attachments(
+        self, mock_gmail_service
+    ) -> None:
+        """Test that remote attachments are fetched in batches."""
+        logger = logging.getLogger("test_gmail")
+        mock_gmail_service.users().messages().attachments().get_return = {
+            "data": "ZmlsZQ=="
+        }
+        parts = [
+            {"filename": "a.pdf", "body": {"attachmentId": "att1"}},
+            {"filename": "b.pdf", "body": {"attachmentId": "att2"}},
+            {"filename": "c.txt", "body": {"data": "aW5saW5l"}},
+        ]
+
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.handle_attachment",
+            side_effect=lambda service, user, part, *args: part["body"]["data"],
+        ) as mock_handle:
+            _, attachment_paths = email.process_message_parts(
+                mock_gmail_service, "me", parts, "msg1", "/saved", logger
+            )
+
+        assert [len(batch.requests) for batch in mock_gmail_service.batches] == [2]
+        assert sorted(attachment_paths) == ["ZmlsZQ==", "ZmlsZQ==", "aW5saW5l"]
+        assert mock_handle.call_count == 3
+        # The original parts are left untouched
+        assert "data" not in parts[0]["body"]
+
+        # Remote attachments are fetched a few per batch
+        mock_gmail_service.batches.clear()
+        remote_parts = [
+            {"filename": f"{i}.pdf", "body": {"attachmentId": f"att{i}"}}
+            for i in range(6)
+        ]
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.handle_attachment",
+            side_effect=lambda service, user, part, *args: part["filename"],
+        ) as mock_handle:
+            _, attachment_paths = email.process_message_parts(
+                mock_gmail_service, "me", remote_parts, "msg1", "/saved", logger
+            )
+
+        assert [len(batch.requests) for batch in mock_gmail_service.batches] == [4, 2]
+        assert sorted(attachment_paths) == [f"{i}.pdf" for i in range(6)]
+        # Each attachment is saved once, straight from its batch response
+        assert mock_handle.call_count == 6
+
+        # A single remote attachment is not worth a batch
+        mock_gmail_service.batches.clear()
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.handle_attachment",
+            return_value="/saved/a.pdf",
+        ):
+            email.process_message_parts(
+                mock_gmail_service, "me", parts[:1], "msg1", "/saved", logger
+            )
+        assert mock_gmail_service.batches == []
+
+    def test_decode_attachment_data(self) -> None:
+        """Test decoding attachment data in chunks."""
+        content = bytes(range(256)) * 10
+        data = base64.urlsafe_b64encode(content).decode()
+
+        assert email._decode_attachment_data(data) == content
+        with patch(
+            "quackcore.integrations.google.mail.operations.email._DECODE_CHUNK_CHARS",
+            8,
+        ):
+            assert email._decode_attachment_data(data) == content
+
+    def test_fetch_messages(self, mock_gmail_service) -> None:
+        """Test fetching several messages with batched requests."""
+        logger = logging.getLogger("test_gmail")
+        messages_resource = mock_gmail_service.users().messages()
+        messages_resource.get_return = {"id": "msg", "snippet": "Test email"}
+        msg_ids = [f"msg{i}" for i in range(150)] + ["msg0"]
+
+        with patch(
+            "quackcore.integrations.google.mail.operations.email._get_message_with_retry"
+        ) as mock_get_message:
+            messages = email.fetch_messages(
+                mock_gmail_service, "me", msg_ids, 3, 0.1, 0.5, logger
+            )
+
+            # Gmail allows 100 calls per batch and duplicates are fetched once
+            assert [len(batch.requests) for batch in mock_gmail_service.batches] == [
+                100,
+                50,
+            ]
+            assert len(messages) == 150
+            assert messages["msg149"]["snippet"] == "Test email"
+            mock_get_message.assert_not_called()
+
+        # Messages that fail inside a batch are retried together in new batches
+        original_get = messages_resource.get
+        mock_gmail_service.batches.clear()
+        failures = {"bad": 2, "lost": 3}
+
+        def get_or_fail(user_id, message_id, message_format):
+            request = original_get(user_id, message_id, message_format)
+            if message_id == "deleted":
+                request.execute = MagicMock(
+                    side_effect=HttpError(
+                        resp=MagicMock(status=404), content=b"Not found"
+                    )
+                )
+            if failures.get(message_id, 0) > 0:
+                failures[message_id] -= 1
+                request.execute = MagicMock(
+                    side_effect=HttpError(
+                        resp=MagicMock(status=500), content=b"Server error"
+                    )
+                )
+            return request
+
+        with patch.object(
+            messages_resource, "get", side_effect=get_or_fail
+        ), patch(
+            "quackcore.integrations.google.mail.operations.email.time.sleep"
+        ) as mock_sleep, patch(
+            "quackcore.integrations.google.mail.operations.email.random.uniform",
+            side_effect=lambda low, high: high,
+        ):
+            messages = email.fetch_messages(
+                mock_gmail_service,
+                "me",
+                ["good", "bad", "lost", "deleted"],
+                3,
+                0.1,
+                0.5,
+                logger,
+            )
+
+            assert messages["good"]["snippet"] == "Test email"
+            assert messages["bad"]["snippet"] == "Test email"
+            assert messages["lost"] is None
+            assert messages["deleted"] is None
+            # A 404 is final, so the deleted message is never re-batched
+            assert [
+                [request_id for request_id, _ in batch.requests]
+                for batch in mock_gmail_service.batches
+            ] == [["good", "bad", "lost", "deleted"], ["bad", "lost"], ["bad", "lost"]]
+            assert [call.args[0] for call in mock_sleep.call_args_list] == [0.1, 0.2]
+
+        # A permanent failure alone doesn't wait for any retry round
+        mock_gmail_service.batches.clear()
+        with patch.object(
+            messages_resource, "get", side_effect=get_or_fail
+        ), patch(
+            "quackcore.integrations.google.mail.operations.email.time.sleep"
+        ) as mock_sleep:
+            messages = email.fetch_messages(
+                mock_gmail_service, "me", ["good", "deleted"], 3, 0.1, 0.5, logger
+            )
+
+            assert messages["deleted"] is None
+            assert len(mock_gmail_service.batches) == 1
+            mock_sleep.assert_not_called()
+
+        # Services without batch support fall back to individual gets
+        plain_service = MagicMock(spec=["users"])
+        with patch(
+            "quackcore.integrations.google.mail.operations.email._get_message_with_retry",
+            side_effect=[{"id": "msg1"}, None],
+        ) as mock_get_message:
+            messages = email.fetch_messages(
+                plain_service, "me", ["msg1", "msg2"], 3, 0.1, 0.5, logger
+            )
+
+            assert messages == {"msg1": {"id": "msg1"}, "msg2": None}
+            assert mock_get_message.call_count == 2
+
+    def test_fetch_messages_with_cache(self, mock_gmail_service) -> None:
+        """Test that cached messages are not requested again."""
+        logger = logging.getLogger("test_gmail")
+        mock_gmail_service.users().messages().get_return = {"id": "msg"}
+        cache = GmailCache(":memory:")
+        cache.set("me", "msg1", "full", {"id": "msg1", "snippet": "cached"})
+
+        messages = email.fetch_messages(
+            mock_gmail_service, "me", ["msg1", "msg2"], 3, 0.1, 0.5, logger, cache
+        )
+
+        assert messages["msg1"]["snippet"] == "cached"
+        assert messages["msg2"] == {"id": "msg"}
+        assert [
+            [request_id for request_id, _ in batch.requests]
+            for batch in mock_gmail_service.batches
+        ] == [["msg2"]]
+        assert cache.get("me", "msg2", "full") == {"id": "msg"}
+
+        # The single-message path reads from the same cache
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.execute_api_request"
+        ) as mock_execute:
+            message = email._get_message_with_retry(
+                mock_gmail_service, "me", "msg2", 3, logger, cache=cache
+            )
+            assert message == {"id": "msg"}
+            mock_execute.assert_not_called()
+
+        cache.close()
+
+    def test_download_emails_batch(self, mock_gmail_service) -> None:
+        """Test downloading several emails from one batched fetch."""
+        logger = logging.getLogger("test_gmail")
+        storage_path = "/path/to/storage"
+        message = {
+            "id": "msg1",
+            "payload": {
+                "headers": [{"name": "From", "value": "sender@example.com"}],
+                "parts": [{"mimeType": "text/html"}],
+            },
+        }
+
+        with (
+            patch(
+                "quackcore.integrations.google.mail.operations.email.fetch_messages",
+                return_value={"msg1": message, "msg2": None},
+            ) as mock_fetch,
+            patch(
+                "quackcore.integrations.google.mail.operations.email.process_message_parts",
+                return_value=("<html><body>Test content</body></html>", []),
+            ),
+            patch("quackcore.integrations.google.mail.operations.email.fs") as mock_fs,
+        ):
+            mock_fs.join_path.return_value = "/path/to/storage/email.html"
+            mock_fs.get_file_info.return_value.exists = False
+            mock_fs.write_text.return_value = MagicMock(success=True)
+
+            results = email.download_emails_batch(
+                mock_gmail_service,
+                "me",
+                ["msg1", "msg2"],
+                storage_path,
+                max_retries=3,
+                initial_delay=0.1,
+                max_delay=0.5,
+                logger=logger,
+            )
+
+            mock_fetch.assert_called_once_with(
+                mock_gmail_service,
+                "me",
+                ["msg1", "msg2"],
+                3,
+                0.1,
+                0.5,
+                logger,
+                cache=None,
+            )
+            assert [result.success for result in results] == [True, False]
+            assert results[0].content == "/path/to/storage/email.html"
+            # Without subject or sender the HTML is written unchanged
+            mock_fs.write_text.assert_called_once_with(
+                "/path/to/storage/email.html",
+                "<html><body>Test content</body></html>",
+                encoding="utf-8",
+            )
+            assert "Message msg2 could not be retrieved" in results[1].error
+
+        # A failed fetch is reported for every message
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.fetch_messages",
+            side_effect=Exception("Network down"),
+        ):
+            results = email.download_emails_batch(
+                mock_gmail_service, "me", ["msg1", "msg2"], storage_path, logger=logger
+            )
+
+            assert [result.success for result in results] == [False, False]
+            assert "Failed to download email msg2" in results[1].error
+
+    def test_download_emails_batch_same_sender(
+        self, mock_gmail_service, tmp_path
+    ) -> None:
+        """Test that messages saved in the same second get distinct files."""
+        logger = logging.getLogger("test_gmail")
+        messages = {
+            msg_id: {
+                "id": msg_id,
+                "payload": {
+                    "headers": [{"name": "From", "value": "news@x.com"}],
+                    "parts": [{"mimeType": "text/html"}],
+                },
+            }
+            for msg_id in ("msg1", "msg2", "msg3")
+        }
+
+        with (
+            patch(
+                "quackcore.integrations.google.mail.operations.email.fetch_messages",
+                return_value=messages,
+            ),
+            patch(
+                "quackcore.integrations.google.mail.operations.email.process_message_parts",
+                side_effect=lambda service, user, parts, msg_id, *args: (
+                    f"<p>{msg_id}</p>",
+                    [],
+                ),
+            ),
+            patch(
+                "quackcore.integrations.google.mail.operations.email.datetime"
+            ) as mock_dt,
+        ):
+            mock_dt.now.return_value = datetime(2023, 1, 15, 10, 30, 0)
+
+            results = email.download_emails_batch(
+                mock_gmail_service,
+                "me",
+                ["msg1", "msg2", "msg1", "msg3"],
+                str(tmp_path),
+                logger=logger,
+            )
+
+        # Duplicate IDs are saved once
+        assert len(results) == 3
+        assert all(result.success for result in results)
+        paths = [result.content for result in results]
+        assert len(set(paths)) == 3
+        assert paths[0] == str(tmp_path / "2023-01-15-103000-news-x-com.html")
+        assert paths[1] == str(tmp_path / "2023-01-15-103000-news-x-com-msg2.html")
+        for msg_id, path in zip(("msg1", "msg2", "msg3"), paths, strict=True):
+            assert Path(path).read_text(encoding="utf-8") == f"<p>{msg_id}</p>"
@@ -215,7 +215,14 @@ class TestGoogleMailService:
             assert service.gmail_service is mock_gmail_service
 
             mock_get_credentials.assert_called_once()
-            mock_init_gmail.assert_called_once_with(mock_credentials)
+            mock_init_gmail.assert_called_once_with(
+                mock_credentials, http=service.http
+            )
+            assert service.http is not None
+
+            # Closing releases the shared HTTP client
+            service.close()
+            assert service.http is None
 
         # Test config initialization failure
         with patch.object(service, "_initialize_config") as mock_init_config:
@@ -362,9 +369,8 @@ class TestGoogleMailService:
                 True,  # include_subject from config
                 False,  # include_sender from config
                 3,  # max_retries from config
-                0.5,  # initial_delay from config
-                5.0,  # max_delay from config
-                service.logger,
+                logger=service.logger,
+                cache=None,
             )
 
         # Test with error
@@ -389,3 +395,49 @@ class TestGoogleMailService:
             result = service.download_email("msg1")
             assert result.success is False
             assert "Not initialized" in result.error
+
+    def test_download_emails(self) -> None:
+        """Test downloading several emails at once."""
+        service = GoogleMailService(storage_path="/path/to/storage")
+        service._initialized = True
+        service.gmail_service = create_mock_gmail_service()
+        service.config = {
+            "gmail_user_id": "test@example.com",
+            "include_subject": True,
+            "max_retries": 3,
+        }
+
+        with patch(
+            "quackcore.integrations.google.mail.operations.email.download_emails_batch"
+        ) as mock_download:
+            mock_download.return_value = [
+                IntegrationResult.success_result(content="/path/to/storage/a.html"),
+                IntegrationResult.error_result("Message msg2 could not be retrieved"),
+            ]
+
+            result = service.download_emails(["msg1", "msg2"])
+            assert result.success is True
+            assert result.content == ["/path/to/storage/a.html"]
+            assert "Downloaded 1 of 2 emails" in result.message
+
+            mock_download.assert_called_once_with(
+                service.gmail_service,
+                "test@example.com",
+                ["msg1", "msg2"],
+                "/path/to/storage",
+                True,  # include_subject from config
+                False,  # include_sender default
+                3,  # max_retries from config
+                1.0,  # initial_delay default
+                30.0,  # max_delay default
+                service.logger,
+                cache=None,
+            )
+
+            # Every download failing is an error
+            mock_download.return_value = [
+                IntegrationResult.error_result("Message msg1 could not be retrieved")
+            ]
+            result = service.download_emails(["msg1"])
+            assert result.success is False
+            assert "Failed to download any of 1 emails" in result.error
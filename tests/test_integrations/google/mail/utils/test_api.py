@@ -35,8 +35,9 @@ class TestGmailApiUtils:
                 self.side_effect = side_effect
                 self.call_count = 0
 
-            def execute(self) -> dict[str, object]:
+            def execute(self, num_retries: int = 0) -> dict[str, object]:
                 self.call_count += 1
+                self.num_retries = num_retries
                 if self.side_effect:
                     raise self.side_effect
                 return self.return_value
@@ -52,6 +53,19 @@ class TestGmailApiUtils:
 
         assert result == {"id": "msg1", "payload": {}}
         assert mock_request.call_count == 1
+        assert mock_request.num_retries == 0
+
+        # Retries are handed to the request
+        result = execute_api_request(
+            mock_request,
+            "Failed to get message",
+            "users.messages.get",
+            num_retries=3,
+        )
+
+        assert result == {"id": "msg1", "payload": {}}
+        assert mock_request.call_count == 2
+        assert mock_request.num_retries == 3
 
         # Test with HttpError
         resp = MagicMock()
@@ -0,0 +1,109 @@
+# tests/test_integrations/google/mail/utils/test_cache.py
+"""
+Tests for the Gmail response cache.
+
+This module tests the SQLite-backed cache used to avoid refetching
+Gmail messages.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from quackcore.errors import QuackIntegrationError
+from quackcore.integrations.google.mail.utils.cache import GmailCache
+
+
+class TestGmailCache:
+    """Tests for the Gmail response cache."""
+
+    def test_get_and_set(self, tmp_path) -> None:
+        """Test storing and reading back messages."""
+        db_path = str(tmp_path / "gmail.sqlite")
+        cache = GmailCache(db_path)
+
+        assert cache.get("me", "msg1", "full") is None
+
+        cache.set("me", "msg1", "full", {"id": "msg1", "snippet": "Hello"})
+        cache.set_many("me", "full", [("msg2", {"id": "msg2"}), ("msg3", {})])
+
+        assert cache.get("me", "msg1", "full") == {"id": "msg1", "snippet": "Hello"}
+        assert cache.get("me", "msg2", "full") == {"id": "msg2"}
+        assert cache.get("me", "msg3", "full") == {}
+
+        # Keys include the user and the message format
+        assert cache.get("other", "msg1", "full") is None
+        assert cache.get("me", "msg1", "minimal") is None
+
+        # Replacing a message keeps only the newest copy
+        cache.set("me", "msg1", "full", {"id": "msg1", "snippet": "Updated"})
+        assert cache.get("me", "msg1", "full")["snippet"] == "Updated"
+        cache.close()
+
+        # Entries survive reopening the database
+        cache = GmailCache(db_path)
+        assert cache.get("me", "msg2", "full") == {"id": "msg2"}
+        assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache.close()
+
+    def test_ttl(self) -> None:
+        """Test that expired entries are ignored."""
+        cache = GmailCache(":memory:", ttl=60)
+
+        with patch(
+            "quackcore.integrations.google.mail.utils.cache.time.time",
+            return_value=1000.0,
+        ) as mock_time:
+            cache.set("me", "msg1", "full", {"id": "msg1"})
+
+            mock_time.return_value = 1060.0
+            assert cache.get("me", "msg1", "full") == {"id": "msg1"}
+
+            mock_time.return_value = 1061.0
+            assert cache.get("me", "msg1", "full") is None
+
+        cache.close()
+
+    def test_prune(self, tmp_path) -> None:
+        """Test that expired entries are deleted, including on open."""
+        db_path = str(tmp_path / "gmail.sqlite")
+        cache = GmailCache(db_path, ttl=60)
+
+        with patch(
+            "quackcore.integrations.google.mail.utils.cache.time.time",
+            return_value=1000.0,
+        ) as mock_time:
+            cache.set_many("me", "full", [("msg1", {}), ("msg2", {})])
+            mock_time.return_value = 1050.0
+            cache.set("me", "msg3", "full", {})
+
+            mock_time.return_value = 1060.0
+            assert cache.prune() == 0
+
+            mock_time.return_value = 1061.0
+            assert cache.prune() == 2
+            assert cache.get("me", "msg3", "full") == {}
+            cache.close()
+
+            # Reopening the database drops entries that expired meanwhile
+            mock_time.return_value = 2000.0
+            cache = GmailCache(db_path, ttl=60)
+            count = cache._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            assert count[0] == 0
+
+        cache.close()
+
+    def test_make_key(self) -> None:
+        """Test building cache keys."""
+        key = GmailCache.make_key("me", "msg1", "full")
+
+        assert len(key) == 32
+        assert key == GmailCache.make_key("me", "msg1", "full")
+        assert key != GmailCache.make_key("me", "msg1", "raw")
+
+    def test_open_failure(self, tmp_path) -> None:
+        """Test that an unusable database path raises an integration error."""
+        with pytest.raises(QuackIntegrationError) as excinfo:
+            GmailCache(str(tmp_path / "missing" / "gmail.sqlite"))
+
+        assert "Failed to open Gmail cache" in str(excinfo.value)
@@ -12,10 +12,12 @@ from tests.test_integrations.pandoc.operations.test_html_to_md import (
 from tests.test_integrations.pandoc.operations.test_md_to_docx import (
     TestMarkdownToDocxOperations,
 )
+from tests.test_integrations.pandoc.operations.test_server import TestPandocServer
 from tests.test_integrations.pandoc.operations.test_utils import TestPandocUtilities
 
 __all__ = [
     "TestHtmlToMarkdownOperations",
     "TestMarkdownToDocxOperations",
+    "TestPandocServer",
     "TestPandocUtilities",
 ]
@@ -173,7 +173,7 @@ class TestHtmlToMarkdownOperations:
         output_path = Path("/path/to/output/file.md")
         input_path = Path("/path/to/file.html")
         original_size = 1024
-        attempt_start = time.time() - 1  # 1 second ago
+        attempt_start = time.perf_counter() - 1  # 1 second ago
 
         # Mock specific parts instead of the whole function
         # Create a proper file_info mock with a fixed size
@@ -3,23 +3,32 @@
 Tests for Markdown to DOCX conversion operations.
 """
 
+import threading
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from quackcore.errors import QuackIntegrationError
+from quackcore.errors import QuackIntegrationError, QuackUnrecoverableError
 from quackcore.fs.results import FileInfoResult, OperationResult, ReadResult, \
     WriteResult
+from quackcore.integrations.core.results import IntegrationResult
 from quackcore.integrations.pandoc.config import PandocConfig
 from quackcore.integrations.pandoc.models import ConversionDetails, ConversionMetrics
 from quackcore.integrations.pandoc.operations.md_to_docx import (
     _check_docx_metadata,
+    _check_docx_package,
     _convert_markdown_to_docx_once,
+    _fast_stat,
     _get_conversion_output,
+    _merge_metrics,
     _validate_markdown_input,
+    clear_output_dir_cache,
     convert_markdown_to_docx,
+    convert_markdown_to_docx_batch,
     validate_conversion,
 )
 
@@ -42,6 +51,7 @@ class TestMarkdownToDocxOperations:
     @pytest.fixture
     def mock_fs(self):
         """Fixture to mock fs module."""
+        clear_output_dir_cache()
         with patch("quackcore.integrations.pandoc.operations.md_to_docx.fs") as mock_fs:
             # Setup default behavior for file info checks
             file_info = FileInfoResult(
@@ -51,7 +61,7 @@ class TestMarkdownToDocxOperations:
                 is_file=True,
                 size=512,  # Use 512 as expected by the test
             )
-            mock_fs.service.get_file_info.return_value = file_info
+            mock_fs.get_file_info.return_value = file_info
 
             # Setup default behavior for directory creation
             dir_result = OperationResult(
@@ -68,7 +78,7 @@ class TestMarkdownToDocxOperations:
                 content="# Test\n\nContent",
                 encoding="utf-8",
             )
-            mock_fs.service.read_text.return_value = read_result
+            mock_fs.read_text.return_value = read_result
 
             # Setup default behavior for write_text
             write_result = WriteResult(
@@ -83,40 +93,56 @@ class TestMarkdownToDocxOperations:
 
             yield mock_fs
 
-    def test_validate_markdown_input(self, mock_fs):
+    def test_fast_stat(self, tmp_path):
+        """Test checking file existence and size with a single stat."""
+        path = tmp_path / "file.md"
+        path.write_bytes(b"x" * 512)
+
+        assert _fast_stat(path) == (True, 512)
+        assert _fast_stat(tmp_path / "missing.md") == (False, 0)
+
+    def test_validate_markdown_input(self, mock_fs, tmp_path):
         """Test validating Markdown input file."""
-        markdown_path = Path("/path/to/file.md")
+        markdown_path = tmp_path / "file.md"
+        markdown_path.write_text("# Test\n\nContent", encoding="utf-8")
 
         # Test with valid input
         original_size = _validate_markdown_input(markdown_path)
 
-        assert original_size == 512
-        mock_fs.service.get_file_info.assert_called_with(markdown_path)
-        mock_fs.service.read_text.assert_called_with(markdown_path, encoding="utf-8")
+        assert original_size == markdown_path.stat().st_size
+        mock_fs.get_file_info.assert_not_called()
+        mock_fs.read_text.assert_not_called()
 
-        # Test with file not found
-        mock_fs.service.get_file_info.return_value.exists = False
+        # Test with content that only starts after a long run of whitespace
+        markdown_path.write_text(" " * 10000 + "# Late heading", encoding="utf-8")
+        assert _validate_markdown_input(markdown_path) == 10014
 
+        # Test with file not found
         with pytest.raises(QuackIntegrationError) as excinfo:
-            _validate_markdown_input(markdown_path)
+            _validate_markdown_input(tmp_path / "missing.md")
 
         assert "Input file not found" in str(excinfo.value)
 
         # Test with empty content
-        mock_fs.service.get_file_info.return_value.exists = True
-        mock_fs.service.read_text.return_value.content = ""
+        markdown_path.write_text("", encoding="utf-8")
 
         with pytest.raises(QuackIntegrationError) as excinfo:
             _validate_markdown_input(markdown_path)
 
         assert "Markdown file is empty" in str(excinfo.value)
 
-        # Test with read error
-        mock_fs.service.read_text.side_effect = Exception("Read error")
+        # Test with whitespace-only content spanning several read chunks
+        markdown_path.write_text(" \n\t" * 5000, encoding="utf-8")
 
         with pytest.raises(QuackIntegrationError) as excinfo:
             _validate_markdown_input(markdown_path)
 
+        assert "Markdown file is empty" in str(excinfo.value)
+
+        # Test with read error
+        with pytest.raises(QuackIntegrationError) as excinfo:
+            _validate_markdown_input(tmp_path)
+
         assert "Could not read Markdown file" in str(excinfo.value)
 
     def test_convert_markdown_to_docx_once(self, config, mock_fs):
@@ -149,7 +175,14 @@ class TestMarkdownToDocxOperations:
                     extra_args=["--reference-doc=template.docx"],
                 )
 
+        # The directory is only created once per process
+        mock_fs.create_directory.reset_mock()
+        with patch("pypandoc.convert_file"):
+            _convert_markdown_to_docx_once(markdown_path, output_path, config)
+        mock_fs.create_directory.assert_not_called()
+
         # Test directory creation failure
+        clear_output_dir_cache()
         mock_fs.create_directory.return_value.success = False
         mock_fs.create_directory.return_value.error = "Permission denied"
 
@@ -158,6 +191,11 @@ class TestMarkdownToDocxOperations:
 
         assert "Failed to create output directory" in str(excinfo.value)
 
+        # A failed creation is not remembered
+        with pytest.raises(QuackIntegrationError):
+            _convert_markdown_to_docx_once(markdown_path, output_path, config)
+        assert mock_fs.create_directory.call_count == 2
+
         # Test conversion error
         mock_fs.create_directory.return_value.success = True
 
@@ -174,14 +212,15 @@ class TestMarkdownToDocxOperations:
 
                 assert "Pandoc conversion failed" in str(excinfo.value)
 
-    def test_get_conversion_output(self, mock_fs):
+    def test_get_conversion_output(self, tmp_path):
         """Test retrieving conversion timing and output file size."""
-        output_path = Path("/path/to/output/file.docx")
-        start_time = time.time() - 2  # 2 seconds ago
+        output_path = tmp_path / "file.docx"
+        output_path.write_bytes(b"x" * 512)
+        start_time = time.perf_counter() - 2  # 2 seconds ago
 
         # Test successful retrieval
         with patch(
-                "quackcore.integrations.pandoc.operations.md_to_docx.time.time"
+                "quackcore.integrations.pandoc.operations.md_to_docx.time.perf_counter"
         ) as mock_time:
             mock_time.return_value = start_time + 2  # 2 seconds have passed
 
@@ -190,14 +229,11 @@ class TestMarkdownToDocxOperations:
             )
 
             assert conversion_time == 2.0
-            assert output_size == 512  # From mock_fs.service.get_file_info
-            mock_fs.service.get_file_info.assert_called_with(output_path)
-
-        # Test with file info error
-        mock_fs.service.get_file_info.return_value.success = False
+            assert output_size == 512
 
+        # Test with missing output file
         with pytest.raises(QuackIntegrationError) as excinfo:
-            _get_conversion_output(output_path, start_time)
+            _get_conversion_output(tmp_path / "missing.docx", start_time)
 
         assert "Failed to get info for converted file" in str(excinfo.value)
 
@@ -248,6 +284,10 @@ class TestMarkdownToDocxOperations:
                             assert isinstance(result.content[1], ConversionDetails)
                             assert result.content[1].source_format == "markdown"
                             assert result.content[1].target_format == "docx"
+                            assert result.content[1].conversion_time == 1.0
+                            assert result.content[1].output_size == 10240
+                            assert result.content[1].input_size == 512
+                            assert result.content[1].validation_errors == []
                             assert metrics.successful_conversions == 1
                             mock_validate.assert_called_once_with(markdown_path)
                             mock_convert.assert_called_once_with(
@@ -255,6 +295,11 @@ class TestMarkdownToDocxOperations:
                             )
                             mock_output.assert_called_once()
                             mock_validate_out.assert_called_once()
+                            # The size was already checked before validation
+                            assert (
+                                mock_validate_out.call_args.kwargs["check_size"]
+                                is False
+                            )
                             mock_track.assert_called_once()
 
         # Reset metrics for next test
@@ -408,6 +453,271 @@ class TestMarkdownToDocxOperations:
             assert "Failed to convert Markdown to DOCX" in result.error
             assert metrics.failed_conversions == 1
 
+    def test_convert_markdown_to_docx_stats_output_once(
+            self, config, metrics, mock_fs, tmp_path
+    ):
+        """Test that the output file is only stat'd once per attempt."""
+        import quackcore.integrations.pandoc.operations.md_to_docx as md_to_docx
+
+        markdown_path = tmp_path / "file.md"
+        markdown_path.write_text("# Test\n\nContent", encoding="utf-8")
+        output_path = tmp_path / "file.docx"
+        output_path.write_bytes(b"x" * 10240)
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._fast_stat",
+                wraps=md_to_docx._fast_stat,
+        ) as mock_stat, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once"
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+            return_value=[],
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure",
+            return_value=(True, []),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_metadata"
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.track_metrics"
+        ):
+            result = convert_markdown_to_docx(
+                markdown_path, output_path, config, metrics
+            )
+
+        assert result.success is True
+        output_calls = [
+            call for call in mock_stat.call_args_list
+            if call.args == (output_path,)
+        ]
+        assert len(output_calls) == 1
+        mock_fs.get_file_info.assert_not_called()
+
+    def test_convert_markdown_to_docx_unrecoverable(self, config, metrics):
+        """Test that unrecoverable errors fail without retrying."""
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._validate_markdown_input",
+                return_value=512,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once",
+            side_effect=QuackUnrecoverableError("Pandoc conversion failed: bad option"),
+        ) as mock_convert, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.time.sleep"
+        ) as mock_sleep:
+            result = convert_markdown_to_docx(
+                markdown_path, output_path, config, metrics
+            )
+
+        assert result.success is False
+        assert "bad option" in result.error
+        assert mock_convert.call_count == 1
+        mock_sleep.assert_not_called()
+        assert metrics.failed_conversions == 1
+        assert str(markdown_path) in metrics.errors
+
+        # Pandoc failures with an unrecoverable exit code are re-raised as such
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx.fs"
+        ) as mock_fs, patch("pypandoc.convert_file") as mock_pandoc:
+            mock_fs.create_directory.return_value.success = True
+            mock_pandoc.side_effect = RuntimeError(
+                'Pandoc died with exitcode "21" during conversion: Unknown reader'
+            )
+
+            with pytest.raises(QuackUnrecoverableError):
+                _convert_markdown_to_docx_once(markdown_path, output_path, config)
+
+    def test_convert_markdown_to_docx_size_failure(self, config, metrics):
+        """Test that undersized output fails without rerunning pandoc."""
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._validate_markdown_input",
+                return_value=512,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once"
+        ) as mock_convert, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._get_conversion_output",
+            return_value=(1.0, 10),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_conversion"
+        ) as mock_validate_out, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.time.sleep"
+        ) as mock_sleep:
+            result = convert_markdown_to_docx(
+                markdown_path, output_path, config, metrics
+            )
+
+        assert result.success is False
+        assert "below the minimum threshold" in result.error
+        assert mock_convert.call_count == 1
+        mock_validate_out.assert_not_called()
+        mock_sleep.assert_not_called()
+        assert metrics.failed_conversions == 1
+        assert str(markdown_path) in metrics.errors
+
+    def test_convert_markdown_to_docx_batch(self, config, metrics):
+        """Test converting several Markdown files in one batch call."""
+        jobs = [
+            (Path("/path/to/a.md"), Path("/path/to/output/a.docx")),
+            (Path("/path/to/b.md"), Path("/path/to/output/b.docx")),
+        ]
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx.convert_markdown_to_docx"
+        ) as mock_convert:
+            mock_convert.side_effect = lambda md, out, cfg, m: IntegrationResult.success_result(
+                (out, ConversionDetails())
+            )
+
+            results = convert_markdown_to_docx_batch(jobs, config, metrics)
+
+            assert [r.content[0] for r in results] == [out for _, out in jobs]
+            assert mock_convert.call_count == 2
+            for markdown_path, output_path in jobs:
+                mock_convert.assert_any_call(markdown_path, output_path, config, metrics)
+
+        # An empty batch does nothing
+        assert convert_markdown_to_docx_batch([], config) == []
+
+    def test_convert_markdown_to_docx_batch_parallel(self, config, metrics):
+        """Test that parallel batches keep job order and merge metrics."""
+        jobs = [
+            (Path(f"/path/to/file{i}.md"), Path(f"/path/to/output/file{i}.docx"))
+            for i in range(40)
+        ]
+        caller = threading.current_thread()
+        merge_threads = set()
+
+        def fake_convert(markdown_path, output_path, cfg, task_metrics, executor):
+            # Every task must get its own tracker, never the shared one
+            assert task_metrics is not metrics
+            # The pandoc step runs on a separate conversion pool
+            assert executor is not None
+            task_metrics.total_attempts += 1
+            if markdown_path.name.endswith("2.md"):
+                task_metrics.failed_conversions += 1
+                task_metrics.errors[str(markdown_path)] = "boom"
+                return IntegrationResult.error_result("boom")
+            task_metrics.successful_conversions += 1
+            return IntegrationResult.success_result((output_path, ConversionDetails()))
+
+        real_merge = _merge_metrics
+
+        def tracking_merge(target, source):
+            merge_threads.add(threading.current_thread())
+            real_merge(target, source)
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx.convert_markdown_to_docx",
+                side_effect=fake_convert,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._merge_metrics",
+            side_effect=tracking_merge,
+        ):
+            results = convert_markdown_to_docx_batch(
+                jobs, config, metrics, max_workers=4
+            )
+
+        failed = {i for i in range(40) if i % 10 == 2}
+        assert [r.success for r in results] == [i not in failed for i in range(40)]
+        assert results[0].content[0] == jobs[0][1]
+        assert metrics.total_attempts == 40
+        assert metrics.successful_conversions == 36
+        assert metrics.failed_conversions == 4
+        assert metrics.errors == {str(jobs[i][0]): "boom" for i in failed}
+        # Only the calling thread ever touches the shared tracker
+        assert merge_threads == {caller}
+
+    def test_convert_markdown_to_docx_with_executor(self, config, metrics):
+        """Test that the pandoc step is submitted to the conversion executor."""
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+        calling_thread = threading.current_thread()
+        conversion_threads = []
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._validate_markdown_input",
+                return_value=512,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once",
+            side_effect=lambda *args: conversion_threads.append(
+                threading.current_thread()
+            ),
+        ) as mock_convert, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._get_conversion_output",
+            return_value=(1.0, 10240),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_conversion",
+            side_effect=[["DOCX validation failed"], []],
+        ) as mock_validate_out, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.track_metrics"
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.time.sleep"
+        ):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                result = convert_markdown_to_docx(
+                    markdown_path, output_path, config, metrics, executor
+                )
+
+        assert result.success is True
+        # Retries go through the executor too
+        assert mock_convert.call_count == 2
+        assert mock_validate_out.call_count == 2
+        assert all(thread is not calling_thread for thread in conversion_threads)
+
+        # Conversion errors raised on the executor are handled like direct ones
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._validate_markdown_input",
+                return_value=512,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once",
+            side_effect=QuackUnrecoverableError("Pandoc conversion failed: bad option"),
+        ):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                result = convert_markdown_to_docx(
+                    markdown_path, output_path, config, metrics, executor
+                )
+
+        assert result.success is False
+        assert "bad option" in result.error
+
+    def test_conversion_time_excludes_queue_wait(self, config, metrics):
+        """Test that time spent queued in the executor is not reported."""
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._validate_markdown_input",
+                return_value=512,
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._convert_markdown_to_docx_once",
+            side_effect=lambda *args: time.sleep(0.05),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._fast_stat",
+            return_value=(True, 10240),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_conversion",
+            return_value=[],
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.track_metrics"
+        ) as mock_track:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Keep the only worker busy so the conversion has to queue
+                executor.submit(time.sleep, 0.3)
+                result = convert_markdown_to_docx(
+                    markdown_path, output_path, config, metrics, executor
+                )
+
+        assert result.success is True
+        assert 0.05 <= result.content[1].conversion_time < 0.3
+        start_time = mock_track.call_args.args[1]
+        end_time = mock_track.call_args.kwargs["end_time"]
+        assert end_time - start_time == result.content[1].conversion_time
+
     def test_validate_conversion(self, mock_fs, config):
         """Test validating Markdown to DOCX conversion."""
         output_path = Path("/path/to/output/file.docx")
@@ -417,22 +727,11 @@ class TestMarkdownToDocxOperations:
         # Make sure validation.verify_structure is True for this test
         config.validation.verify_structure = True
 
-        # Mock file info for output file with correct size parameter
+        # Mock the output file stat with the expected size
         with patch(
-                "quackcore.integrations.pandoc.operations.md_to_docx.fs") as patched_fs:
-            # Create a proper FileInfoResult with size 10240
-            output_info = FileInfoResult(
-                success=True,
-                path=str(output_path),
-                exists=True,
-                is_file=True,
-                size=10240,  # Use the expected size for the test
-            )
-            patched_fs.service.get_file_info.return_value = output_info
-
-            # Make sure output file seems to exist
-            patched_fs.path_exists = lambda p: True  # Simple mock for path_exists
-
+                "quackcore.integrations.pandoc.operations.md_to_docx._fast_stat",
+                return_value=(True, 10240),
+        ) as mock_stat:
             # Test valid conversion
             with patch(
                     "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
@@ -453,17 +752,22 @@ class TestMarkdownToDocxOperations:
                                 "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_metadata"
                         ) as mock_metadata:
                             # Force the Path.exists() method to return True
-                            with patch.object(Path, 'exists', return_value=True):
+                            with patch.object(
+                                    Path, 'exists', return_value=True
+                            ), patch(
+                                "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+                                return_value=[],
+                            ):
                                 validation_errors = validate_conversion(
                                     output_path, input_path, original_size, config
                                 )
 
                                 assert len(validation_errors) == 0
                                 mock_size.assert_called_with(
-                                    output_info.size, config.validation.min_file_size
+                                    10240, config.validation.min_file_size
                                 )
                                 mock_ratio.assert_called_with(
-                                    output_info.size,
+                                    10240,
                                     original_size,
                                     config.validation.conversion_ratio_threshold,
                                 )
@@ -475,144 +779,311 @@ class TestMarkdownToDocxOperations:
                                     config.validation.check_links
                                 )
 
-        # Test with output file not found
-        mock_fs.service.get_file_info.return_value.exists = False
+            # Test with output file not found
+            mock_stat.return_value = (False, 0)
 
-        validation_errors = validate_conversion(
-            output_path, input_path, original_size, config
-        )
-
-        assert len(validation_errors) == 1
-        assert "Output file does not exist" in validation_errors[0]
+            validation_errors = validate_conversion(
+                output_path, input_path, original_size, config
+            )
 
-        # Test with file size check failure
-        mock_fs.service.get_file_info.return_value.exists = True
+            assert len(validation_errors) == 1
+            assert "Output file does not exist" in validation_errors[0]
 
-        with patch(
-                "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
-        ) as mock_size:
-            mock_size.return_value = (False, ["File size is below threshold"])
+            # Test with file size check failure
+            mock_stat.return_value = (True, 10240)
 
+            # Keep the structure check out of the size and ratio checks below
             with patch(
-                    "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
-            ) as mock_ratio:
-                mock_ratio.return_value = (True, [])
+                    "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+                    return_value=[],
+            ), patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure",
+                return_value=(True, []),
+            ) as mock_structure, patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_metadata"
+            ):
+                with patch(
+                        "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
+                ) as mock_size:
+                    mock_size.return_value = (False, ["File size is below threshold"])
 
-                validation_errors = validate_conversion(
-                    output_path, input_path, original_size, config
-                )
+                    with patch(
+                            "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
+                    ) as mock_ratio:
+                        mock_ratio.return_value = (True, [])
 
-                assert len(validation_errors) == 1
-                assert "File size is below threshold" in validation_errors[0]
+                        validation_errors = validate_conversion(
+                            output_path, input_path, original_size, config
+                        )
 
-        # Test with conversion ratio check failure
-        with patch(
-                "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
-        ) as mock_size:
-            mock_size.return_value = (True, [])
+                        assert len(validation_errors) == 1
+                        assert "File size is below threshold" in validation_errors[0]
+                        # The file is already rejected, so it isn't unpacked
+                        mock_structure.assert_not_called()
+
+                        # Unless every error is requested
+                        config.validation.always_check_structure = True
+                        mock_structure.return_value = (
+                            False,
+                            ["DOCX document has no paragraphs"],
+                        )
+                        validation_errors = validate_conversion(
+                            output_path, input_path, original_size, config
+                        )
+                        config.validation.always_check_structure = False
+                        mock_structure.return_value = (True, [])
 
-            with patch(
-                    "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
-            ) as mock_ratio:
-                mock_ratio.return_value = (
-                    False,
-                    ["Conversion ratio is below threshold"],
-                )
+                        assert len(validation_errors) == 2
+                        assert "DOCX document has no paragraphs" in validation_errors[1]
 
-                validation_errors = validate_conversion(
-                    output_path, input_path, original_size, config
-                )
+                # Test with conversion ratio check failure
+                with patch(
+                        "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
+                ) as mock_size:
+                    mock_size.return_value = (True, [])
 
-                assert len(validation_errors) == 1
-                assert "Conversion ratio is below threshold" in validation_errors[0]
+                    with patch(
+                            "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
+                    ) as mock_ratio:
+                        mock_ratio.return_value = (
+                            False,
+                            ["Conversion ratio is below threshold"],
+                        )
 
-        # Test with DOCX structure validation failure
-        with patch(
-                "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
-        ) as mock_size:
-            mock_size.return_value = (True, [])
+                        validation_errors = validate_conversion(
+                            output_path, input_path, original_size, config
+                        )
+
+                        assert len(validation_errors) == 1
+                        assert "Conversion ratio is below threshold" in validation_errors[0]
 
+            # Test with DOCX structure validation failure
             with patch(
-                    "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
-            ) as mock_ratio:
-                mock_ratio.return_value = (True, [])
+                    "quackcore.integrations.pandoc.operations.md_to_docx.check_file_size"
+            ) as mock_size:
+                mock_size.return_value = (True, [])
 
                 with patch(
-                        "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure"
-                ) as mock_validate:
-                    mock_validate.return_value = (
-                        False,
-                        ["DOCX document has no paragraphs"],
-                    )
-
-                    # Force the Path.exists() method to return True
-                    with patch.object(Path, 'exists', return_value=True):
-                        validation_errors = validate_conversion(
-                            output_path, input_path, original_size, config
+                        "quackcore.integrations.pandoc.operations.md_to_docx.check_conversion_ratio"
+                ) as mock_ratio:
+                    mock_ratio.return_value = (True, [])
+
+                    with patch(
+                            "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure"
+                    ) as mock_validate:
+                        mock_validate.return_value = (
+                            False,
+                            ["DOCX document has no paragraphs"],
                         )
 
-                        assert len(validation_errors) == 1
-                        assert "DOCX document has no paragraphs" in validation_errors[0]
+                        # Force the Path.exists() method to return True
+                        with patch.object(
+                                Path, 'exists', return_value=True
+                        ), patch(
+                            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+                            return_value=[],
+                        ):
+                            validation_errors = validate_conversion(
+                                output_path, input_path, original_size, config
+                            )
 
-    def test_check_docx_metadata(self, mock_fs):
-        """Test checking DOCX metadata for references to the source file."""
-        import quackcore.integrations.pandoc.operations.md_to_docx as md_to_docx
+                            assert len(validation_errors) == 1
+                            assert "DOCX document has no paragraphs" in validation_errors[0]
 
+    def test_validate_conversion_with_known_output_size(self, mock_fs, config):
+        """Test that a known output size skips stat'ing the output file."""
         output_path = Path("/path/to/output/file.docx")
-        source_path = Path("/path/to/input.md")
-        check_links = True
+        input_path = Path("/path/to/file.md")
 
-        # Test when python-docx is not available
-        # Instead of patching the imported module which doesn't exist,
-        # we can patch the import itself to raise ImportError
-        with patch('importlib.import_module',
-                   side_effect=ImportError("No module named 'docx'")):
-            # Should not raise an exception, just log and return
-            md_to_docx._check_docx_metadata(output_path, source_path, check_links)
-            # No assertions needed, just testing that it doesn't raise an exception
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+                return_value=[],
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure",
+            return_value=(True, []),
+        ) as mock_validate, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_metadata"
+        ), patch.object(Path, "exists") as mock_exists:
+            validation_errors = validate_conversion(
+                output_path, input_path, 512, config, output_size=10240
+            )
 
-        # For testing with python-docx available, we need to make a few changes
-        # Test with source filename in title
-        docx_module = MagicMock()
-        mock_document_class = MagicMock()
+            assert validation_errors == []
+            mock_fs.get_file_info.assert_not_called()
+            mock_exists.assert_not_called()
+            mock_validate.assert_called_once_with(
+                output_path, config.validation.check_links
+            )
+
+            # An empty output skips the structure check
+            mock_validate.reset_mock()
+            validation_errors = validate_conversion(
+                output_path, input_path, 512, config, output_size=0
+            )
+
+            assert len(validation_errors) == 2
+            mock_validate.assert_not_called()
+
+        # Size checks the caller already ran are skipped
+        with patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_output_size"
+        ) as mock_size, patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_package",
+            return_value=[],
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure",
+            return_value=(True, []),
+        ), patch(
+            "quackcore.integrations.pandoc.operations.md_to_docx._check_docx_metadata"
+        ):
+            validation_errors = validate_conversion(
+                output_path,
+                input_path,
+                512,
+                config,
+                output_size=10240,
+                check_size=False,
+            )
+
+            assert validation_errors == []
+            mock_size.assert_not_called()
+
+    @staticmethod
+    def _write_docx(path, core_xml=None):
+        """Write a minimal DOCX package, optionally with a core properties part."""
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", "<w:document/>")
+            if core_xml is not None:
+                archive.writestr("docProps/core.xml", core_xml)
+        return path
+
+    @staticmethod
+    def _core_xml(title="", subject="", description="", keywords=""):
+        """Build a docProps/core.xml payload."""
+        return (
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/'
+            'package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f"<dc:title>{title}</dc:title>"
+            f"<dc:subject>{subject}</dc:subject>"
+            f"<dc:description>{description}</dc:description>"
+            f"<cp:keywords>{keywords}</cp:keywords>"
+            "</cp:coreProperties>"
+        )
+
+    def test_check_docx_package(self, tmp_path):
+        """Test the zip level DOCX package check."""
+        content_types = '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>'
+
+        valid = tmp_path / "valid.docx"
+        with zipfile.ZipFile(valid, "w") as archive:
+            archive.writestr("[Content_Types].xml", content_types)
+            archive.writestr("word/document.xml", "<w:document/>")
+        assert _check_docx_package(valid) == []
+
+        # Missing main document part
+        missing = tmp_path / "missing.docx"
+        with zipfile.ZipFile(missing, "w") as archive:
+            archive.writestr("[Content_Types].xml", content_types)
+        errors = _check_docx_package(missing)
+        assert errors == ["DOCX package is missing word/document.xml"]
+
+        # Malformed content types part
+        malformed = tmp_path / "malformed.docx"
+        with zipfile.ZipFile(malformed, "w") as archive:
+            archive.writestr("[Content_Types].xml", "<Types>")
+            archive.writestr("word/document.xml", "<w:document/>")
+        assert "DOCX package is invalid" in _check_docx_package(malformed)[0]
+
+        # Not a zip file at all, which skips the python-docx parse
+        not_zip = tmp_path / "not_zip.docx"
+        not_zip.write_bytes(b"not a zip archive" * 10)
+        config = PandocConfig()
+        with patch(
+                "quackcore.integrations.pandoc.operations.md_to_docx.validate_docx_structure"
+        ) as mock_validate:
+            errors = validate_conversion(
+                not_zip, Path("/path/to/file.md"), 100, config, output_size=170
+            )
+
+        assert len(errors) == 1
+        assert "DOCX package is invalid" in errors[0]
+        mock_validate.assert_not_called()
 
-        mock_doc_with_source = MagicMock()
-        mock_core_props_with_source = MagicMock()
-        mock_core_props_with_source.title = "input.md - converted document"
-        mock_core_props_with_source.comments = None
-        mock_core_props_with_source.subject = None
-        mock_doc_with_source.core_properties = mock_core_props_with_source
-        mock_document_class.return_value = mock_doc_with_source
+    def test_check_docx_metadata(self, tmp_path):
+        """Test checking DOCX metadata for references to the source file."""
+        import quackcore.integrations.pandoc.operations.md_to_docx as md_to_docx
 
-        # Add Document to the mocked docx module
-        docx_module.Document = mock_document_class
+        source_path = Path("/path/to/input.md")
+        check_links = True
 
-        with patch.dict('sys.modules', {'docx': docx_module}):
-            # Should not log any warnings
+        # Test with source filename in title
+        output_path = self._write_docx(
+            tmp_path / "title.docx",
+            self._core_xml(title="input.md - converted document"),
+        )
+        with patch.object(md_to_docx, "_Document") as mock_document_class:
             with patch.object(md_to_docx.logger, 'debug') as mock_logger:
                 md_to_docx._check_docx_metadata(output_path, source_path, check_links)
                 mock_logger.assert_not_called()
+                # Core properties are read straight from the zip part
+                mock_document_class.assert_not_called()
 
-        # Test with source filename not in metadata
-        docx_module = MagicMock()
-        mock_document_class = MagicMock()
+        # Test with source filename only in the keywords
+        output_path = self._write_docx(
+            tmp_path / "keywords.docx", self._core_xml(keywords="input.md")
+        )
+        with patch.object(md_to_docx.logger, 'debug') as mock_logger:
+            md_to_docx._check_docx_metadata(output_path, source_path, check_links)
+            mock_logger.assert_not_called()
 
-        mock_doc_without_source = MagicMock()
-        mock_core_props_without_source = MagicMock()
-        # Set properties that don't contain the source filename
-        mock_core_props_without_source.title = "Some document"
-        mock_core_props_without_source.comments = "Some comments"
-        mock_core_props_without_source.subject = "Some subject"
-        mock_doc_without_source.core_properties = mock_core_props_without_source
-        mock_document_class.return_value = mock_doc_without_source
+        # Test with source filename not in metadata
+        output_path = self._write_docx(
+            tmp_path / "missing.docx",
+            self._core_xml(
+                title="Some document",
+                subject="Some subject",
+                description="Some comments",
+            ),
+        )
+        with patch.object(md_to_docx.logger, 'debug') as mock_logger:
+            md_to_docx._check_docx_metadata(output_path, source_path, check_links)
+            mock_logger.assert_called_once()
+            assert "Source file reference missing" in \
+                   mock_logger.call_args[0][0]
 
-        # Add Document to the mocked docx module
-        docx_module.Document = mock_document_class
+        # Test that nothing is opened when links are not checked
+        with patch.object(md_to_docx, "_read_core_properties") as mock_read:
+            with patch.object(md_to_docx.logger, 'debug') as mock_logger:
+                md_to_docx._check_docx_metadata(output_path, source_path, False)
+                mock_read.assert_not_called()
+                mock_logger.assert_not_called()
 
-        with patch.dict('sys.modules', {'docx': docx_module}):
-            # Should log a warning
+        # Test falling back to python-docx without a core properties part
+        output_path = self._write_docx(tmp_path / "no_core.docx")
+        mock_document_class = MagicMock()
+        mock_core_props = MagicMock()
+        mock_core_props.title = "input.md - converted document"
+        mock_core_props.subject = None
+        mock_core_props.comments = None
+        mock_core_props.keywords = None
+        mock_document_class.return_value.core_properties = mock_core_props
+
+        with patch.object(md_to_docx, "_Document", mock_document_class):
             with patch.object(md_to_docx.logger, 'debug') as mock_logger:
                 md_to_docx._check_docx_metadata(output_path, source_path, check_links)
-                mock_logger.debug.assert_called_once()
-                assert "Source file reference missing" in \
-                       mock_logger.debug.call_args[0][0]
\ No newline at end of file
+                mock_document_class.assert_called_once_with(str(output_path))
+                mock_logger.assert_not_called()
+
+        # Test when python-docx is not available for the fallback
+        with patch.object(md_to_docx, "_Document", None):
+            # Should not raise an exception, just log and return
+            md_to_docx._check_docx_metadata(output_path, source_path, check_links)
+
+        # Test with a file that is not a zip archive
+        not_a_docx = tmp_path / "broken.docx"
+        not_a_docx.write_text("not a zip", encoding="utf-8")
+        with patch.object(md_to_docx.logger, 'debug') as mock_logger:
+            md_to_docx._check_docx_metadata(not_a_docx, source_path, check_links)
+            assert "Could not check document metadata" in \
+                   mock_logger.call_args[0][0]
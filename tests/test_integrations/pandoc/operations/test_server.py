@@ -0,0 +1,285 @@
+# tests/test_integrations/pandoc/operations/test_server.py
+"""
+Tests for the shared pandoc server used by conversion operations.
+"""
+
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from quackcore.errors import QuackIntegrationError, QuackUnrecoverableError
+from quackcore.fs.results import OperationResult, ReadResult, WriteResult
+from quackcore.integrations.pandoc.config import PandocConfig
+from quackcore.integrations.pandoc.operations import md_to_docx, server
+from quackcore.integrations.pandoc.operations.server import (
+    PandocServer,
+    get_pandoc_server,
+    server_options,
+    shutdown_pandoc_server,
+)
+
+
+class _FakePandocHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the pandoc server HTTP API."""
+
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    requests: list[dict] = []
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._reply(200, {"version": "3.1"})
+
+    def do_POST(self) -> None:
+        self.connections.add(self.client_address[1])
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(payload)
+        if payload["to"] == "bogus":
+            self._reply(500, {"error": "Unknown output format bogus"})
+            return
+        if payload["to"] == "broken":
+            self._reply(200, {"error": "Could not parse document"})
+            return
+        output = base64.b64encode(b"PK docx " + payload["text"].encode()).decode()
+        self._reply(200, {"output": output, "base64": True, "messages": []})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestPandocServer:
+    """Tests for the shared pandoc server."""
+
+    @pytest.fixture(autouse=True)
+    def reset_server(self):
+        """Make sure every test starts without a shared server."""
+        shutdown_pandoc_server()
+        yield
+        shutdown_pandoc_server()
+
+    @pytest.fixture
+    def fake_server(self):
+        """Run a fake pandoc server and return a PandocServer pointed at it."""
+        _FakePandocHandler.connections = set()
+        _FakePandocHandler.requests = []
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakePandocHandler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+
+        process = MagicMock()
+        process.poll.return_value = None
+        pandoc_server = PandocServer(process, httpd.server_address[1])
+        yield pandoc_server
+
+        pandoc_server._connection().close()
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+    def test_server_options(self):
+        """Test translating pandoc arguments into server options."""
+        assert server_options(
+            ["--wrap=none", "--standalone", "--markdown-headings=atx"]
+        ) == {"wrap": "none", "standalone": True, "markdown-headings": "atx"}
+        assert server_options([]) == {}
+
+        # Arguments the server can't honour force the pypandoc path
+        assert server_options(["--wrap=none", "--resource-path=/tmp"]) is None
+        assert server_options(["--reference-doc=template.docx"]) is None
+        assert server_options(["--wrap"]) is None
+
+    def test_convert(self, fake_server):
+        """Test converting through the server over a reused connection."""
+        first = fake_server.convert("# One", "markdown", "docx", {"wrap": "none"})
+        second = fake_server.convert("# Two", "markdown", "docx", {})
+
+        assert first == b"PK docx # One"
+        assert second == b"PK docx # Two"
+        assert _FakePandocHandler.requests[0] == {
+            "text": "# One",
+            "from": "markdown",
+            "to": "docx",
+            "wrap": "none",
+        }
+        # Both conversions went over the same keep-alive connection
+        assert len(_FakePandocHandler.connections) == 1
+
+        with pytest.raises(QuackIntegrationError) as excinfo:
+            fake_server.convert("# Three", "markdown", "bogus", {})
+
+        assert "Unknown output format bogus" in str(excinfo.value)
+        # Rejections are deterministic, so they are not worth retrying
+        assert excinfo.type is QuackUnrecoverableError
+
+        with pytest.raises(QuackUnrecoverableError) as excinfo:
+            fake_server.convert("# Four", "markdown", "broken", {})
+
+        assert "Could not parse document" in str(excinfo.value)
+
+    def test_get_pandoc_server_unavailable(self):
+        """Test that a failed start is remembered and reported as None."""
+        with patch.object(server.shutil, "which", return_value=None) as mock_which:
+            assert get_pandoc_server() is None
+            assert get_pandoc_server() is None
+            mock_which.assert_called_once_with("pandoc")
+
+        # Shutting down clears the failure so a later call can try again
+        shutdown_pandoc_server()
+        with patch.object(server.shutil, "which", return_value=None) as mock_which:
+            assert get_pandoc_server() is None
+            mock_which.assert_called_once()
+
+    def test_start_exits_early(self):
+        """Test that a pandoc without server support fails to start."""
+        process = MagicMock()
+        process.poll.return_value = 2
+        process.returncode = 2
+
+        with patch.object(server.subprocess, "Popen", return_value=process):
+            with pytest.raises(QuackIntegrationError) as excinfo:
+                PandocServer.start("/usr/bin/pandoc")
+
+        assert "exited during startup" in str(excinfo.value)
+        assert process.poll.call_count == server._START_ATTEMPTS
+
+    def test_start_retries_on_fresh_port(self, fake_server):
+        """Test that losing the port to another process retries startup."""
+        lost_race = MagicMock()
+        lost_race.poll.return_value = 1
+        lost_race.returncode = 1
+        ports = [fake_server.port + 1, fake_server.port]
+
+        with (
+            patch.object(server, "_find_free_port", side_effect=ports),
+            patch.object(
+                server.subprocess,
+                "Popen",
+                side_effect=[lost_race, fake_server.process],
+            ) as mock_popen,
+        ):
+            pandoc_server = PandocServer.start("/usr/bin/pandoc")
+
+        assert pandoc_server.port == fake_server.port
+        assert mock_popen.call_count == 2
+        assert mock_popen.call_args.args[0][-1] == str(fake_server.port)
+        pandoc_server._connection().close()
+
+    def test_markdown_to_docx_uses_server(self, fake_server):
+        """Test that Markdown to DOCX conversion goes through the server."""
+        config = PandocConfig(use_pandoc_server=True)
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+
+        with patch.object(md_to_docx, "fs") as mock_fs, patch.object(
+                md_to_docx, "get_pandoc_server", return_value=fake_server
+        ), patch("pypandoc.convert_file") as mock_pypandoc:
+            mock_fs.create_directory.return_value = OperationResult(
+                success=True, path="/path/to/output"
+            )
+            mock_fs.read_text.return_value = ReadResult(
+                success=True, path=str(markdown_path), content="# Test"
+            )
+            mock_fs.write_binary.return_value = WriteResult(
+                success=True, path=str(output_path), bytes_written=14
+            )
+
+            md_to_docx._convert_markdown_to_docx_once(
+                markdown_path, output_path, config
+            )
+
+            mock_pypandoc.assert_not_called()
+            mock_fs.write_binary.assert_called_once_with(
+                output_path, b"PK docx # Test"
+            )
+
+            # Arguments without a server equivalent fall back to pypandoc
+            config.md_to_docx_extra_args = ["--reference-doc=template.docx"]
+            md_to_docx._convert_markdown_to_docx_once(
+                markdown_path, output_path, config
+            )
+
+            mock_pypandoc.assert_called_once()
+            assert mock_fs.write_binary.call_count == 1
+
+    def test_dead_server_is_discarded(self, fake_server):
+        """Test that a server whose process died is no longer handed out."""
+        server._server = fake_server
+        assert get_pandoc_server() is fake_server
+
+        fake_server.process.poll.return_value = 1
+        assert get_pandoc_server() is None
+        assert get_pandoc_server() is None
+        assert server._server is None
+
+    def test_markdown_to_docx_falls_back_when_server_dies(self):
+        """Test that a conversion hitting a dead server uses pypandoc."""
+        config = PandocConfig(use_pandoc_server=True)
+        markdown_path = Path("/path/to/file.md")
+        output_path = Path("/path/to/output/file.docx")
+        dead_server = MagicMock()
+        dead_server.convert.side_effect = ConnectionRefusedError()
+        dead_server.is_alive.return_value = False
+        server._server = dead_server
+
+        with patch.object(md_to_docx, "fs") as mock_fs, patch.object(
+                md_to_docx, "get_pandoc_server", return_value=dead_server
+        ), patch("pypandoc.convert_file") as mock_pypandoc:
+            mock_fs.create_directory.return_value = OperationResult(
+                success=True, path="/path/to/output"
+            )
+            mock_fs.read_text.return_value = ReadResult(
+                success=True, path=str(markdown_path), content="# Test"
+            )
+
+            md_to_docx._convert_markdown_to_docx_once(
+                markdown_path, output_path, config
+            )
+
+            mock_pypandoc.assert_called_once()
+            mock_fs.write_binary.assert_not_called()
+
+        # The dead server is dropped for later conversions
+        assert server._server is None
+        dead_server.close.assert_called_once()
+
+        # A live server that errors still reports the failure
+        live_server = MagicMock()
+        live_server.convert.side_effect = TimeoutError("timed out")
+        live_server.is_alive.return_value = True
+        with patch.object(md_to_docx, "fs") as mock_fs:
+            mock_fs.read_text.return_value = ReadResult(
+                success=True, path=str(markdown_path), content="# Test"
+            )
+            with pytest.raises(QuackIntegrationError) as excinfo:
+                md_to_docx._convert_with_server(
+                    live_server, markdown_path, output_path, {}
+                )
+
+        assert "timed out" in str(excinfo.value)
+        assert excinfo.type is QuackIntegrationError
+        live_server.close.assert_not_called()
+
+        # A document the server rejects fails without retrying
+        live_server.convert.side_effect = QuackUnrecoverableError("bad document")
+        with patch.object(md_to_docx, "fs") as mock_fs:
+            mock_fs.read_text.return_value = ReadResult(
+                success=True, path=str(markdown_path), content="# Test"
+            )
+            with pytest.raises(QuackUnrecoverableError) as excinfo:
+                md_to_docx._convert_with_server(
+                    live_server, markdown_path, output_path, {}
+                )
+
+        assert "bad document" in str(excinfo.value)
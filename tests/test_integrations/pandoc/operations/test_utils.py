@@ -259,7 +259,7 @@ class TestPandocUtilities:
         path = Path("/path/to/nonexistent.md")
 
         # Mock fs service to return file not found
-        with patch("quackcore.fs.service.get_file_info") as mock_get_info:
+        with patch("quackcore.fs.get_file_info") as mock_get_info:
             file_info_result = FileInfoResult(
                 success=True,
                 path=str(path),
@@ -367,7 +367,7 @@ class TestPandocUtilities:
             metrics={"track_conversion_time": True, "track_file_sizes": True},
         )
 
-        start_time = time.time() - 5  # 5 seconds ago
+        start_time = time.perf_counter() - 5  # 5 seconds ago
         original_size = 1024
         converted_size = 512
 
@@ -484,4 +484,44 @@ class TestPandocUtilities:
             converted_size, original_size, threshold
         )
         assert is_valid is True
-        assert len(errors) == 0
\ No newline at end of file
+        assert len(errors) == 0
+    def test_get_retry_delay(self):
+        """Test exponential backoff with jitter for conversion retries."""
+        config = PandocConfig()
+        config.retry_mechanism.conversion_retry_delay = 0.5
+        config.retry_mechanism.max_retry_delay = 3.0
+        config.retry_mechanism.retry_jitter = 0.0
+
+        # Delay doubles with each failed attempt
+        assert utils.get_retry_delay(config, 1) == 0.5
+        assert utils.get_retry_delay(config, 2) == 1.0
+        assert utils.get_retry_delay(config, 3) == 2.0
+
+        # Delay is capped at the configured maximum
+        assert utils.get_retry_delay(config, 10) == 3.0
+
+        # Jitter only ever lengthens the delay, up to the configured fraction
+        config.retry_mechanism.retry_jitter = 0.5
+        with patch("quackcore.integrations.pandoc.operations.utils.random.uniform",
+                   return_value=0.5) as mock_uniform:
+            assert utils.get_retry_delay(config, 2) == 1.5
+            mock_uniform.assert_called_once_with(0, 0.5)
+
+    def test_is_unrecoverable_pandoc_error(self):
+        """Test classifying pandoc failures as recoverable or not."""
+        # Unknown writer (exit code 22) fails the same way on every attempt
+        assert utils.is_unrecoverable_pandoc_error(
+            RuntimeError('Pandoc died with exitcode "22" during conversion: foo')
+        )
+        assert utils.is_unrecoverable_pandoc_error(
+            RuntimeError("Unknown option --bogus")
+        )
+        assert utils.is_unrecoverable_pandoc_error(
+            OSError("No pandoc was found: either install pandoc or add it to PATH")
+        )
+
+        # I/O errors and unknown failures may go away on retry
+        assert not utils.is_unrecoverable_pandoc_error(
+            RuntimeError('Pandoc died with exitcode "1" during conversion: timeout')
+        )
+        assert not utils.is_unrecoverable_pandoc_error(Exception("Conversion error"))
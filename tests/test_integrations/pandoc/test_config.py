@@ -60,6 +60,7 @@ class TestPandocConfig:
         assert config.min_file_size == 50
         assert config.conversion_ratio_threshold == 0.1
         assert config.check_links is False
+        assert config.always_check_structure is False
 
         # Test custom values
         config = ValidationConfig(
@@ -67,11 +68,13 @@ class TestPandocConfig:
             min_file_size=100,
             conversion_ratio_threshold=0.2,
             check_links=True,
+            always_check_structure=True,
         )
         assert config.verify_structure is False
         assert config.min_file_size == 100
         assert config.conversion_ratio_threshold == 0.2
         assert config.check_links is True
+        assert config.always_check_structure is True
 
     def test_retry_config(self):
         """Test RetryConfig configuration model."""
@@ -79,14 +82,20 @@ class TestPandocConfig:
         config = RetryConfig()
         assert config.max_conversion_retries == 3
         assert config.conversion_retry_delay == 1.0
+        assert config.max_retry_delay == 30.0
+        assert config.retry_jitter == 0.1
 
         # Test custom values
         config = RetryConfig(
             max_conversion_retries=5,
             conversion_retry_delay=2.5,
+            max_retry_delay=10.0,
+            retry_jitter=0.0,
         )
         assert config.max_conversion_retries == 5
         assert config.conversion_retry_delay == 2.5
+        assert config.max_retry_delay == 10.0
+        assert config.retry_jitter == 0.0
 
     def test_metrics_config(self):
         """Test MetricsConfig configuration model."""
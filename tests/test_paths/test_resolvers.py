@@ -3,6 +3,7 @@
 Tests for the PathResolver class.
 """
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -11,6 +12,7 @@ import pytest
 
 from quackcore.errors import QuackFileNotFoundError
 from quackcore.paths.resolver import PathResolver
+from quackcore.paths.utils import find_project_root
 
 
 class TestPathResolver:
@@ -57,6 +59,40 @@ class TestPathResolver:
             with pytest.raises(QuackFileNotFoundError):
                 resolver.get_project_root(tmp_path)
 
+    def test_get_project_root_cache(self, mock_project_structure: Path) -> None:
+        """Test that project root lookups are cached per visited directory."""
+        resolver = PathResolver()
+        module_dir = mock_project_structure / "src" / "test_module"
+
+        root = resolver.get_project_root(module_dir)
+        assert root == mock_project_structure
+        assert resolver._root_cache == {
+            str(module_dir): str(mock_project_structure),
+            str(module_dir.parent): str(mock_project_structure),
+            str(mock_project_structure): str(mock_project_structure),
+        }
+
+        # A sibling only checks itself before reusing its parent's answer
+        sibling = mock_project_structure / "src" / "other_module"
+        sibling.mkdir()
+        with patch(
+            "quackcore.paths.resolver.is_project_root", return_value=False
+        ) as mock_is_root:
+            assert resolver.get_project_root(sibling) == mock_project_structure
+            assert resolver.get_project_root(module_dir) == mock_project_structure
+            mock_is_root.assert_called_once()
+
+        # A cached root too far up for the remaining levels is not reused
+        deep_dir = sibling / "a" / "b" / "c" / "d"
+        deep_dir.mkdir(parents=True)
+        with pytest.raises(QuackFileNotFoundError):
+            resolver.get_project_root(deep_dir)
+
+        # ".." parts are walked the same way as without the cache
+        dotted = module_dir / ".." / ".." / "src"
+        assert resolver.get_project_root(dotted) == find_project_root(dotted)
+        assert resolver.get_project_root(dotted) == module_dir / ".." / ".."
+
     def test_find_source_directory(self, mock_project_structure: Path) -> None:
         """Test finding a source directory."""
         resolver = PathResolver()
@@ -148,6 +184,20 @@ class TestPathResolver:
         assert context2.root_dir == mock_project_structure
         assert id(context) == id(context2)  # Should be the same cached object
 
+        # Any directory inside the project reuses the context of its root
+        module_dir = mock_project_structure / "src" / "test_module"
+        with patch.object(resolver, "_detect_standard_directories") as mock_detect:
+            assert resolver.detect_project_context(module_dir) is context
+            mock_detect.assert_not_called()
+
+        # Invalidating the cache builds a fresh context
+        resolver.invalidate()
+        assert resolver._cache == {}
+        assert resolver._root_cache == {}
+        context3 = resolver.detect_project_context(subdir)
+        assert context3 is not context
+        assert context3.root_dir == mock_project_structure
+
         # Test with non-existent path
         with pytest.raises(QuackFileNotFoundError):
             resolver.detect_project_context("/nonexistent/path")
@@ -160,6 +210,27 @@ class TestPathResolver:
             assert context.root_dir == tmp_path
             assert len(context.directories) == 0
 
+    def test_detect_project_context_single_scan(
+        self, mock_project_structure: Path
+    ) -> None:
+        """Test that building a context lists the project root only once."""
+        resolver = PathResolver()
+        (mock_project_structure / "build").mkdir()
+        (mock_project_structure / "data").touch()  # A file, not a data directory
+
+        # Warm the project root cache so only the context scan is counted
+        resolver.get_project_root(mock_project_structure)
+        with patch(
+            "quackcore.paths.resolver.os.scandir", wraps=os.scandir
+        ) as mock_scandir:
+            context = resolver.detect_project_context(mock_project_structure)
+            mock_scandir.assert_called_once_with(mock_project_structure)
+
+        assert context.directories["src"].path == mock_project_structure / "src"
+        assert context.directories["output"].path == mock_project_structure / "output"
+        assert set(context.directories) == {"src", "output", "tests", "config", "docs"}
+        assert context.config_file == mock_project_structure / "config" / "default.yaml"
+
     def test_detect_content_context(self, mock_project_structure: Path) -> None:
         """Test detecting content context from a directory."""
         resolver = PathResolver()
@@ -230,6 +301,14 @@ class TestPathResolver:
                 result = resolver.infer_current_content()
                 assert result == {}
 
+        # Directories inside a content type are matched without a full detection
+        with patch("os.getcwd", return_value=str(example_dir / "drafts")):
+            with patch.object(resolver, "detect_content_context") as mock_detect:
+                (example_dir / "drafts").mkdir()
+                result = resolver.infer_current_content()
+                assert result == {"type": "tutorials", "name": "example"}
+                mock_detect.assert_not_called()
+
     def test_helper_methods(self, mock_project_structure: Path) -> None:
         """Test helper methods of the PathResolver."""
         resolver = PathResolver()
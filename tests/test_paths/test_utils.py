@@ -11,10 +11,13 @@ import pytest
 
 from quackcore.errors import QuackFileNotFoundError
 from quackcore.paths.utils import (
+    DEFAULT_MARKER_DIRS,
+    DEFAULT_MARKER_FILES,
     find_nearest_directory,
     find_project_root,
     get_extension,
     infer_module_from_path,
+    is_project_root,
     join_path,
     normalize_path,
     resolve_relative_to_project,
@@ -56,6 +59,53 @@ class TestPathUtils:
             with pytest.raises(QuackFileNotFoundError):
                 find_project_root(tmp_path)
 
+    def test_is_project_root(self, tmp_path: Path) -> None:
+        """Test checking a directory for project root markers."""
+        markers = ["pyproject.toml", ".git"]
+        marker_dirs = ["src", "tests"]
+
+        assert not is_project_root(tmp_path, markers, marker_dirs)
+
+        # A single marker directory is not enough
+        (tmp_path / "src").mkdir()
+        assert not is_project_root(tmp_path, markers, marker_dirs)
+
+        # A file named like a marker directory doesn't count
+        (tmp_path / "tests").touch()
+        assert not is_project_root(tmp_path, markers, marker_dirs)
+
+        (tmp_path / "tests").unlink()
+        (tmp_path / "tests").mkdir()
+        assert is_project_root(tmp_path, markers, marker_dirs)
+
+        # Marker files may be files or directories
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / ".git").mkdir()
+        assert is_project_root(str(other), markers, marker_dirs)
+
+        # Frozen marker sets behave the same as lists
+        assert is_project_root(tmp_path, frozenset(markers), frozenset(marker_dirs))
+        assert is_project_root(other, DEFAULT_MARKER_FILES, DEFAULT_MARKER_DIRS)
+
+        # Missing directories and files are never project roots
+        assert not is_project_root(tmp_path / "missing", markers, marker_dirs)
+        assert not is_project_root(other / ".git" / "HEAD", markers, marker_dirs)
+
+    def test_is_project_root_case(self, tmp_path: Path) -> None:
+        """Test that marker case only matters on case-sensitive platforms."""
+        (tmp_path / "PyProject.toml").touch()
+        (tmp_path / "Src").mkdir()
+        (tmp_path / "TESTS").mkdir()
+
+        with patch("quackcore.paths.utils._CASE_INSENSITIVE_FS", False):
+            assert not is_project_root(tmp_path, ["pyproject.toml"], [])
+            assert not is_project_root(tmp_path, [], ["src", "tests"])
+
+        with patch("quackcore.paths.utils._CASE_INSENSITIVE_FS", True):
+            assert is_project_root(tmp_path, ["pyproject.toml"], [])
+            assert is_project_root(tmp_path, [], ["src", "tests"])
+
     def test_find_nearest_directory(self, mock_project_structure: Path) -> None:
         """Test finding the nearest directory with a given name."""
         # Create a nested directory structure